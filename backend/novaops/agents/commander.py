@@ -0,0 +1,124 @@
+"""Commander agent served by the NovaOps API, one instance per session."""
+
+import asyncio
+import time
+
+from strands import Agent
+from strands.agent.conversation_manager import SlidingWindowConversationManager
+from strands.models.model import Model
+
+from novaops.models import AgentResponse, AgentRole
+
+COMMANDER_SYSTEM_PROMPT = """\
+You are the NovaOps Commander, the central orchestrator of a multi-agent DevOps command center.
+
+You help operators monitor infrastructure, investigate and manage incidents, review deployments
+and assess security findings. Answer concisely and in a structured way, flag anything degraded
+or critical first, and end with concrete recommendations when there are issues.
+
+Delegate to your specialists and combine their answers: monitor_agent (health, uptime),
+incident_agent (incident triage), deploy_agent (deployments, rollbacks), security_agent
+(security findings) and performance_agent (latency, throughput). Call independent
+specialists in the same turn; they run concurrently.
+"""
+
+# Seconds a timed-out invocation gets to stop at its next cancellation point
+# before it is cancelled outright.
+_CANCEL_GRACE = 5.0
+
+
+class AgentTimeout(Exception):
+    """Raised when an invocation runs longer than the configured ``agent_timeout``."""
+
+
+class CommanderAgent:
+    """A Commander conversation: a Strands agent plus its turn limit.
+
+    Each instance keeps its own conversation history, so the API gives every
+    session its own instance. The history is a sliding window of the last
+    ``max_history`` messages, so a long-lived session's prompts stay bounded.
+    The model, and with it the Bedrock client, is shared between instances.
+
+    Args:
+        model: Model the agent runs on.
+        max_turns: Maximum model turns per command (``max_agent_turns``).
+        tools: Tools (e.g. sub-agents) available to the Commander.
+        max_history: Messages of history kept (``max_history_messages``).
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        max_turns: int = 10,
+        tools: list | None = None,
+        max_history: int = 40,
+    ):
+        self.max_turns = max_turns
+        self.agent = Agent(
+            name="commander",
+            model=model,
+            callback_handler=None,
+            conversation_manager=SlidingWindowConversationManager(window_size=max_history),
+            system_prompt=COMMANDER_SYSTEM_PROMPT,
+            tools=tools or [],
+        )
+
+    async def invoke(self, message: str, timeout: float | None = None) -> AgentResponse:
+        """Run one command and return the Commander's response.
+
+        Args:
+            message: The operator's command.
+            timeout: Seconds before the invocation is cancelled.
+
+        Raises:
+            AgentTimeout: If the agent did not finish within ``timeout``.
+        """
+        started = time.perf_counter()
+        history = len(self.agent.messages)
+        task = asyncio.ensure_future(
+            self.agent.invoke_async(message, limits={"turns": self.max_turns})
+        )
+        try:
+            result = await asyncio.wait_for(asyncio.shield(task), timeout)
+        except TimeoutError:
+            # Stop at the next cancellation-safe point so the history stays reusable.
+            self.agent.cancel()
+            try:
+                await asyncio.wait_for(task, _CANCEL_GRACE)
+            except TimeoutError:
+                del self.agent.messages[history:]
+            raise AgentTimeout(f"Agent did not respond within {timeout:g}s") from None
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+
+        invoked = [
+            block["toolUse"]["name"]
+            for msg in self.agent.messages[history:]
+            for block in msg.get("content", [])
+            if "toolUse" in block
+        ]
+        usage = result.metrics.latest_agent_invocation.usage
+        return AgentResponse(
+            message=str(result).strip(),
+            agent_used=AgentRole.COMMANDER,
+            sub_agents_invoked=_roles(invoked),
+            actions_taken=invoked,
+            metadata={
+                "stop_reason": result.stop_reason,
+                "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+                "input_tokens": usage.get("inputTokens", 0),
+                "output_tokens": usage.get("outputTokens", 0),
+            },
+        )
+
+
+def _roles(tool_names: list[str]) -> list[AgentRole]:
+    """Map sub-agent tool names (e.g. ``monitor_agent``) to their roles, in first-use order."""
+    roles: dict[AgentRole, None] = {}
+    for name in tool_names:
+        try:
+            roles[AgentRole(name.removesuffix("_agent"))] = None
+        except ValueError:
+            continue
+    return list(roles)
@@ -0,0 +1,42 @@
+"""Builds the models and Commander agents used by the API."""
+
+import os
+
+from strands.models.model import Model
+
+from novaops.agents.commander import CommanderAgent
+from novaops.agents.specialists import create_sub_agent_tools
+from novaops.config import NovaOpsConfig, config
+
+
+def create_model(cfg: NovaOpsConfig = config) -> Model:
+    """Create the model every session's Commander runs on.
+
+    Returns the offline :class:`~novaops.agents.stub.StubModel` when
+    ``NOVAOPS_MODEL=stub``, else Nova Pro on Bedrock. Build it once and share
+    it: the Bedrock client it holds pools its connections.
+    """
+    if os.getenv("NOVAOPS_MODEL", "bedrock").lower() == "stub":
+        from novaops.agents.stub import StubModel
+
+        return StubModel(latency=float(os.getenv("NOVAOPS_STUB_LATENCY", "0")))
+
+    from strands.models.bedrock import BedrockModel
+
+    return BedrockModel(model_id=cfg.bedrock_model_id, region_name=cfg.aws_region)
+
+
+def create_agent_system(cfg: NovaOpsConfig = config, model: Model | None = None) -> CommanderAgent:
+    """Create a Commander conversation with the specialist sub-agents as its tools.
+
+    Args:
+        cfg: Configuration to read ``max_agent_turns`` and the model settings from.
+        model: Model to run on; a new one from :func:`create_model` if omitted.
+    """
+    model = model or create_model(cfg)
+    return CommanderAgent(
+        model,
+        max_turns=cfg.max_agent_turns,
+        tools=create_sub_agent_tools(model),
+        max_history=cfg.max_history_messages,
+    )
@@ -0,0 +1,68 @@
+"""Specialist sub-agents the API Commander delegates to, exposed as tools."""
+
+from strands import Agent, tool
+from strands.models.model import Model
+
+from novaops.models import AgentRole
+
+SPECIALIST_PROMPTS: dict[AgentRole, str] = {
+    AgentRole.MONITOR: """\
+You are the Monitor Agent of the NovaOps command center. You report on service health,
+uptime, error rates and resource usage. Flag degraded or down services first.
+""",
+    AgentRole.INCIDENT: """\
+You are the Incident Agent of the NovaOps command center. You triage incidents: summarise
+impact, likely cause and status, and recommend the next response steps.
+""",
+    AgentRole.DEPLOY: """\
+You are the Deploy Agent of the NovaOps command center. You review deployments and their
+rollout status, and advise on whether to proceed, pause or roll back.
+""",
+    AgentRole.SECURITY: """\
+You are the Security Agent of the NovaOps command center. You assess security findings,
+rank them by severity and exposure, and recommend remediation.
+""",
+    AgentRole.PERFORMANCE: """\
+You are the Performance Agent of the NovaOps command center. You analyse latency, throughput
+and saturation, and point out regressions and their likely causes.
+""",
+}
+
+_DESCRIPTIONS: dict[AgentRole, str] = {
+    AgentRole.MONITOR: "Ask the Monitor Agent about service health, uptime and resource usage.",
+    AgentRole.INCIDENT: "Ask the Incident Agent to triage or summarise incidents.",
+    AgentRole.DEPLOY: "Ask the Deploy Agent about deployments, rollouts and rollbacks.",
+    AgentRole.SECURITY: "Ask the Security Agent to assess security findings.",
+    AgentRole.PERFORMANCE: "Ask the Performance Agent about latency, throughput and regressions.",
+}
+
+
+def create_sub_agent_tools(model: Model) -> list:
+    """Return one tool per specialist (``monitor_agent``, ``incident_agent``, ...).
+
+    Every call builds a fresh specialist on ``model``. An Agent serves one
+    invocation at a time, so a shared specialist would refuse concurrent
+    calls from one Commander turn or from other sessions.
+    """
+    return [_specialist_tool(role, model) for role in SPECIALIST_PROMPTS]
+
+
+def _specialist_tool(role: AgentRole, model: Model):
+    name = f"{role.value}_agent"
+
+    async def ask(query: str) -> str:
+        """Delegate a request to a specialist agent.
+
+        Args:
+            query: The request for the specialist, in natural language.
+        """
+        agent = Agent(
+            name=name,
+            model=model,
+            callback_handler=None,
+            system_prompt=SPECIALIST_PROMPTS[role],
+        )
+        result = await agent.invoke_async(query)
+        return str(result).strip()
+
+    return tool(name=name, description=_DESCRIPTIONS[role])(ask)
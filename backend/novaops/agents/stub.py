@@ -0,0 +1,137 @@
+"""Offline stand-in for Amazon Nova, for demos and load tests of the API.
+
+:class:`StubModel` streams a canned answer with a configurable delay, so the
+server, session pool and timeouts can be exercised without AWS credentials.
+Like a real model, it delegates to the specialist sub-agents whose keywords
+appear in the command before answering. Select it with
+``NOVAOPS_MODEL=stub``; ``NOVAOPS_STUB_LATENCY`` sets the simulated model
+latency in seconds.
+"""
+
+import asyncio
+import itertools
+import json
+from collections.abc import AsyncIterable
+from typing import Any
+
+from strands.models.model import Model
+
+# Words in a command that make the stub call each specialist tool.
+_TOOL_KEYWORDS = {
+    "monitor_agent": ("health", "status", "uptime"),
+    "incident_agent": ("incident", "outage"),
+    "deploy_agent": ("deploy", "rollback", "release"),
+    "security_agent": ("security", "vulnerab", "cve"),
+    "performance_agent": ("latency", "slow", "performance", "throughput"),
+}
+
+_tool_ids = itertools.count(1)
+
+
+def _text(message: dict) -> str:
+    return " ".join(block["text"] for block in message.get("content", []) if "text" in block)
+
+
+def _tool_results(message: dict) -> list[str]:
+    return [
+        content["text"]
+        for block in message.get("content", [])
+        if "toolResult" in block
+        for content in block["toolResult"]["content"]
+        if "text" in content
+    ]
+
+
+def _structured(output_model, text: str):
+    """Validate a JSON reply as ``output_model``; other text fills its required string fields."""
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        data = {
+            name: text
+            for name, field in output_model.model_fields.items()
+            if field.is_required() and field.annotation is str
+        }
+    return output_model.model_validate(data)
+
+
+class StubModel(Model):
+    """Model that answers every prompt with an acknowledgement after ``latency`` seconds.
+
+    When the agent has specialist tools and the command mentions their
+    keywords, the first reply calls them instead, and the answer that follows
+    includes their results.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.config = {"model_id": "stub", "latency": latency}
+
+    def update_config(self, **model_config: Any) -> None:
+        self.config.update(model_config)
+
+    def get_config(self) -> dict:
+        return self.config
+
+    async def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        """Build ``output_model`` from the acknowledgement :meth:`stream` would answer with.
+
+        A reply that is a JSON object is validated as is; any other reply
+        fills every required string field of the model.
+
+        Raises:
+            pydantic.ValidationError: The reply does not fit ``output_model``,
+                e.g. the model has required fields that are not strings.
+        """
+        await asyncio.sleep(self.config["latency"])
+        last = prompt[-1] if prompt else {"content": []}
+        text = next((_text(m) for m in reversed(prompt) if _text(m)), "")
+        reply = f"Acknowledged: {text}" + "".join(f"\n- {r}" for r in _tool_results(last))
+        yield {"output": _structured(output_model, reply)}
+
+    async def stream(
+        self,
+        messages,
+        tool_specs=None,
+        system_prompt=None,
+        **kwargs: Any,
+    ) -> AsyncIterable[dict]:
+        await asyncio.sleep(self.config["latency"])
+        last = messages[-1] if messages else {"content": []}
+        results = _tool_results(last)
+        prompt = next((_text(m) for m in reversed(messages) if _text(m)), "")
+        lowered = prompt.lower()
+        calls = [] if results else [
+            spec["name"]
+            for spec in tool_specs or []
+            if any(word in lowered for word in _TOOL_KEYWORDS.get(spec["name"], ()))
+        ]
+        yield {"messageStart": {"role": "assistant"}}
+        if calls:
+            for name in calls:
+                tool_use = {"toolUseId": f"stub-{next(_tool_ids)}", "name": name}
+                yield {"contentBlockStart": {"start": {"toolUse": tool_use}}}
+                arguments = json.dumps({"query": prompt})
+                yield {"contentBlockDelta": {"delta": {"toolUse": {"input": arguments}}}}
+                yield {"contentBlockStop": {}}
+            text = ""
+            stop_reason = "tool_use"
+        else:
+            text = f"Acknowledged: {prompt}" + "".join(f"\n- {r}" for r in results)
+            yield {"contentBlockDelta": {"delta": {"text": text}}}
+            yield {"contentBlockStop": {}}
+            stop_reason = "end_turn"
+        yield {"messageStop": {"stopReason": stop_reason}}
+        input_tokens = sum(len(json.dumps(m, default=str)) for m in messages) // 4
+        output_tokens = len(text.split()) + 10 * len(calls)
+        yield {
+            "metadata": {
+                "usage": {
+                    "inputTokens": input_tokens,
+                    "outputTokens": output_tokens,
+                    "totalTokens": input_tokens + output_tokens,
+                },
+                "metrics": {"latencyMs": int(self.config["latency"] * 1000)},
+            }
+        }
@@ -36,6 +36,22 @@ class NovaOpsConfig:
     # Agent settings
     max_agent_turns: int = 10
     agent_timeout: int = 120
+    # Messages of history each session's Commander keeps (older ones are dropped)
+    max_history_messages: int = field(
+        default_factory=lambda: int(os.getenv("MAX_HISTORY_MESSAGES", "40"))
+    )
+
+    # Session pool settings
+    max_sessions: int = field(default_factory=lambda: int(os.getenv("MAX_SESSIONS", "1000")))
+    session_idle_timeout: int = field(
+        default_factory=lambda: int(os.getenv("SESSION_IDLE_TIMEOUT", "1800"))
+    )
+    max_concurrent_agents: int = field(
+        default_factory=lambda: int(os.getenv("MAX_CONCURRENT_AGENTS", "32"))
+    )
+    max_pending_requests: int = field(
+        default_factory=lambda: int(os.getenv("MAX_PENDING_REQUESTS", "128"))
+    )
 
     # Demo mode (uses mock data instead of real AWS calls)
     demo_mode: bool = field(
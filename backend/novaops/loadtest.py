@@ -0,0 +1,97 @@
+"""Load test for the API: many concurrent sessions sending commands.
+
+By default the server runs in-process on the offline stub model, so no AWS
+access or running server is needed:
+
+    NOVAOPS_STUB_LATENCY=0.2 python -m novaops.loadtest --sessions 200 --commands 5
+
+Pass ``--url`` to load a running server instead. The report gives the
+throughput, latency percentiles of successful commands, and how many were
+refused (503, back-pressure) or timed out (504).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+import uuid
+
+import httpx
+
+
+async def _session(client: httpx.AsyncClient, commands: int, results: list) -> None:
+    session_id = str(uuid.uuid4())
+    for i in range(commands):
+        started = time.perf_counter()
+        try:
+            response = await client.post(
+                "/api/command", json={"message": f"status check {i}", "session_id": session_id}
+            )
+            status = response.status_code
+        except httpx.HTTPError:
+            status = 0
+        results.append((status, time.perf_counter() - started))
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * q))] * 1000, 1)
+
+
+async def run_load(client: httpx.AsyncClient, sessions: int = 100, commands: int = 5) -> dict:
+    """Drive ``sessions`` concurrent sessions of ``commands`` sequential commands each.
+
+    Returns:
+        Counts by outcome, throughput and latency percentiles in milliseconds.
+    """
+    results: list[tuple[int, float]] = []
+    started = time.perf_counter()
+    await asyncio.gather(*(_session(client, commands, results) for _ in range(sessions)))
+    elapsed = time.perf_counter() - started
+    ok = sorted(latency for status, latency in results if status == 200)
+    return {
+        "requests": len(results),
+        "ok": len(ok),
+        "rejected": sum(1 for status, _ in results if status == 503),
+        "timed_out": sum(1 for status, _ in results if status == 504),
+        "errors": sum(1 for status, _ in results if status not in (200, 503, 504)),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(ok) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(statistics.median(ok) * 1000, 1) if ok else 0.0,
+        "p95_ms": _percentile(ok, 0.95),
+        "p99_ms": _percentile(ok, 0.99),
+    }
+
+
+async def _main(args: argparse.Namespace) -> dict:
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=None) as client:
+            return await run_load(client, args.sessions, args.commands)
+
+    os.environ.setdefault("NOVAOPS_MODEL", "stub")
+    from novaops.config import config
+    from novaops.server import create_app, create_pool
+
+    app = create_app(config, pool=create_pool(config))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://novaops", timeout=None
+    ) as client:
+        report = await run_load(client, args.sessions, args.commands)
+    report["pool"] = app.state.pool.stats()
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Base URL of a running server (default: in-process)")
+    parser.add_argument("--sessions", type=int, default=100, help="Concurrent sessions")
+    parser.add_argument("--commands", type=int, default=5, help="Commands per session")
+    print(json.dumps(asyncio.run(_main(parser.parse_args(argv))), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
@@ -77,12 +77,60 @@ class Metric(BaseModel):
 
 
 class MetricSeries(BaseModel):
-    """A series of metric data points."""
+    """A series of metric samples, stored column-wise.
+
+    ``timestamps`` are epoch seconds. For raw samples (``resolution_s == 0``)
+    ``values`` holds each sample. For rollups ``values`` holds the bucket
+    averages and ``min``/``max``/``p95`` the other bucket aggregates.
+    """
     name: str
     service: str
-    data_points: list[Metric] = []
+    unit: str = ""
+    resolution_s: int = 0
+    timestamps: list[float] = []
+    values: list[float] = []
+    min: list[float] | None = None
+    max: list[float] | None = None
+    p95: list[float] | None = None
     trend: str = "stable"  # rising, falling, stable, volatile
 
+    @property
+    def data_points(self) -> list[Metric]:
+        """The series as per-point ``Metric`` objects (built on demand)."""
+        return [
+            Metric(
+                name=self.name,
+                value=v,
+                unit=self.unit,
+                timestamp=datetime.fromtimestamp(t, timezone.utc),
+                tags={"service": self.service},
+            )
+            for t, v in zip(self.timestamps, self.values)
+        ]
+
+    @classmethod
+    def from_query(
+        cls, name: str, service: str, query: dict, unit: str = "", trend: str = "stable"
+    ) -> "MetricSeries":
+        """Build a series from a ``MetricStore.query`` result and ``MetricStore.trend`` label."""
+        resolution = query.get("resolution", 0)
+        return cls(
+            name=name,
+            service=service,
+            unit=unit,
+            resolution_s=resolution,
+            timestamps=query["timestamp"],
+            values=query["avg"] if resolution else query["value"],
+            min=query.get("min"),
+            max=query.get("max"),
+            p95=query.get("p95"),
+            trend=_TREND_LABELS.get(trend, trend),
+        )
+
+
+# MetricStore.trend labels -> MetricSeries.trend labels
+_TREND_LABELS = {"increasing": "rising", "decreasing": "falling"}
+
 
 # --- Incident Models ---
 
@@ -0,0 +1,119 @@
+"""Async HTTP API for the NovaOps Commander.
+
+Commands are served through a :class:`~novaops.sessions.SessionPool`: each
+``session_id`` gets its own Commander conversation, at most
+``max_concurrent_agents`` commands run at once, and once
+``max_pending_requests`` are waiting new ones get ``503`` with a
+``Retry-After`` header instead of piling up. A command that runs past
+``agent_timeout`` gets ``504``.
+
+Run it with ``python -m novaops.server`` (or ``uvicorn novaops.server:app``).
+With ``NOVAOPS_MODEL=stub`` it runs offline against a stub model, for load
+tests with :mod:`novaops.loadtest`.
+"""
+
+import functools
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from novaops import __version__
+from novaops.agents.commander import AgentTimeout
+from novaops.agents.factory import create_agent_system, create_model
+from novaops.config import NovaOpsConfig, config
+from novaops.models import AgentMessage, CommandRequest, CommandResponse
+from novaops.sessions import Overloaded, SessionPool
+
+
+def create_pool(cfg: NovaOpsConfig = config) -> SessionPool:
+    """Build the session pool, with every session's Commander sharing one model."""
+    model = create_model(cfg)
+    return SessionPool(
+        functools.partial(create_agent_system, cfg, model),
+        max_sessions=cfg.max_sessions,
+        max_concurrent=cfg.max_concurrent_agents,
+        max_pending=cfg.max_pending_requests,
+        timeout=cfg.agent_timeout,
+        idle_timeout=cfg.session_idle_timeout,
+    )
+
+
+def create_app(cfg: NovaOpsConfig = config, pool: SessionPool | None = None) -> FastAPI:
+    """Build the API application.
+
+    Args:
+        cfg: Server, agent and pool settings.
+        pool: Session pool to serve commands from; built from ``cfg`` if omitted.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Built on startup, so importing this module does not create a Bedrock client.
+        if app.state.pool is None:
+            app.state.pool = create_pool(cfg)
+        yield
+
+    app = FastAPI(title="NovaOps", version=__version__, lifespan=lifespan)
+    app.state.pool = pool
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=cfg.cors_origins,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    @app.exception_handler(Overloaded)
+    async def overloaded(request, exc: Overloaded):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
+    @app.exception_handler(AgentTimeout)
+    async def timed_out(request, exc: AgentTimeout):
+        return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+    @app.get("/api/health")
+    async def health() -> dict:
+        return {"status": "ok", "version": __version__}
+
+    @app.post("/api/command", response_model=CommandResponse)
+    async def command(request: CommandRequest) -> CommandResponse:
+        response, conversation = await app.state.pool.run(request.session_id, request.message)
+        return CommandResponse(
+            session_id=request.session_id, response=response, conversation=conversation
+        )
+
+    @app.get("/api/sessions/{session_id}", response_model=list[AgentMessage])
+    async def conversation(session_id: str) -> list[AgentMessage]:
+        session = app.state.pool.get(session_id)
+        if session is None:
+            raise HTTPException(status_code=404, detail=f"No session '{session_id}'")
+        return session.conversation
+
+    @app.delete("/api/sessions/{session_id}", status_code=204)
+    async def close_session(session_id: str) -> None:
+        if not app.state.pool.close(session_id):
+            raise HTTPException(status_code=404, detail=f"No session '{session_id}'")
+
+    @app.get("/api/stats")
+    async def stats() -> dict:
+        return app.state.pool.stats()
+
+    return app
+
+
+app = create_app()
+
+
+def main() -> None:
+    import uvicorn
+
+    uvicorn.run(app, host=config.host, port=config.port)
+
+
+if __name__ == "__main__":
+    main()
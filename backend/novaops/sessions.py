@@ -0,0 +1,161 @@
+"""Per-session agent pool with bounded concurrency and back-pressure."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from novaops.agents.commander import AgentTimeout, CommanderAgent
+from novaops.models import AgentMessage, AgentResponse, AgentRole
+
+
+class Overloaded(Exception):
+    """Raised when too many commands are already waiting for an agent slot.
+
+    Attributes:
+        retry_after: Suggested seconds before the client retries.
+    """
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__("Too many pending commands, retry later")
+        self.retry_after = retry_after
+
+
+@dataclass
+class Session:
+    """One conversation: its Commander and its message log."""
+
+    session_id: str
+    agent: CommanderAgent
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    conversation: list[AgentMessage] = field(default_factory=list)
+    last_used: float = field(default_factory=time.monotonic)
+    active: int = 0
+
+
+class SessionPool:
+    """Serves commands through one Commander per session.
+
+    A session's commands run one at a time, in arrival order, because they
+    share a conversation. Across sessions at most ``max_concurrent`` commands
+    run at once. Commands waiting for their turn count as pending; when
+    ``max_pending`` are already waiting, new commands are refused with
+    :class:`Overloaded` rather than queued without bound. Idle sessions are
+    dropped after ``idle_timeout`` seconds, and the least recently used idle
+    session is dropped when there are more than ``max_sessions``.
+
+    Args:
+        factory: Creates the Commander for a new session.
+        max_sessions: Maximum number of live sessions.
+        max_concurrent: Maximum number of commands running at once.
+        max_pending: Maximum number of commands waiting to run.
+        timeout: Seconds a command may run (``agent_timeout``).
+        idle_timeout: Seconds after its last command a session is kept.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], CommanderAgent],
+        max_sessions: int = 1000,
+        max_concurrent: int = 32,
+        max_pending: int = 128,
+        timeout: float | None = 120.0,
+        idle_timeout: float = 1800.0,
+    ):
+        self.factory = factory
+        self.max_sessions = max_sessions
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self.max_concurrent = max_concurrent
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, session_id: str) -> Session | None:
+        """Return a live session, or None."""
+        return self._sessions.get(session_id)
+
+    def close(self, session_id: str) -> bool:
+        """Drop a session and its conversation; returns False if it did not exist."""
+        return self._sessions.pop(session_id, None) is not None
+
+    def _session(self, session_id: str) -> Session:
+        session = self._sessions.get(session_id)
+        if session is None:
+            self._evict()
+            session = self._sessions[session_id] = Session(session_id, self.factory())
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def _evict(self) -> None:
+        cutoff = time.monotonic() - self.idle_timeout
+        for session_id, session in list(self._sessions.items()):
+            over_capacity = len(self._sessions) >= self.max_sessions
+            if not over_capacity and session.last_used >= cutoff:
+                break
+            if not session.active:
+                del self._sessions[session_id]
+
+    async def run(self, session_id: str, message: str) -> tuple[AgentResponse, list[AgentMessage]]:
+        """Run a command in its session.
+
+        Returns:
+            The Commander's response and the session's conversation so far.
+
+        Raises:
+            Overloaded: If ``max_pending`` commands are already waiting.
+            AgentTimeout: If the command ran longer than ``timeout``.
+        """
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise Overloaded(retry_after=max(1, round(self.pending / self.max_concurrent)))
+        session = self._session(session_id)
+        session.active += 1
+        self.pending += 1
+        waiting = True
+        try:
+            async with session.lock, self._slots:
+                self.pending -= 1
+                waiting = False
+                self.running += 1
+                try:
+                    session.conversation.append(AgentMessage(role="user", content=message))
+                    response = await session.agent.invoke(message, timeout=self.timeout)
+                finally:
+                    self.running -= 1
+                reply = AgentMessage(
+                    role="assistant", content=response.message, agent=AgentRole.COMMANDER
+                )
+                session.conversation.append(reply)
+                self.completed += 1
+                return response, list(session.conversation)
+        except AgentTimeout:
+            self.timeouts += 1
+            raise
+        finally:
+            if waiting:
+                self.pending -= 1
+            session.active -= 1
+            session.last_used = time.monotonic()
+
+    def stats(self) -> dict:
+        """Return pool occupancy and outcome counters."""
+        return {
+            "sessions": len(self._sessions),
+            "running": self.running,
+            "pending": self.pending,
+            "max_concurrent": self.max_concurrent,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+        }
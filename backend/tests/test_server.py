@@ -0,0 +1,74 @@
+"""Tests for the HTTP API."""
+
+import asyncio
+
+import httpx
+import pytest
+
+pytest.importorskip("fastapi")
+
+from novaops.config import NovaOpsConfig  # noqa: E402
+from novaops.server import create_app, create_pool  # noqa: E402
+
+
+def _client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://novaops")
+
+
+@pytest.fixture
+def cfg(monkeypatch) -> NovaOpsConfig:
+    monkeypatch.setenv("NOVAOPS_MODEL", "stub")
+    return NovaOpsConfig()
+
+
+class TestServer:
+    """Tests for the command and session endpoints."""
+
+    def test_command_and_session_lifecycle(self, cfg):
+        app = create_app(cfg, pool=create_pool(cfg))
+
+        async def run():
+            async with _client(app) as client:
+                command = {"message": "deploy status", "session_id": "s1"}
+                response = await client.post("/api/command", json=command)
+                assert response.status_code == 200
+                body = response.json()
+                assert body["response"]["sub_agents_invoked"] == ["monitor", "deploy"]
+                assert len(body["conversation"]) == 2
+
+                assert len((await client.get("/api/sessions/s1")).json()) == 2
+                assert (await client.delete("/api/sessions/s1")).status_code == 204
+                assert (await client.get("/api/sessions/s1")).status_code == 404
+                return (await client.get("/api/stats")).json()
+
+        stats = asyncio.run(run())
+        assert stats["completed"] == 1 and stats["sessions"] == 0
+
+    def test_overload_returns_503_with_retry_after(self, cfg, monkeypatch):
+        monkeypatch.setenv("NOVAOPS_STUB_LATENCY", "0.1")
+        cfg.max_concurrent_agents = cfg.max_pending_requests = 1
+        app = create_app(cfg, pool=create_pool(cfg))
+
+        async def run():
+            async with _client(app) as client:
+                return await asyncio.gather(
+                    *(
+                        client.post("/api/command", json={"message": "hi", "session_id": f"s{i}"})
+                        for i in range(3)
+                    )
+                )
+
+        responses = sorted(asyncio.run(run()), key=lambda r: r.status_code)
+        assert [r.status_code for r in responses] == [200, 200, 503]
+        assert int(responses[-1].headers["Retry-After"]) >= 1
+
+    def test_timeout_returns_504(self, cfg, monkeypatch):
+        monkeypatch.setenv("NOVAOPS_STUB_LATENCY", "0.5")
+        cfg.agent_timeout = 0.05
+        app = create_app(cfg, pool=create_pool(cfg))
+
+        async def run():
+            async with _client(app) as client:
+                return await client.post("/api/command", json={"message": "hi", "session_id": "s"})
+
+        assert asyncio.run(run()).status_code == 504
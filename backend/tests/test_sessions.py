@@ -0,0 +1,106 @@
+"""Tests for the session pool and the API Commander."""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from novaops.agents.commander import AgentTimeout
+from novaops.agents.factory import create_agent_system
+from novaops.agents.stub import StubModel
+from novaops.config import NovaOpsConfig
+from novaops.models import AgentRole
+from novaops.sessions import Overloaded, SessionPool
+
+
+def _pool(latency: float = 0.0, **kwargs) -> SessionPool:
+    model = StubModel(latency=latency)
+    return SessionPool(lambda: create_agent_system(NovaOpsConfig(), model), **kwargs)
+
+
+class TestCommanderAgent:
+    """Tests for the Commander built by create_agent_system."""
+
+    def test_commander_delegates_to_specialists(self):
+        commander = create_agent_system(NovaOpsConfig(), StubModel())
+        response = asyncio.run(commander.invoke("Check API status and p99 latency"))
+        assert response.sub_agents_invoked == [AgentRole.MONITOR, AgentRole.PERFORMANCE]
+        assert response.actions_taken == ["monitor_agent", "performance_agent"]
+        assert response.message.startswith("Acknowledged: Check API status")
+
+    def test_stub_answers_structured_output_requests(self):
+        class Reply(BaseModel):
+            message: str
+
+        async def collect():
+            messages = [{"role": "user", "content": [{"text": "status?"}]}]
+            return [e async for e in StubModel().structured_output(Reply, messages)][-1]["output"]
+
+        assert asyncio.run(collect()) == Reply(message="Acknowledged: status?")
+
+    def test_history_is_bounded(self):
+        cfg = NovaOpsConfig(max_history_messages=6)
+        commander = create_agent_system(cfg, StubModel())
+
+        async def converse():
+            for i in range(10):
+                await commander.invoke(f"hello {i}")
+
+        asyncio.run(converse())
+        assert len(commander.agent.messages) <= 6
+
+
+class TestSessionPool:
+    """Tests for timeouts, back-pressure and eviction."""
+
+    def test_sessions_keep_separate_conversations(self):
+        pool = _pool()
+
+        async def run():
+            await pool.run("a", "hello")
+            await pool.run("b", "hi")
+            return await pool.run("a", "again")
+
+        _, conversation = asyncio.run(run())
+        assert [m.content for m in conversation if m.role == "user"] == ["hello", "again"]
+        assert pool.stats()["completed"] == 3
+
+    def test_slow_commands_time_out(self):
+        pool = _pool(latency=0.5, timeout=0.05)
+        with pytest.raises(AgentTimeout):
+            asyncio.run(pool.run("a", "hello"))
+        stats = pool.stats()
+        assert stats["timeouts"] == 1 and stats["running"] == 0 and stats["pending"] == 0
+
+    def test_commands_beyond_max_pending_are_refused(self):
+        pool = _pool(latency=0.1, max_concurrent=1, max_pending=1)
+
+        async def burst():
+            return await asyncio.gather(
+                *(pool.run(f"s{i}", "hello") for i in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(burst())
+        assert [type(r) for r in results][:2] == [tuple, tuple]
+        assert isinstance(results[2], Overloaded) and results[2].retry_after >= 1
+        assert pool.stats()["rejected"] == 1 and pool.stats()["completed"] == 2
+
+    def test_idle_sessions_are_evicted(self):
+        pool = _pool(idle_timeout=0)
+
+        async def run():
+            await pool.run("a", "hello")
+            await pool.run("b", "hello")
+
+        asyncio.run(run())
+        assert pool.get("a") is None and pool.get("b") is not None
+
+    def test_least_recently_used_session_is_evicted_at_capacity(self):
+        pool = _pool(max_sessions=2)
+
+        async def run():
+            for session_id in ("a", "b", "a", "c"):
+                await pool.run(session_id, "hello")
+
+        asyncio.run(run())
+        assert len(pool) == 2 and pool.get("b") is None
@@ -0,0 +1,78 @@
+"""Benchmark NovaOps import and agent construction cost.
+
+Every measurement runs in a fresh interpreter so module caches are cold.
+
+Run with:
+    uv run python benchmarks/bench_startup.py [--repeat N] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Each snippet prints the seconds spent in the measured section.
+SCENARIOS = {
+    "import_novaops_tools": "import novaops.tools",
+    "import_novaops_agents": "import novaops.agents",
+    "import_cli": "import novaops.cli",
+    "build_commander": "from novaops.agents import get_commander_agent; get_commander_agent()",
+    "build_all_agents": (
+        "import novaops.agents as a\n"
+        "for f in (a.get_commander_agent, a.get_monitor_agent, a.get_analyst_agent,\n"
+        "          a.get_voice_agent, a.get_dashboard_agent):\n"
+        "    f()"
+    ),
+}
+
+
+def _time_snippet(snippet: str) -> float:
+    code = (
+        "import time\n"
+        "_t0 = time.perf_counter()\n"
+        f"{snippet}\n"
+        "print(time.perf_counter() - _t0)\n"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_DIR, env.get("PYTHONPATH")]))
+    env.setdefault("AWS_REGION", "us-east-1")
+    out = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def run(repeat: int = 5) -> dict:
+    """Run every startup scenario ``repeat`` times and summarise in milliseconds."""
+    results = {}
+    for name, snippet in SCENARIOS.items():
+        samples = [_time_snippet(snippet) * 1000 for _ in range(repeat)]
+        results[name] = {
+            "median_ms": round(statistics.median(samples), 2),
+            "min_ms": round(min(samples), 2),
+            "max_ms": round(max(samples), 2),
+            "samples": len(samples),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    for name, stats in results.items():
+        print(f"  {name:24s} median {stats['median_ms']:8.2f} ms  (min {stats['min_ms']:.2f}, max {stats['max_ms']:.2f})")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+"""Benchmark NovaOps tools, stores, CLI cold start and Commander latency.
+
+Every model call goes to the offline ``StubModel`` (``NOVAOPS_MODEL=stub``), so
+the suite needs no AWS access. Model latency is simulated with
+``--model-delay-ms`` and ``--token-delay-ms``. The response cache is disabled
+so that each call measures the real work.
+
+Run with:
+    uv run python benchmarks/bench_suite.py [--only search,commander] [--output results.json]
+    uv run python benchmarks/bench_suite.py --output new.json --compare baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT_DIR, "src")
+sys.path.insert(0, SRC_DIR)
+
+os.environ["NOVAOPS_MODEL"] = "stub"
+os.environ["NOVAOPS_CACHE"] = "0"
+os.environ.pop("NOVAOPS_DATA_DIR", None)
+
+_SERVICES = ("api", "database", "cache", "queue", "auth", "billing", "search", "storage")
+_SYMPTOMS = (
+    "timeout spike", "replication lag", "eviction storm", "consumer backlog", "certificate expiry",
+    "memory leak", "disk pressure", "connection pool exhaustion", "5xx error rate", "slow queries",
+)
+_CAUSES = (
+    "after deployment", "during peak traffic", "on the primary node", "in us-east-1",
+    "caused by a config change", "following a failover",
+)
+
+
+def _stats(samples: list[float], ops_per_sample: int = 1) -> dict:
+    """Summarise per-sample durations (seconds) in milliseconds and operations per second."""
+    ordered = sorted(samples)
+    return {
+        "median_ms": round(statistics.median(ordered) * 1000, 4),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 4),
+        "min_ms": round(ordered[0] * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4),
+        "ops_per_sec": round(ops_per_sample / statistics.median(ordered), 1),
+        "samples": len(ordered),
+    }
+
+
+def _measure(fn, repeat: int, warmup: int = 1, ops_per_sample: int = 1) -> dict:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return _stats(samples, ops_per_sample)
+
+
+def _synthetic_incidents(n: int) -> list[dict]:
+    """Build ``n`` plausible incident records from a small vocabulary."""
+    records = []
+    for i in range(n):
+        service = _SERVICES[i % len(_SERVICES)]
+        symptom = _SYMPTOMS[(i // len(_SERVICES)) % len(_SYMPTOMS)]
+        cause = _CAUSES[(i // 7) % len(_CAUSES)]
+        records.append({
+            "id": f"INC-{i:07d}",
+            "title": f"{service} {symptom}",
+            "severity": ("low", "medium", "high", "critical")[i % 4],
+            "service": service,
+            "description": f"{service} {symptom} {cause}.",
+            "resolved": i % 3 != 0,
+            "timestamp": "2026-02-01T00:00:00Z",
+        })
+    return records
+
+
+# ── Scenarios ───────────────────────────────────────────────────────────
+
+
+def bench_search(sizes: list[int], repeat: int) -> dict:
+    """search_incidents latency against indexes of increasing size."""
+    from novaops.index import IncidentIndex
+    from novaops.tools import analysis
+
+    results = {}
+    queries = ["api timeout after deployment", "database replication lag", "memory leak in queue"]
+    original = analysis._incident_index
+    try:
+        for n in sizes:
+            index = IncidentIndex()
+            records = _synthetic_incidents(n)
+            t0 = time.perf_counter()
+            for start in range(0, n, 50_000):
+                index.add_many(records[start:start + 50_000])
+            build_s = time.perf_counter() - t0
+            del records
+            analysis._incident_index = index
+            calls = iter(range(10**9))
+            stats = _measure(
+                lambda: analysis.search_incidents(query=queries[next(calls) % len(queries)]), repeat
+            )
+            stats["build_s"] = round(build_s, 3)
+            results[f"search_incidents_{n}"] = stats
+    finally:
+        analysis._incident_index = original
+    return results
+
+
+def bench_embeddings(repeat: int) -> dict:
+    """get_embeddings tool throughput on unseen texts, and batch embedding throughput."""
+    from novaops.embeddings import EmbeddingCache, embed_texts
+    from novaops.tools.analysis import get_embeddings
+
+    counter = iter(range(10**9))
+    texts = [r["description"] + f" #{i}" for i, r in enumerate(_synthetic_incidents(1000))]
+    return {
+        "get_embeddings": _measure(
+            lambda: get_embeddings(text=f"checkout latency regression build {next(counter)}"),
+            repeat * 20,
+        ),
+        "embed_texts_batch_1000": _measure(
+            lambda: embed_texts(texts, cache=EmbeddingCache(maxsize=0)), repeat, ops_per_sample=1000
+        ),
+    }
+
+
+def bench_store(repeat: int, batch: int = 1000) -> dict:
+    """create_incident / update_incident_status rates, and persistent store write rates."""
+    from novaops.incidents import PersistentIncidentStore
+    from novaops.tools import dashboard
+
+    def create_batch():
+        for i in range(batch):
+            dashboard.create_incident(title=f"api timeout {i}", severity="high", description="bench")
+
+    ids = []
+
+    def update_batch():
+        if not ids:
+            ids.extend(i["incident_id"] for i in dashboard._incident_store.query(limit=batch))
+        for i, incident_id in enumerate(ids):
+            dashboard.update_incident_status(
+                incident_id=incident_id, status=("investigating", "mitigated")[i % 2]
+            )
+
+    results = {
+        "create_incident": _measure(create_batch, repeat, ops_per_sample=batch),
+        "update_incident_status": _measure(update_batch, repeat, ops_per_sample=batch),
+    }
+    dashboard._incident_store.clear()
+
+    for writers in (1, 8):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = PersistentIncidentStore(tmp)
+            counter = iter(range(10**9))
+
+            def write(n):
+                for _ in range(n):
+                    store.add({"incident_id": f"P-{next(counter)}", "status": "open", "severity": "low"})
+
+            def run():
+                threads = [
+                    threading.Thread(target=write, args=(batch // writers,)) for _ in range(writers)
+                ]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+
+            results[f"persistent_add_{writers}_writers"] = _measure(
+                run, repeat, warmup=0, ops_per_sample=batch
+            )
+            store.close()
+    return results
+
+
+def bench_dashboard(sizes: list[int], repeat: int) -> dict:
+    """get_dashboard_data latency with many incidents in the store."""
+    from novaops.tools import dashboard
+
+    results = {}
+    store = dashboard._incident_store
+    try:
+        for n in sizes:
+            store.clear()
+            for i in range(n):
+                store.add({
+                    "incident_id": f"INC-{i:07d}",
+                    "title": "bench",
+                    "severity": ("low", "medium", "high", "critical")[i % 4],
+                    "status": ("open", "investigating", "resolved")[i % 3],
+                })
+            results[f"get_dashboard_data_{n}"] = _measure(dashboard.get_dashboard_data, repeat)
+            results[f"get_dashboard_data_{n}_filtered"] = _measure(
+                lambda: dashboard.get_dashboard_data(status="open", severity="critical", offset=100),
+                repeat,
+            )
+    finally:
+        store.clear()
+    return results
+
+
+def bench_metrics(repeat: int) -> dict:
+    """Time-series range queries over a day of samples, and the batch metrics tool."""
+    import numpy as np
+    from novaops.timeseries import MetricStore
+    from novaops.tools.infra import get_metrics_batch
+
+    store = MetricStore()
+    end = 86_400.0
+    timestamps = np.arange(0.0, end, 10.0)
+    values = np.random.default_rng(0).gamma(2.0, 40.0, len(timestamps))
+    store.record_many("api", "latency", timestamps, values)
+    return {
+        "metric_query_raw_1h": _measure(lambda: store.query("api", "latency", end - 3600, end), repeat * 20),
+        "metric_query_1m_rollup_24h": _measure(
+            lambda: store.query("api", "latency", 0, end, resolution=60), repeat * 20
+        ),
+        "metric_summary_24h": _measure(lambda: store.summary("api", "latency", 0, end), repeat * 20),
+        "get_metrics_batch_8x4": _measure(
+            lambda: get_metrics_batch(services=list(_SERVICES), window_minutes=15), repeat
+        ),
+    }
+
+
+def bench_cli(repeat: int) -> dict:
+    """Wall time of CLI commands in a fresh interpreter (cold start)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_DIR, env.get("PYTHONPATH")]))
+    results = {}
+    for command in (["version"], ["dashboard"], ["analyze", "api timeout"]):
+
+        def run():
+            subprocess.run(
+                [sys.executable, "-m", "novaops.cli", *command],
+                env=env, capture_output=True, check=True,
+            )
+
+        results[f"cli_{command[0]}"] = _measure(run, repeat)
+    return results
+
+
+def bench_commander(repeat: int, model_delay_ms: float, token_delay_ms: float) -> dict:
+    """End-to-end Commander latency through the stub model with simulated delays."""
+    os.environ["NOVAOPS_STUB_FIRST_TOKEN_DELAY"] = str(model_delay_ms / 1000)
+    os.environ["NOVAOPS_STUB_TOKEN_DELAY"] = str(token_delay_ms / 1000)
+    from novaops.agents import bedrock, commander
+
+    bedrock.clear_model_cache()
+    commander.get_commander_agent.cache_clear()
+
+    def ask(prompt):
+        # Start from an empty conversation so every sample does the same work
+        # (sub-agents are built fresh for every call).
+        commander.get_commander_agent().messages.clear()
+        asyncio.run(commander.get_commander_agent().invoke_async(prompt))
+
+    results = {
+        "commander_single_agent": _measure(lambda: ask("check health of api"), repeat),
+        "commander_parallel_dispatch": _measure(
+            lambda: ask("check api health, find similar incidents and alert on-call"), repeat
+        ),
+    }
+    for stats in results.values():
+        stats["model_delay_ms"] = model_delay_ms
+        stats["token_delay_ms"] = token_delay_ms
+    return results
+
+
+# ── Runner ──────────────────────────────────────────────────────────────
+
+SCENARIOS = ("search", "embeddings", "store", "dashboard", "metrics", "cli", "commander")
+
+
+def run(args) -> dict:
+    """Run the selected scenarios and return ``{"meta": ..., "results": ...}``."""
+    only = set(args.only.split(",")) if args.only else set(SCENARIOS)
+    sizes = [int(s) for s in args.search_sizes.split(",")]
+    dashboard_sizes = [int(s) for s in args.dashboard_sizes.split(",")]
+    results: dict[str, dict] = {}
+    if "search" in only:
+        results.update(bench_search(sizes, args.repeat))
+    if "embeddings" in only:
+        results.update(bench_embeddings(args.repeat))
+    if "store" in only:
+        results.update(bench_store(args.repeat))
+    if "dashboard" in only:
+        results.update(bench_dashboard(dashboard_sizes, args.repeat))
+    if "metrics" in only:
+        results.update(bench_metrics(args.repeat))
+    if "cli" in only:
+        results.update(bench_cli(args.repeat))
+    if "commander" in only:
+        results.update(bench_commander(args.repeat, args.model_delay_ms, args.token_delay_ms))
+    return {"meta": _meta(), "results": results}
+
+
+def _meta() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return the scenarios whose median got slower than ``baseline`` by more than ``threshold``."""
+    regressions = []
+    for name, stats in current["results"].items():
+        old = baseline["results"].get(name)
+        if not old:
+            continue
+        change = stats["median_ms"] / old["median_ms"] - 1 if old["median_ms"] else 0.0
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"  {name:40s} {old['median_ms']:10.3f} → {stats['median_ms']:10.3f} ms  ({change:+.1%}){flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", help=f"Comma-separated scenarios to run: {','.join(SCENARIOS)}")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--search-sizes", default="10,10000,1000000")
+    parser.add_argument("--dashboard-sizes", default="1000,100000")
+    parser.add_argument("--model-delay-ms", type=float, default=200.0)
+    parser.add_argument("--token-delay-ms", type=float, default=5.0)
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Regression threshold (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    report = run(args)
+    for name, stats in report["results"].items():
+        print(
+            f"  {name:40s} median {stats['median_ms']:10.3f} ms  p95 {stats['p95_ms']:10.3f} ms"
+            f"  {stats['ops_per_sec']:12.1f} ops/s"
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\nCompared with {baseline['meta'].get('commit')}:")
+        if compare(report, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,31 @@
-"""NovaOps agent definitions."""
+"""NovaOps agent definitions.
+
+Agents are built lazily: importing this package constructs nothing, and each
+agent is created (once) the first time it is requested.
+"""
+
+import importlib
+
+from novaops.agents.monitor import get_monitor_agent
+from novaops.agents.analyst import get_analyst_agent
+from novaops.agents.voice import get_voice_agent
+from novaops.agents.dashboard import get_dashboard_agent
+from novaops.agents.commander import get_commander_agent
+
+_LAZY_AGENTS = {
+    "commander_agent": "novaops.agents.commander",
+    "monitor_agent": "novaops.agents.monitor",
+    "analyst_agent": "novaops.agents.analyst",
+    "voice_agent": "novaops.agents.voice",
+    "dashboard_agent": "novaops.agents.dashboard",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_AGENTS:
+        return getattr(importlib.import_module(_LAZY_AGENTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from novaops.agents.monitor import monitor_agent
-from novaops.agents.analyst import analyst_agent
-from novaops.agents.voice import voice_agent
-from novaops.agents.dashboard import dashboard_agent
-from novaops.agents.commander import commander_agent
 
 __all__ = [
     "commander_agent",
@@ -12,4 +33,9 @@ __all__ = [
     "analyst_agent",
     "voice_agent",
     "dashboard_agent",
+    "get_commander_agent",
+    "get_monitor_agent",
+    "get_analyst_agent",
+    "get_voice_agent",
+    "get_dashboard_agent",
 ]
@@ -1,13 +1,13 @@
 """Analyst Agent — sub-agent for incident analysis, root cause detection, and pattern matching."""
 
-from strands import Agent
-from strands.models.bedrock import BedrockModel
-from novaops.tools.analysis import search_incidents, root_cause_analysis, get_embeddings
+from functools import lru_cache
 
-model = BedrockModel(
-    model_id="amazon.nova-pro-v1:0",
-    region_name="us-east-1",
-)
+from strands import Agent
+from novaops.agents.bedrock import get_model
+from novaops.memory import TokenBudgetConversationManager
+from novaops.events import ActivityHooks
+from novaops.tracing import TracingHooks
+from novaops.tools.aio import search_incidents, root_cause_analysis, get_embeddings
 
 ANALYST_SYSTEM_PROMPT = """\
 You are the Analyst Agent, specialized in incident analysis, root cause detection, \
@@ -28,8 +28,28 @@ When analyzing incidents:
 Be precise, data-driven, and reference specific incident IDs when drawing comparisons.
 """
 
-analyst_agent = Agent(
-    model=model,
-    system_prompt=ANALYST_SYSTEM_PROMPT,
-    tools=[search_incidents, root_cause_analysis, get_embeddings],
-)
+
+def create_analyst_agent() -> Agent:
+    """Build a new Analyst Agent with an empty conversation."""
+    return Agent(
+        name="analyst_agent",
+        model=get_model(),
+        callback_handler=None,
+        hooks=[TracingHooks(), ActivityHooks()],
+        conversation_manager=TokenBudgetConversationManager(),
+        system_prompt=ANALYST_SYSTEM_PROMPT,
+        tools=[search_incidents, root_cause_analysis, get_embeddings],
+    )
+
+
+@lru_cache(maxsize=1)
+def get_analyst_agent() -> Agent:
+    """Build the Analyst Agent on first use and return the shared instance."""
+    return create_analyst_agent()
+
+
+def __getattr__(name: str):
+    # Keep `from novaops.agents.analyst import analyst_agent` working without eager construction.
+    if name == "analyst_agent":
+        return get_analyst_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
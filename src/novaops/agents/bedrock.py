@@ -0,0 +1,88 @@
+"""Shared Bedrock model instances for the NovaOps agents.
+
+Agents never construct ``BedrockModel`` themselves. They ask :func:`get_model`,
+which builds at most one model (and so one ``bedrock-runtime`` client) per
+model ID and region. Every agent on the same model reuses that client's
+connection pool.
+
+Set ``NOVAOPS_MODEL=stub`` to swap Bedrock for the offline
+:class:`~novaops.agents.stub.StubModel` (for demos, benchmarks and load tests).
+``NOVAOPS_STUB_FIRST_TOKEN_DELAY`` and ``NOVAOPS_STUB_TOKEN_DELAY`` set its
+simulated latency in seconds.
+"""
+
+import os
+from functools import lru_cache
+
+import boto3
+from strands.models.bedrock import BedrockModel
+from strands.models.model import Model
+
+DEFAULT_MODEL_ID = "amazon.nova-pro-v1:0"
+DEFAULT_LITE_MODEL_ID = "amazon.nova-lite-v1:0"
+DEFAULT_REGION = "us-east-1"
+
+
+def default_model_id() -> str:
+    """Return the configured Bedrock model ID (``BEDROCK_MODEL_ID``)."""
+    return os.getenv("BEDROCK_MODEL_ID", DEFAULT_MODEL_ID)
+
+
+def default_lite_model_id() -> str:
+    """Return the configured lighter Bedrock model ID (``BEDROCK_LITE_MODEL_ID``)."""
+    return os.getenv("BEDROCK_LITE_MODEL_ID", DEFAULT_LITE_MODEL_ID)
+
+
+def default_region() -> str:
+    """Return the configured AWS region (``AWS_REGION``)."""
+    return os.getenv("AWS_REGION", DEFAULT_REGION)
+
+
+@lru_cache(maxsize=None)
+def _boto_session(region: str) -> boto3.Session:
+    return boto3.Session(region_name=region)
+
+
+@lru_cache(maxsize=None)
+def _model(model_id: str, region: str) -> BedrockModel:
+    return BedrockModel(model_id=model_id, boto_session=_boto_session(region))
+
+
+@lru_cache(maxsize=1)
+def _stub_model() -> Model:
+    from novaops.agents.stub import StubModel, keyword_plan
+
+    return StubModel(
+        plan=keyword_plan,
+        first_token_delay=float(os.getenv("NOVAOPS_STUB_FIRST_TOKEN_DELAY", "0")),
+        token_delay=float(os.getenv("NOVAOPS_STUB_TOKEN_DELAY", "0")),
+    )
+
+
+def get_model(model_id: str | None = None, region: str | None = None) -> Model:
+    """Return the shared Bedrock model for a model ID and region.
+
+    Args:
+        model_id: Bedrock model ID. Defaults to :func:`default_model_id`.
+        region: AWS region. Defaults to :func:`default_region`.
+
+    Returns:
+        A memoised ``BedrockModel``; repeated calls with the same model ID and
+        region return the same instance. With ``NOVAOPS_MODEL=stub`` every
+        call returns the shared stub model instead.
+    """
+    if os.getenv("NOVAOPS_MODEL", "bedrock").lower() == "stub":
+        return _stub_model()
+    return _model(model_id or default_model_id(), region or default_region())
+
+
+def get_lite_model(region: str | None = None) -> Model:
+    """Return the shared model for routine requests (Nova Lite by default)."""
+    return get_model(default_lite_model_id(), region)
+
+
+def clear_model_cache() -> None:
+    """Drop all pooled models and sessions (mainly for tests)."""
+    _model.cache_clear()
+    _stub_model.cache_clear()
+    _boto_session.cache_clear()
@@ -1,16 +1,20 @@
 """Commander Agent — top-level DevOps orchestrator using agents-as-tools pattern."""
 
-from strands import Agent
-from strands.models.bedrock import BedrockModel
-from novaops.agents.monitor import monitor_agent
-from novaops.agents.analyst import analyst_agent
-from novaops.agents.voice import voice_agent
-from novaops.agents.dashboard import dashboard_agent
-
-model = BedrockModel(
-    model_id="amazon.nova-pro-v1:0",
-    region_name="us-east-1",
-)
+import asyncio
+import os
+from functools import lru_cache
+
+from strands import Agent, tool
+from strands.tools.executors import ConcurrentToolExecutor
+from novaops.agents.bedrock import get_model
+from novaops.events import ActivityHooks
+from novaops.tracing import TracingHooks, traced, traced_stream
+from novaops.memory import TokenBudgetConversationManager
+from novaops.cache import TTLCache, cache_key, caching_enabled, register_cache
+from novaops.agents.monitor import create_monitor_agent
+from novaops.agents.analyst import create_analyst_agent
+from novaops.agents.voice import create_voice_agent
+from novaops.agents.dashboard import create_dashboard_agent
 
 COMMANDER_SYSTEM_PROMPT = """\
 You are the NovaOps Commander, a DevOps command center orchestrator.
@@ -34,11 +38,200 @@ Routing guide:
 - Voice commands, TTS, STT, voice alerts → Voice Agent
 - Dashboard state, incident CRUD, system overview → Dashboard Agent
 
+Parallel dispatch:
+- When a request needs several sub-agents whose tasks do not depend on each other's results \
+(e.g. "check API health, find similar incidents, alert on-call"), call dispatch_agents once with \
+all of the tasks. They run concurrently and you receive every answer together.
+- Only call sub-agents one after another when a later task needs an earlier task's output.
+
 Always provide a high-level summary after receiving sub-agent results.
 """
 
-commander_agent = Agent(
-    model=model,
-    system_prompt=COMMANDER_SYSTEM_PROMPT,
-    tools=[monitor_agent, analyst_agent, voice_agent, dashboard_agent],
-)
+# Sub-agents are exposed to the Commander as thin streaming tools. Every call
+# builds a fresh sub-agent (the model is pooled, so this is cheap): an Agent
+# serves one invocation at a time, and a shared one would refuse concurrent
+# calls from the same turn, from dispatch_agents or from other sessions, and
+# would leak one session's queries into another's context.
+
+
+# Opt-in cache of sub-agent answers (NOVAOPS_CACHE_AGENT_RESPONSES=1). Any
+# incident write invalidates it through the "agents" tag.
+_agent_responses = register_cache(TTLCache("agent_responses", maxsize=128, ttl=30.0))
+
+
+def _cache_agent_responses() -> bool:
+    return caching_enabled() and os.getenv("NOVAOPS_CACHE_AGENT_RESPONSES", "0") == "1"
+
+
+async def _delegate(agent: Agent, query: str):
+    """Run a sub-agent, yielding its tool-call events and finally its answer."""
+    key = cache_key(agent.name, {"query": query}, casefold=("query",))
+    if _cache_agent_responses():
+        hit, answer = _agent_responses.get(key)
+        if hit:
+            yield answer
+            return
+
+    seen: set[str] = set()
+    result = None
+    async for event in traced_stream(agent, query):
+        tool_use = event.get("current_tool_use")
+        if tool_use and tool_use.get("name") and tool_use.get("toolUseId") not in seen:
+            seen.add(tool_use.get("toolUseId"))
+            yield {"agent": agent.name, "tool_call": tool_use["name"]}
+        if "result" in event:
+            result = event["result"]
+    answer = str(result)
+    if _cache_agent_responses():
+        _agent_responses.set(key, answer, tags={"agents"})
+    # The last value yielded becomes the tool result seen by the Commander.
+    yield answer
+
+
+@tool(name="monitor_agent")
+@traced(name="monitor_agent")
+async def monitor_agent_tool(query: str):
+    """Ask the Monitor Agent to check service health or retrieve performance metrics.
+
+    Args:
+        query: The request for the Monitor Agent, in natural language.
+    """
+    async for event in _delegate(create_monitor_agent(), query):
+        yield event
+
+
+@tool(name="analyst_agent")
+@traced(name="analyst_agent")
+async def analyst_agent_tool(query: str):
+    """Ask the Analyst Agent to search incident history, run root cause analysis, or embed text.
+
+    Args:
+        query: The request for the Analyst Agent, in natural language.
+    """
+    async for event in _delegate(create_analyst_agent(), query):
+        yield event
+
+
+@tool(name="voice_agent")
+@traced(name="voice_agent")
+async def voice_agent_tool(query: str):
+    """Ask the Voice Agent to synthesize speech, transcribe audio, or broadcast a voice alert.
+
+    Args:
+        query: The request for the Voice Agent, in natural language.
+    """
+    async for event in _delegate(create_voice_agent(), query):
+        yield event
+
+
+@tool(name="dashboard_agent")
+@traced(name="dashboard_agent")
+async def dashboard_agent_tool(query: str):
+    """Ask the Dashboard Agent for dashboard state or to create and update incidents.
+
+    Args:
+        query: The request for the Dashboard Agent, in natural language.
+    """
+    async for event in _delegate(create_dashboard_agent(), query):
+        yield event
+
+
+SUB_AGENTS = {
+    "monitor": create_monitor_agent,
+    "analyst": create_analyst_agent,
+    "voice": create_voice_agent,
+    "dashboard": create_dashboard_agent,
+}
+
+
+async def _dispatch(tasks: list[dict]):
+    """Run sub-agent tasks concurrently, yielding their events and finally the merged answers.
+
+    Every task runs on its own sub-agent, so tasks for the same agent run in
+    parallel too.
+    """
+    results: list[dict] = [
+        {"agent": task.get("agent"), "query": task.get("query", "")} for task in tasks
+    ]
+    runnable = []
+    for i, result in enumerate(results):
+        if result["agent"] in SUB_AGENTS:
+            runnable.append(i)
+        else:
+            result["error"] = f"Unknown agent '{result['agent']}'. Use one of {sorted(SUB_AGENTS)}."
+
+    events: asyncio.Queue = asyncio.Queue()
+
+    async def run_task(i: int) -> None:
+        try:
+            agent = SUB_AGENTS[results[i]["agent"]]()
+            async for event in _delegate(agent, results[i]["query"]):
+                if isinstance(event, dict):
+                    await events.put(event)
+                else:
+                    results[i]["answer"] = event
+        except Exception as exc:
+            results[i]["error"] = f"{type(exc).__name__}: {exc}"
+
+    tasks_done = asyncio.gather(*(run_task(i) for i in runnable))
+    while not (tasks_done.done() and events.empty()):
+        next_event = asyncio.ensure_future(events.get())
+        await asyncio.wait({next_event, tasks_done}, return_when=asyncio.FIRST_COMPLETED)
+        if next_event.done():
+            yield next_event.result()
+        else:
+            next_event.cancel()
+    await tasks_done
+
+    yield {"results": results}
+
+
+@tool(name="dispatch_agents")
+@traced(name="dispatch_agents")
+async def dispatch_agents_tool(tasks: list[dict]):
+    """Run several independent sub-agent requests concurrently and return all of their answers.
+
+    Prefer this over separate sub-agent calls whenever the tasks do not depend on
+    each other. Total time is bounded by the slowest sub-agent rather than the sum.
+
+    Args:
+        tasks: The requests to run, each an object with "agent" (one of 'monitor', 'analyst',
+            'voice', 'dashboard') and "query" (the request for that agent, in natural language).
+    """
+    async for event in _dispatch(tasks):
+        yield event
+
+
+SUB_AGENT_TOOLS = [monitor_agent_tool, analyst_agent_tool, voice_agent_tool, dashboard_agent_tool]
+
+
+def create_commander_agent() -> Agent:
+    """Build a new Commander Agent with its own, token-bounded conversation.
+
+    Each session (see :mod:`novaops.memory`) gets its own instance; the model
+    is shared, and sub-agents are built per call.
+    """
+    return Agent(
+        name="commander_agent",
+        model=get_model(),
+        callback_handler=None,
+        hooks=[TracingHooks(), ActivityHooks()],
+        conversation_manager=TokenBudgetConversationManager(),
+        system_prompt=COMMANDER_SYSTEM_PROMPT,
+        tools=[*SUB_AGENT_TOOLS, dispatch_agents_tool],
+        # Sub-agent calls emitted in the same turn run concurrently.
+        tool_executor=ConcurrentToolExecutor(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_commander_agent() -> Agent:
+    """Build the default Commander Agent on first use and return the shared instance."""
+    return create_commander_agent()
+
+
+def __getattr__(name: str):
+    # Keep `from novaops.agents.commander import commander_agent` working without eager construction.
+    if name == "commander_agent":
+        return get_commander_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,14 @@
 """Dashboard Agent — sub-agent for dashboard state, incident management, and status tracking."""
 
-from strands import Agent
-from strands.models.bedrock import BedrockModel
-from novaops.tools.dashboard import get_dashboard_data, create_incident, update_incident_status
+from functools import lru_cache
 
-model = BedrockModel(
-    model_id="amazon.nova-pro-v1:0",
-    region_name="us-east-1",
+from strands import Agent
+from novaops.agents.bedrock import get_model
+from novaops.memory import TokenBudgetConversationManager
+from novaops.events import ActivityHooks
+from novaops.tracing import TracingHooks
+from novaops.tools.aio import (
+    get_dashboard_data, create_incident, report_alert, update_incident_status,
 )
 
 DASHBOARD_SYSTEM_PROMPT = """\
@@ -15,6 +17,7 @@ You are the Dashboard Agent, managing the NovaOps operational dashboard and inci
 Your responsibilities:
 - Provide aggregated dashboard state including service health, active incidents, and agent activity.
 - Create new incidents with appropriate severity classification.
+- Report monitoring alerts with report_alert, which links them to a related open incident instead of opening duplicates.
 - Update incident statuses through their lifecycle (open → investigating → mitigated → resolved → closed).
 - Track and report on operational metrics for the command center.
 
@@ -27,8 +30,28 @@ When managing incidents:
 Be structured and organized — the dashboard is the single source of truth for operations.
 """
 
-dashboard_agent = Agent(
-    model=model,
-    system_prompt=DASHBOARD_SYSTEM_PROMPT,
-    tools=[get_dashboard_data, create_incident, update_incident_status],
-)
+
+def create_dashboard_agent() -> Agent:
+    """Build a new Dashboard Agent with an empty conversation."""
+    return Agent(
+        name="dashboard_agent",
+        model=get_model(),
+        callback_handler=None,
+        hooks=[TracingHooks(), ActivityHooks()],
+        conversation_manager=TokenBudgetConversationManager(),
+        system_prompt=DASHBOARD_SYSTEM_PROMPT,
+        tools=[get_dashboard_data, create_incident, report_alert, update_incident_status],
+    )
+
+
+@lru_cache(maxsize=1)
+def get_dashboard_agent() -> Agent:
+    """Build the Dashboard Agent on first use and return the shared instance."""
+    return create_dashboard_agent()
+
+
+def __getattr__(name: str):
+    # Keep `from novaops.agents.dashboard import dashboard_agent` working without eager construction.
+    if name == "dashboard_agent":
+        return get_dashboard_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
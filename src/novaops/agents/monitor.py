@@ -1,13 +1,13 @@
 """Monitor Agent — sub-agent responsible for infrastructure health checks and metrics."""
 
-from strands import Agent
-from strands.models.bedrock import BedrockModel
-from novaops.tools.infra import check_health, get_metrics
+from functools import lru_cache
 
-model = BedrockModel(
-    model_id="amazon.nova-pro-v1:0",
-    region_name="us-east-1",
-)
+from strands import Agent
+from novaops.agents.bedrock import get_model
+from novaops.memory import TokenBudgetConversationManager
+from novaops.events import ActivityHooks
+from novaops.tracing import TracingHooks
+from novaops.tools.aio import check_health, get_metrics, get_metrics_batch
 
 MONITOR_SYSTEM_PROMPT = """\
 You are the Monitor Agent, a specialized infrastructure monitoring sub-agent in the NovaOps system.
@@ -15,14 +15,36 @@ You are the Monitor Agent, a specialized infrastructure monitoring sub-agent in
 Your responsibilities:
 - Check the health status of infrastructure services when asked.
 - Retrieve and report performance metrics (CPU, memory, latency, throughput).
+- For reports covering more than one service or metric, fetch everything in a single \
+get_metrics_batch call instead of calling get_metrics repeatedly.
 - Summarize findings clearly and flag any services that are degraded or unhealthy.
 - Provide actionable recommendations when issues are detected.
 
 Always be concise and structured in your responses. Use bullet points for multi-service reports.
 """
 
-monitor_agent = Agent(
-    model=model,
-    system_prompt=MONITOR_SYSTEM_PROMPT,
-    tools=[check_health, get_metrics],
-)
+
+def create_monitor_agent() -> Agent:
+    """Build a new Monitor Agent with an empty conversation."""
+    return Agent(
+        name="monitor_agent",
+        model=get_model(),
+        callback_handler=None,
+        hooks=[TracingHooks(), ActivityHooks()],
+        conversation_manager=TokenBudgetConversationManager(),
+        system_prompt=MONITOR_SYSTEM_PROMPT,
+        tools=[check_health, get_metrics, get_metrics_batch],
+    )
+
+
+@lru_cache(maxsize=1)
+def get_monitor_agent() -> Agent:
+    """Build the Monitor Agent on first use and return the shared instance."""
+    return create_monitor_agent()
+
+
+def __getattr__(name: str):
+    # Keep `from novaops.agents.monitor import monitor_agent` working without eager construction.
+    if name == "monitor_agent":
+        return get_monitor_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
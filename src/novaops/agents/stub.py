@@ -0,0 +1,237 @@
+"""Local stand-in for the Bedrock model, for tests, benchmarks and load tests.
+
+``StubModel`` speaks the same streaming event protocol as ``BedrockModel`` but
+never leaves the process. It can simulate model latency (time to first token
+and per-token delay) and can be scripted to call tools, so the whole
+Commander → sub-agent → tool chain runs offline and deterministically.
+"""
+
+import asyncio
+import itertools
+import json
+import re
+from collections.abc import AsyncIterable, Callable
+from typing import Any
+
+from strands.models.model import Model
+
+# (tool_name, tool_input) pairs the stub should call for a given prompt.
+ToolPlan = list[tuple[str, dict]]
+
+_tool_ids = itertools.count(1)
+
+# Keywords that route a Commander prompt to each sub-agent, in priority order.
+_AGENT_KEYWORDS = {
+    "monitor": ("health", "metric", "cpu", "memory", "latency", "throughput", "status of"),
+    "analyst": ("similar", "search", "history", "root cause", "rca", "embed", "why"),
+    "voice": ("alert", "page", "on-call", "speak", "say", "transcribe", "voice"),
+    "dashboard": ("dashboard", "create incident", "open incident", "resolve", "overview"),
+}
+_SERVICES = ("api", "database", "cache", "queue")
+_SEVERITIES = ("critical", "high", "medium", "low")
+
+
+def _tool_args(tool_name: str, prompt: str) -> dict:
+    lowered = prompt.lower()
+    service = next((s for s in _SERVICES if s in lowered), "api")
+    incident = re.search(r"INC-[0-9A-F]+", prompt, re.IGNORECASE)
+    if tool_name == "check_health":
+        return {"service": service}
+    if tool_name == "get_metrics":
+        metric = next((m for m in ("memory", "latency", "throughput") if m in lowered), "cpu")
+        return {"service": service, "metric_type": metric}
+    if tool_name == "root_cause_analysis":
+        return {"incident_id": incident.group(0).upper() if incident else "INC-001"}
+    if tool_name == "get_embeddings":
+        return {"text": prompt}
+    if tool_name == "text_to_speech":
+        return {"text": prompt}
+    if tool_name == "voice_alert":
+        severity = "critical" if "critical" in lowered else "warning" if "warn" in lowered else "info"
+        return {"message": prompt, "severity": severity}
+    if tool_name == "report_alert":
+        severity = next((s for s in _SEVERITIES if s in lowered), "medium")
+        return {"service": service, "title": prompt[:80], "severity": severity, "description": prompt}
+    if tool_name == "create_incident":
+        severity = next((s for s in _SEVERITIES if s in lowered), "medium")
+        return {"title": prompt[:80], "severity": severity, "description": prompt}
+    if tool_name == "get_dashboard_data":
+        return {}
+    return {"query": prompt}
+
+
+# Tool each sub-agent calls for a prompt: (keywords, tool_name), first match wins.
+_TOOL_KEYWORDS = [
+    (("metric", "cpu", "memory", "latency", "throughput"), "get_metrics"),
+    (("health", "status of"), "check_health"),
+    (("root cause", "rca", "why"), "root_cause_analysis"),
+    (("embed",), "get_embeddings"),
+    (("alert", "page", "on-call"), "voice_alert"),
+    (("speak", "say"), "text_to_speech"),
+    (("report alert", "alert fired"), "report_alert"),
+    (("create incident", "open incident"), "create_incident"),
+    (("dashboard", "overview"), "get_dashboard_data"),
+    ((), "search_incidents"),
+]
+
+
+def keyword_plan(prompt: str, tool_names: list[str]) -> ToolPlan:
+    """Route a prompt to tools by keyword, the way a model plausibly would.
+
+    On the Commander it picks the sub-agents whose keywords appear in the
+    prompt and sends them to ``dispatch_agents`` when there are several. On a
+    sub-agent it calls the first of that agent's tools that matches.
+    """
+    lowered = prompt.lower()
+    if "monitor_agent" in tool_names:
+        agents = [a for a, words in _AGENT_KEYWORDS.items() if any(w in lowered for w in words)]
+        if len(agents) > 1 and "dispatch_agents" in tool_names:
+            return [("dispatch_agents", {"tasks": [{"agent": a, "query": prompt} for a in agents]})]
+        return [(f"{agents[0]}_agent", {"query": prompt})] if agents else []
+    for words, name in _TOOL_KEYWORDS:
+        if name in tool_names and (not words or any(w in lowered for w in words)):
+            return [(name, _tool_args(name, prompt))]
+    return []
+
+
+def _text_of(message: dict) -> str:
+    return " ".join(block["text"] for block in message.get("content", []) if "text" in block)
+
+
+def _tool_results_of(message: dict) -> list[str]:
+    results = []
+    for block in message.get("content", []):
+        if "toolResult" in block:
+            content = block["toolResult"]["content"]
+            results.extend(c["text"] if "text" in c else json.dumps(c.get("json")) for c in content)
+    return results
+
+
+def _structured(output_model, text: str):
+    """Validate a JSON reply as ``output_model``; other text fills its required string fields."""
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        data = {
+            name: text
+            for name, field in output_model.model_fields.items()
+            if field.is_required() and field.annotation is str
+        }
+    return output_model.model_validate(data)
+
+
+class StubModel(Model):
+    """Offline model that streams canned responses with simulated latency.
+
+    On a user turn the stub asks ``plan`` which tools to call. If the plan is
+    empty, or the previous turn already returned tool results, it streams a
+    text answer built by ``respond`` (by default it echoes the prompt, or
+    summarises the tool results).
+
+    Args:
+        plan: ``plan(prompt, tool_names) -> [(tool_name, input), ...]``. Only
+            tools the agent actually has are called. Defaults to no tools.
+        respond: ``respond(prompt, tool_results) -> str``.
+        first_token_delay: Seconds before the first streamed event.
+        token_delay: Seconds between streamed text tokens.
+    """
+
+    def __init__(
+        self,
+        plan: Callable[[str, list[str]], ToolPlan] | None = None,
+        respond: Callable[[str, list[str]], str] | None = None,
+        first_token_delay: float = 0.0,
+        token_delay: float = 0.0,
+    ):
+        self.plan = plan or (lambda prompt, tool_names: [])
+        self.respond = respond or self._default_response
+        self.config = {
+            "model_id": "stub",
+            "first_token_delay": first_token_delay,
+            "token_delay": token_delay,
+        }
+        self.calls = 0
+
+    @staticmethod
+    def _default_response(prompt: str, tool_results: list[str]) -> str:
+        if tool_results:
+            return "Summary: " + " | ".join(tool_results)
+        return f"Acknowledged: {prompt}"
+
+    def update_config(self, **model_config: Any) -> None:
+        self.config.update(model_config)
+
+    def get_config(self) -> dict:
+        return self.config
+
+    async def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        """Answer ``prompt`` with ``respond`` and build ``output_model`` from the text.
+
+        A reply that is a JSON object is validated as is; any other reply
+        fills every required string field of the model.
+
+        Raises:
+            pydantic.ValidationError: The reply does not fit ``output_model``,
+                e.g. the model has required fields that are not strings.
+        """
+        self.calls += 1
+        await asyncio.sleep(self.config["first_token_delay"])
+        last = prompt[-1] if prompt else {"content": []}
+        text = next((_text_of(m) for m in reversed(prompt) if _text_of(m)), "")
+        yield {"output": _structured(output_model, self.respond(text, _tool_results_of(last)))}
+
+    async def stream(
+        self,
+        messages,
+        tool_specs=None,
+        system_prompt=None,
+        **kwargs: Any,
+    ) -> AsyncIterable[dict]:
+        self.calls += 1
+        await asyncio.sleep(self.config["first_token_delay"])
+        yield {"messageStart": {"role": "assistant"}}
+
+        last = messages[-1] if messages else {"content": []}
+        tool_results = _tool_results_of(last)
+        prompt = next((_text_of(m) for m in reversed(messages) if _text_of(m)), "")
+        tool_names = [spec["name"] for spec in tool_specs or []]
+        plan = [] if tool_results else [
+            (name, args) for name, args in self.plan(prompt, tool_names) if name in tool_names
+        ]
+
+        if plan:
+            for name, args in plan:
+                yield {
+                    "contentBlockStart": {
+                        "start": {"toolUse": {"toolUseId": f"stub-{next(_tool_ids)}", "name": name}}
+                    }
+                }
+                yield {"contentBlockDelta": {"delta": {"toolUse": {"input": json.dumps(args)}}}}
+                yield {"contentBlockStop": {}}
+            stop_reason = "tool_use"
+            output = sum(len(json.dumps(a)) for _, a in plan) // 4
+        else:
+            text = self.respond(prompt, tool_results)
+            tokens = text.split(" ")
+            for i, token in enumerate(tokens):
+                if i:
+                    await asyncio.sleep(self.config["token_delay"])
+                yield {"contentBlockDelta": {"delta": {"text": token if i == 0 else " " + token}}}
+            yield {"contentBlockStop": {}}
+            stop_reason = "end_turn"
+            output = len(tokens)
+
+        yield {"messageStop": {"stopReason": stop_reason}}
+        prompt_tokens = sum(len(json.dumps(m, default=str)) for m in messages) // 4
+        yield {
+            "metadata": {
+                "usage": {
+                    "inputTokens": prompt_tokens,
+                    "outputTokens": output,
+                    "totalTokens": prompt_tokens + output,
+                },
+                "metrics": {"latencyMs": 0},
+            }
+        }
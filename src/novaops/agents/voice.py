@@ -1,13 +1,13 @@
 """Voice Agent — sub-agent providing voice-based interaction for the NovaOps command center."""
 
-from strands import Agent
-from strands.models.bedrock import BedrockModel
-from novaops.tools.voice import text_to_speech, speech_to_text, voice_alert
+from functools import lru_cache
 
-model = BedrockModel(
-    model_id="amazon.nova-pro-v1:0",
-    region_name="us-east-1",
-)
+from strands import Agent
+from novaops.agents.bedrock import get_model
+from novaops.memory import TokenBudgetConversationManager
+from novaops.events import ActivityHooks
+from novaops.tracing import TracingHooks
+from novaops.tools.aio import text_to_speech, speech_to_text, voice_alert
 
 VOICE_SYSTEM_PROMPT = """\
 You are the Voice Agent, providing voice-based interaction for the NovaOps command center.
@@ -27,8 +27,28 @@ When handling voice interactions:
 Keep voice responses concise — operators need quick, actionable information.
 """
 
-voice_agent = Agent(
-    model=model,
-    system_prompt=VOICE_SYSTEM_PROMPT,
-    tools=[text_to_speech, speech_to_text, voice_alert],
-)
+
+def create_voice_agent() -> Agent:
+    """Build a new Voice Agent with an empty conversation."""
+    return Agent(
+        name="voice_agent",
+        model=get_model(),
+        callback_handler=None,
+        hooks=[TracingHooks(), ActivityHooks()],
+        conversation_manager=TokenBudgetConversationManager(),
+        system_prompt=VOICE_SYSTEM_PROMPT,
+        tools=[text_to_speech, speech_to_text, voice_alert],
+    )
+
+
+@lru_cache(maxsize=1)
+def get_voice_agent() -> Agent:
+    """Build the Voice Agent on first use and return the shared instance."""
+    return create_voice_agent()
+
+
+def __getattr__(name: str):
+    # Keep `from novaops.agents.voice import voice_agent` working without eager construction.
+    if name == "voice_agent":
+        return get_voice_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
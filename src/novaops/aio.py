@@ -0,0 +1,201 @@
+"""Shared event loop, worker pool and backend connection pools for async tools.
+
+Strands runs every agent invocation on an event loop of its own, and runs
+synchronous tools on that loop's default thread pool. The async tools in
+:mod:`novaops.tools.aio` instead hand their work to one process-wide event
+loop running on a background thread. Backend clients and their connection
+limits are bound to that loop, so every agent shares them:
+
+- :func:`submit` awaits a coroutine on the shared loop from any other loop.
+- :func:`run` does the same from synchronous code (the CLI, tests).
+- :func:`to_thread` runs blocking code on the shared, bounded worker pool.
+- :class:`BackendPool` caps concurrent requests per backend, the way a
+  connection pool does, and counts how often callers had to wait.
+
+``NOVAOPS_IO_WORKERS`` sizes the worker pool and ``NOVAOPS_POOL_SIZE`` the
+default per-backend limit.
+"""
+
+import asyncio
+import atexit
+import contextvars
+import functools
+import os
+import threading
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_thread: threading.Thread | None = None
+_executor: ThreadPoolExecutor | None = None
+_lock = threading.Lock()
+_pools: dict[str, "BackendPool"] = {}
+
+
+def _pool_size() -> int:
+    return max(int(os.getenv("NOVAOPS_POOL_SIZE", "10")), 1)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the shared worker pool for blocking calls made by async tools."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            workers = int(os.getenv("NOVAOPS_IO_WORKERS", "0")) or min(32, (os.cpu_count() or 1) + 4)
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="novaops-io")
+        return _executor
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop, starting its background thread on first use."""
+    global _loop, _thread
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def serve():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            _thread = threading.Thread(target=serve, name="novaops-loop", daemon=True)
+            _thread.start()
+            ready.wait()
+            _loop = loop
+        return _loop
+
+
+def _on_loop() -> bool:
+    return _thread is not None and threading.current_thread() is _thread
+
+
+async def submit(coro: Coroutine[Any, Any, T]) -> T:
+    """Await ``coro`` on the shared loop from whichever loop the caller runs on."""
+    if _on_loop():
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, get_loop()))
+
+
+def run(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+    """Run ``coro`` on the shared loop and block until it finishes.
+
+    Raises:
+        RuntimeError: If called from the shared loop itself, which would deadlock.
+    """
+    if _on_loop():
+        coro.close()
+        raise RuntimeError("novaops.aio.run() cannot be called from the shared event loop")
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result(timeout)
+
+
+async def to_thread(func: Callable[..., T], /, *args, **kwargs) -> T:
+    """Run blocking ``func`` on the shared worker pool, keeping the caller's context.
+
+    The context (and with it the current trace span) is captured before the
+    hop, so work done in the pool is attributed to the calling span.
+    """
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(get_executor(), call)
+
+
+class BackendPool:
+    """Caps concurrent in-flight requests to one backend.
+
+    The limit is enforced on the shared loop, so it holds across every agent
+    and every caller. Use it as ``async with pool:`` around a request.
+
+    Args:
+        name: Backend name, reported by :func:`pool_stats`.
+        size: Maximum number of concurrent requests.
+    """
+
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = size
+        self._semaphore: asyncio.Semaphore | None = None
+        self.in_use = 0
+        self.peak = 0
+        self.requests = 0
+        self.waits = 0
+
+    async def __aenter__(self) -> "BackendPool":
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.size)
+        if self._semaphore.locked():
+            self.waits += 1
+        await self._semaphore.acquire()
+        self.requests += 1
+        self.in_use += 1
+        self.peak = max(self.peak, self.in_use)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.in_use -= 1
+        self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "in_use": self.in_use,
+            "peak": self.peak,
+            "requests": self.requests,
+            "waits": self.waits,
+        }
+
+
+def get_pool(name: str, size: int | None = None) -> BackendPool:
+    """Return the shared pool for backend ``name``, creating it on first use."""
+    with _lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = _pools[name] = BackendPool(name, size or _pool_size())
+        return pool
+
+
+def pool_stats() -> dict[str, dict]:
+    """Return usage counters for every backend pool, keyed by backend name."""
+    return {name: pool.stats() for name, pool in sorted(_pools.items())}
+
+
+async def call_backend(backend: str, func: Callable[..., T | Awaitable[T]], /, *args, **kwargs) -> T:
+    """Call ``func`` on the shared loop while holding a connection from ``backend``'s pool.
+
+    Coroutine functions are awaited on the shared loop; plain functions run on
+    the shared worker pool.
+    """
+
+    async def call() -> T:
+        async with get_pool(backend):
+            if asyncio.iscoroutinefunction(func):
+                return await func(*args, **kwargs)
+            return await to_thread(func, *args, **kwargs)
+
+    if _on_loop():
+        return await call()
+    # Carry the caller's context (trace span) over to the shared loop.
+    context = contextvars.copy_context()
+    future = context.run(asyncio.run_coroutine_threadsafe, call(), get_loop())
+    return await asyncio.wrap_future(future)
+
+
+def shutdown() -> None:
+    """Stop the shared loop and worker pool (they restart on next use)."""
+    global _loop, _thread, _executor
+    with _lock:
+        loop, thread, executor = _loop, _thread, _executor
+        _loop = _thread = _executor = None
+        _pools.clear()
+    if loop is not None and not loop.is_closed():
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+atexit.register(shutdown)
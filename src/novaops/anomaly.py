@@ -0,0 +1,371 @@
+"""Online anomaly detection over the metric stream, opening incidents directly.
+
+Every ``(service, metric)`` series gets two baselines, each updated in O(1)
+per sample:
+
+- an EWMA of the mean and variance, which tracks the recent level;
+- a seasonal baseline: one EWMA per slot of a repeating period (by default
+  the 24 hours of a day), learnt from earlier periods, so a daily peak is
+  compared with earlier peaks rather than with the quiet night before.
+
+A sample is anomalous when its z-score against the EWMA baseline reaches the
+threshold, and so does its z-score against the seasonal slot (once that slot
+has warmed up). An incident is opened only after ``sustain`` consecutive
+anomalous samples, so single outliers are ignored. Incidents are opened
+directly through the alert correlator, with no model round-trip. A series with
+an incident that is still open (or was opened within ``cooldown`` seconds)
+does not open another one.
+
+Enable detection on the shared metric store with ``NOVAOPS_ANOMALY_DETECTION=1``
+or :func:`start_detection`.
+"""
+
+import math
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+from novaops.timeseries import MetricStore
+
+_CLOSED_STATUSES = ("resolved", "closed")
+
+
+class EWMA:
+    """Exponentially weighted mean and variance, updated in O(1).
+
+    Args:
+        alpha: Weight of the newest sample (smaller adapts more slowly).
+    """
+
+    __slots__ = ("alpha", "mean", "var", "count")
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.mean = 0.0
+        self.var = 0.0
+        self.count = 0
+
+    def score(self, value: float, min_std: float) -> float:
+        """Return the z-score of ``value`` against the current baseline."""
+        return (value - self.mean) / max(math.sqrt(self.var), min_std)
+
+    def fold(self, mean: float, var: float) -> None:
+        """Fold in a summary (mean and variance) of a group of samples as one observation."""
+        if not self.count:
+            self.mean, self.var = mean, var
+        else:
+            diff = mean - self.mean
+            self.mean += self.alpha * diff
+            self.var = (1 - self.alpha) * self.var + self.alpha * (var + diff * diff)
+        self.count += 1
+
+    def update(self, value: float) -> None:
+        if not self.count:
+            self.mean = value
+        else:
+            diff = value - self.mean
+            incr = self.alpha * diff
+            self.mean += incr
+            self.var = (1 - self.alpha) * (self.var + diff * incr)
+        self.count += 1
+
+
+@dataclass
+class Anomaly:
+    """A sustained deviation of one series from its baselines."""
+
+    service: str
+    metric: str
+    value: float
+    timestamp: float
+    zscore: float
+    baseline: float
+    baseline_std: float
+    seasonal_zscore: float | None
+
+    @property
+    def direction(self) -> str:
+        return "spike" if self.zscore > 0 else "drop"
+
+    @property
+    def severity(self) -> str:
+        magnitude = abs(self.zscore)
+        return "critical" if magnitude >= 8 else "high" if magnitude >= 6 else "medium"
+
+
+class SeriesDetector:
+    """EWMA and seasonal z-score detector for a single series.
+
+    The level baseline is not updated with anomalous samples, so a sustained
+    shift keeps scoring against the pre-shift level. After ``relearn``
+    consecutive anomalous samples the shift is accepted as the new normal and
+    the baseline restarts from it. Each seasonal slot learns from completed
+    visits to that slot in earlier periods, never from the visit in progress.
+
+    Args:
+        alpha: EWMA weight for the level baseline.
+        seasonal_alpha: EWMA weight of each completed visit in its slot baseline.
+        period: Length of the seasonal cycle in seconds.
+        slots: Number of slots the period is divided into.
+        threshold: z-score at which a sample counts as anomalous.
+        warmup: Samples the level baseline needs before it is trusted.
+        seasonal_warmup: Completed visits a slot needs before it is trusted.
+        sustain: Consecutive anomalous samples needed to report an anomaly.
+        relearn: Consecutive anomalous samples after which the level baseline
+            restarts from the current value.
+        min_std: Floor for the baseline standard deviation, relative to its
+            mean, so a perfectly flat series does not alarm on tiny changes.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.05,
+        seasonal_alpha: float = 0.3,
+        period: float = 86_400.0,
+        slots: int = 24,
+        threshold: float = 4.0,
+        warmup: int = 30,
+        seasonal_warmup: int = 2,
+        sustain: int = 3,
+        relearn: int = 60,
+        min_std: float = 0.01,
+    ):
+        self.level = EWMA(alpha)
+        self.seasons = [EWMA(seasonal_alpha) for _ in range(slots)]
+        self.period = period
+        self.threshold = threshold
+        self.warmup = warmup
+        self.seasonal_warmup = seasonal_warmup
+        self.sustain = sustain
+        self.relearn = relearn
+        self.min_std = min_std
+        self.streak = 0
+        # Running stats of the slot visit in progress: [visit key, n, sum, sum of squares]
+        self._visit: list = [None, 0, 0.0, 0.0]
+
+    def _z(self, baseline: EWMA, value: float) -> float:
+        return baseline.score(value, self.min_std * max(abs(baseline.mean), 1e-9))
+
+    def _track_visit(self, timestamp: float, value: float) -> EWMA:
+        cycle, offset = divmod(timestamp, self.period)
+        index = int(offset / self.period * len(self.seasons))
+        key, n, total, squares = self._visit
+        if key != (cycle, index):
+            if n:
+                mean = total / n
+                self.seasons[key[1]].fold(mean, max(squares / n - mean * mean, 0.0))
+            self._visit = [(cycle, index), 0, 0.0, 0.0]
+        visit = self._visit
+        visit[1] += 1
+        visit[2] += value
+        visit[3] += value * value
+        return self.seasons[index]
+
+    def observe(self, value: float, timestamp: float) -> tuple[float, float | None, float, float] | None:
+        """Fold in one sample.
+
+        Returns:
+            ``(z, seasonal_z, baseline_mean, baseline_std)`` when this sample
+            completes a sustained anomaly, else None.
+        """
+        slot = self._track_visit(timestamp, value)
+        baseline = (self.level.mean, math.sqrt(self.level.var))
+        z = seasonal_z = None
+        anomalous = False
+        if self.level.count >= self.warmup:
+            z = self._z(self.level, value)
+            anomalous = abs(z) >= self.threshold
+            if anomalous and slot.count >= self.seasonal_warmup:
+                seasonal_z = self._z(slot, value)
+                anomalous = abs(seasonal_z) >= self.threshold
+
+        if not anomalous:
+            self.streak = 0
+            self.level.update(value)
+            return None
+        self.streak += 1
+        if self.streak >= self.relearn:
+            # The shift has lasted long enough to be the new normal.
+            self.level = EWMA(self.level.alpha)
+            self.level.update(value)
+            self.streak = 0
+        if self.streak == self.sustain:
+            return (z, seasonal_z, *baseline)
+        return None
+
+
+class AnomalyEngine:
+    """Runs a :class:`SeriesDetector` per series and opens deduplicated incidents.
+
+    Args:
+        on_anomaly: Called with each new :class:`Anomaly`; returns the created
+            incident's ID (or None). Defaults to :func:`open_incident`.
+        cooldown: Seconds after opening an incident for a series during
+            which no new one is opened, even if the first was resolved.
+        incident_status: Looks up an incident's status by ID, to tell whether
+            it is still open. Defaults to the dashboard incident store.
+        **detector_options: Passed to every :class:`SeriesDetector`.
+    """
+
+    def __init__(
+        self,
+        on_anomaly: Callable[[Anomaly], str | None] | None = None,
+        cooldown: float = 600.0,
+        incident_status: Callable[[str], str | None] | None = None,
+        **detector_options,
+    ):
+        self.on_anomaly = on_anomaly or open_incident
+        self.cooldown = cooldown
+        self.incident_status = incident_status or _dashboard_incident_status
+        self.detector_options = detector_options
+        self._detectors: dict[tuple[str, str], SeriesDetector] = {}
+        # (service, metric) -> (incident ID, time opened); ID "" while being created
+        self._open: dict[tuple[str, str], tuple[str | None, float]] = {}
+        self._lock = threading.Lock()
+        self.anomalies = 0
+        self.suppressed = 0
+
+    def observe(self, service: str, metric: str, value: float, timestamp: float) -> Anomaly | None:
+        """Evaluate one sample and open an incident if it completes a new anomaly."""
+        key = (service, metric)
+        with self._lock:
+            detector = self._detectors.get(key)
+            if detector is None:
+                detector = self._detectors[key] = SeriesDetector(**self.detector_options)
+            hit = detector.observe(value, timestamp)
+            if hit is None:
+                return None
+            z, seasonal_z, mean, std = hit
+            anomaly = Anomaly(
+                service, metric, value, timestamp, round(z, 2), round(mean, 3), round(std, 3),
+                None if seasonal_z is None else round(seasonal_z, 2),
+            )
+            self.anomalies += 1
+            if self._is_duplicate(key):
+                self.suppressed += 1
+                return None
+            previous = self._open.get(key)
+            self._open[key] = ("", time.monotonic())
+        # Create the incident outside the lock; it takes the store's own locks.
+        try:
+            incident_id = self.on_anomaly(anomaly)
+        except Exception:
+            # Release the reservation, or the series would count as open forever.
+            with self._lock:
+                if previous is None:
+                    self._open.pop(key, None)
+                else:
+                    self._open[key] = previous
+            raise
+        with self._lock:
+            self._open[key] = (incident_id, self._open[key][1])
+        return anomaly
+
+    def _is_duplicate(self, key: tuple[str, str]) -> bool:
+        previous = self._open.get(key)
+        if previous is None:
+            return False
+        incident_id, opened = previous
+        if incident_id == "" or time.monotonic() - opened < self.cooldown:
+            return True
+        return incident_id is not None and self.incident_status(incident_id) not in (None, *_CLOSED_STATUSES)
+
+    def observe_many(self, service: str, metric: str, timestamps, values) -> list[Anomaly]:
+        """Evaluate a batch of samples in order."""
+        found = []
+        for timestamp, value in zip(np.asarray(timestamps).tolist(), np.asarray(values).tolist()):
+            anomaly = self.observe(service, metric, value, timestamp)
+            if anomaly is not None:
+                found.append(anomaly)
+        return found
+
+    def attach(self, store: MetricStore) -> None:
+        """Evaluate every sample recorded into ``store`` from now on."""
+        store.subscribe(self.observe_many)
+
+    def detach(self, store: MetricStore) -> None:
+        store.unsubscribe(self.observe_many)
+
+    def stats(self) -> dict:
+        """Return counts of series watched, anomalies seen and duplicates suppressed."""
+        with self._lock:
+            return {
+                "series": len(self._detectors),
+                "anomalies": self.anomalies,
+                "suppressed": self.suppressed,
+                "incidents": sum(1 for incident_id, _ in self._open.values() if incident_id),
+            }
+
+
+def describe(anomaly: Anomaly) -> str:
+    """One-line human description of an anomaly, used as the incident description."""
+    seasonal = (
+        f", {anomaly.seasonal_zscore:+.1f}σ vs. the same time of day"
+        if anomaly.seasonal_zscore is not None else ""
+    )
+    return (
+        f"Automatic detection: {anomaly.metric} on {anomaly.service} was {anomaly.value:g} "
+        f"({anomaly.zscore:+.1f}σ vs. baseline {anomaly.baseline:g} ± {anomaly.baseline_std:g}"
+        f"{seasonal})."
+    )
+
+
+def open_incident(anomaly: Anomaly) -> str:
+    """Report ``anomaly`` as an alert and return the ID of the incident it was filed under.
+
+    The alert goes through the shared :class:`~novaops.correlation.AlertCorrelator`,
+    so anomalies that are part of the same cascade share one incident. Alerts
+    are grouped by the time they are reported rather than the sample's time,
+    which for backfilled data may lie far outside the correlation window.
+    """
+    from novaops.correlation import get_correlator
+
+    alert = get_correlator().submit(
+        service=anomaly.service,
+        title=f"{anomaly.service} {anomaly.metric} {anomaly.direction} detected",
+        severity=anomaly.severity,
+        description=describe(anomaly),
+    )
+    return alert["incident_id"]
+
+
+def _dashboard_incident_status(incident_id: str) -> str | None:
+    from novaops.tools.dashboard import _incident_store
+
+    incident = _incident_store.get(incident_id)
+    return None if incident is None else incident["status"]
+
+
+_engine: AnomalyEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def start_detection(store: MetricStore | None = None, **options) -> AnomalyEngine:
+    """Attach the shared anomaly engine to a metric store (default: the tools' store).
+
+    Calling it again returns the already running engine.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            if store is None:
+                from novaops.tools.infra import get_metric_store
+
+                store = get_metric_store()
+            _engine = AnomalyEngine(**options)
+            _engine.attach(store)
+        return _engine
+
+
+def get_anomaly_engine() -> AnomalyEngine | None:
+    """Return the running shared engine, or None if detection was not started."""
+    return _engine
+
+
+def detection_enabled() -> bool:
+    """Return True when ``NOVAOPS_ANOMALY_DETECTION=1``."""
+    return os.getenv("NOVAOPS_ANOMALY_DETECTION", "0").lower() in ("1", "true", "on")
@@ -0,0 +1,370 @@
+"""Voice alert broadcast: per-channel delivery queues with rate limits and coalescing.
+
+:func:`novaops.tools.voice.voice_alert` hands each alert to the
+:class:`BroadcastDispatcher` and returns straight away; the agent thread
+never waits for delivery. Every channel (``ops-general``, ``ops-oncall``,
+``ops-escalation``) has its own queue and delivery thread:
+
+- The first alert after a quiet spell is delivered at once. Alerts arriving
+  within ``window`` seconds of the last delivery are held and coalesced
+  into one digest, sent when the window closes.
+- A token bucket caps deliveries per channel; alerts that pile up while a
+  channel waits for a token join the next digest.
+- Each delivery's clip is synthesized on the channel's thread, for the
+  message or digest actually sent, through the shared audio cache, so a
+  repeated alert costs no synthesis and the agent never waits for speech.
+- Failed deliveries are retried with exponential backoff.
+
+A 500-alert storm therefore pages on-call a handful of times, each page
+summarising what it covers. ``NOVAOPS_ALERT_WINDOW`` sets the coalescing
+window in seconds.
+"""
+
+import atexit
+import os
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from novaops.synthesis import SAMPLE_RATE, SAMPLE_WIDTH, stream_speech
+
+SEVERITIES = ("info", "warning", "critical")
+SEVERITY_CHANNELS = {
+    "info": ("ops-general",),
+    "warning": ("ops-general", "ops-oncall"),
+    "critical": ("ops-general", "ops-oncall", "ops-escalation"),
+}
+# People paged per delivery on each channel.
+CHANNEL_RECIPIENTS = {"ops-general": 12, "ops-oncall": 2, "ops-escalation": 3}
+# Deliveries per second and burst size allowed on each channel.
+CHANNEL_RATES = {"ops-general": (1.0, 5), "ops-oncall": (0.2, 2), "ops-escalation": (0.1, 1)}
+
+# Distinct messages quoted in a digest before the rest are only counted.
+_DIGEST_LINES = 3
+
+
+class TokenBucket:
+    """Allows ``rate`` events per second on average, in bursts of up to ``burst``.
+
+    Args:
+        rate: Tokens added per second.
+        burst: Bucket capacity; the bucket starts full.
+        clock: Monotonic time source (overridable in tests).
+    """
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+
+    def take(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            0.0 if a token was taken, else the seconds until one will be.
+        """
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+@dataclass
+class Alert:
+    """One alert queued for broadcast."""
+
+    broadcast_id: str
+    message: str
+    severity: str
+    audio_ref: str | None = None
+    submitted: float = field(default_factory=time.monotonic)
+
+
+def digest(alerts: list[Alert], dropped: int = 0) -> str:
+    """Summarise several alerts as one message, most frequent first."""
+    top = Counter(a.message for a in alerts).most_common(_DIGEST_LINES)
+    worst = max((a.severity for a in alerts), key=SEVERITIES.index)
+    lines = [f"{n}x {message}" if n > 1 else message for message, n in top]
+    others = len(alerts) - sum(n for _, n in top) + dropped
+    if others:
+        lines.append(f"and {others} more")
+    return f"{len(alerts) + dropped} {worst} alerts: " + "; ".join(lines)
+
+
+def speak(message: str) -> bytes:
+    """Default synthesis: the PCM audio for ``message``, through the shared audio cache."""
+    return b"".join(stream_speech(message))
+
+
+def log_delivery(channel: str, message: str, severity: str, audio: bytes | None) -> int:
+    """Default delivery: records nothing and reports the channel's roster size.
+
+    Stands in for the paging/voice gateway, which is not part of this tree.
+    """
+    return CHANNEL_RECIPIENTS.get(channel, 1)
+
+
+class Channel:
+    """Delivery queue and worker thread for one broadcast channel.
+
+    Args:
+        name: Channel name, passed to ``deliver``.
+        deliver: ``deliver(channel, message, severity, audio) -> recipients``; raises on
+            failure. ``audio`` is None if the clip could not be synthesized.
+        synthesize: ``synthesize(message) -> PCM audio`` for each delivery.
+        bucket: Rate limit for deliveries.
+        window: Seconds after a delivery during which new alerts are coalesced.
+        max_retries: Retries of a failed delivery before it is given up.
+        backoff: Delay before the first retry; doubles for each further one.
+        max_pending: Alerts held before further ones are only counted.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        deliver: Callable[[str, str, str, bytes | None], int],
+        synthesize: Callable[[str], bytes],
+        bucket: TokenBucket,
+        window: float,
+        max_retries: int,
+        backoff: float,
+        max_pending: int,
+    ):
+        self.name = name
+        self.deliver = deliver
+        self.synthesize = synthesize
+        self.bucket = bucket
+        self.window = window
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_pending = max_pending
+        self.history: deque[dict] = deque(maxlen=100)
+        self._pending: list[Alert] = []
+        self._dropped = 0  # alerts over max_pending, counted into the next digest
+        self._busy = False
+        self._closed = False
+        self._last_sent = float("-inf")
+        self._cond = threading.Condition()
+        self._stats = Counter()
+        self._worker = threading.Thread(
+            target=self._run, name=f"novaops-broadcast-{name}", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, alert: Alert) -> bool:
+        """Queue ``alert``; returns False if it was only counted because the queue is full."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"Channel {self.name} is closed")
+            self._stats["submitted"] += 1
+            queued = len(self._pending) < self.max_pending
+            if queued:
+                self._pending.append(alert)
+            else:
+                self._dropped += 1
+                self._stats["dropped"] += 1
+            self._cond.notify_all()
+            return queued
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+                # Hold alerts that follow a delivery closely, so they go out as one digest.
+                hold_until = self._last_sent + self.window
+                while not self._closed and (wait := hold_until - time.monotonic()) > 0:
+                    self._cond.wait(wait)
+                while not self._closed and (wait := self.bucket.take()) > 0:
+                    self._stats["throttled"] += 1
+                    self._cond.wait(wait)
+                batch, self._pending = self._pending, []
+                dropped, self._dropped = self._dropped, 0
+                self._busy = True
+            try:
+                self._send(batch, dropped)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._last_sent = time.monotonic()
+                    self._cond.notify_all()
+
+    def _send(self, batch: list[Alert], dropped: int) -> None:
+        if len(batch) == 1 and not dropped:
+            message, severity = batch[0].message, batch[0].severity
+        else:
+            message = digest(batch, dropped)
+            severity = max((a.severity for a in batch), key=SEVERITIES.index)
+        try:
+            audio = self.synthesize(message)
+        except Exception:
+            # The page still goes out, as text only.
+            audio = None
+            self._stats["synthesis_failed"] += 1
+        for attempt in range(self.max_retries + 1):
+            try:
+                recipients = self.deliver(self.name, message, severity, audio)
+                break
+            except Exception:
+                if attempt == self.max_retries:
+                    self._stats["failed"] += len(batch) + dropped
+                    return
+                self._stats["retries"] += 1
+                time.sleep(self.backoff * 2**attempt)
+        self._stats["deliveries"] += 1
+        self._stats["alerts_delivered"] += len(batch) + dropped
+        if len(batch) + dropped > 1:
+            self._stats["digests"] += 1
+            self._stats["coalesced"] += len(batch) + dropped - 1
+        self.history.append(
+            {
+                "message": message,
+                "severity": severity,
+                "alerts": len(batch) + dropped,
+                "broadcast_ids": [a.broadcast_id for a in batch],
+                "recipients": recipients,
+                "audio_seconds": round(len(audio or b"") / SAMPLE_WIDTH / SAMPLE_RATE, 2),
+                "latency_ms": round((time.monotonic() - batch[0].submitted) * 1000, 1),
+            }
+        )
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until everything queued has been delivered (or given up); False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout: float | None = None) -> None:
+        """Deliver what is queued without further holding or throttling, then stop."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join(timeout)
+
+    def stats(self) -> dict:
+        """Return queue depth and delivery counters."""
+        with self._cond:
+            counters = ("submitted", "deliveries", "alerts_delivered", "digests", "coalesced",
+                        "throttled", "retries", "failed", "dropped", "synthesis_failed")
+            return {"pending": len(self._pending), **{name: self._stats[name] for name in counters}}
+
+
+class BroadcastDispatcher:
+    """Fans voice alerts out to their severity's channels without blocking the caller.
+
+    Args:
+        deliver: ``deliver(channel, message, severity, audio) -> recipients``; defaults to
+            :func:`log_delivery`.
+        synthesize: ``synthesize(message) -> PCM audio``; defaults to :func:`speak`.
+        rates: ``(per second, burst)`` per channel; defaults to :data:`CHANNEL_RATES`.
+        window: Coalescing window in seconds; defaults to ``NOVAOPS_ALERT_WINDOW`` (10).
+        max_retries: Retries of a failed delivery.
+        backoff: Delay before the first retry, in seconds.
+        max_pending: Alerts queued per channel before further ones are only counted.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[str, str, str, bytes | None], int] | None = None,
+        synthesize: Callable[[str], bytes] | None = None,
+        rates: dict[str, tuple[float, int]] | None = None,
+        window: float | None = None,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_pending: int = 1000,
+    ):
+        self.deliver = deliver or log_delivery
+        self.synthesize = synthesize or speak
+        self.rates = {**CHANNEL_RATES, **(rates or {})}
+        self.window = float(os.getenv("NOVAOPS_ALERT_WINDOW", "10")) if window is None else window
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_pending = max_pending
+        self._channels: dict[str, Channel] = {}
+        self._lock = threading.Lock()
+
+    def channel(self, name: str) -> Channel:
+        """Return the queue for channel ``name``, starting it on first use."""
+        with self._lock:
+            channel = self._channels.get(name)
+            if channel is None:
+                rate, burst = self.rates.get(name, (1.0, 1))
+                channel = self._channels[name] = Channel(
+                    name, self.deliver, self.synthesize, TokenBucket(rate, burst), self.window,
+                    self.max_retries, self.backoff, self.max_pending,
+                )
+            return channel
+
+    def submit(self, message: str, severity: str, audio_ref: str | None = None) -> dict:
+        """Queue an alert on every channel for ``severity``; returns at once.
+
+        Returns:
+            The broadcast ID, the channels it was queued on, and any channels
+            whose queue was full (the alert is still counted in their next digest).
+        """
+        severity = severity if severity in SEVERITY_CHANNELS else "info"
+        alert = Alert(f"BC-{uuid.uuid4().hex[:8].upper()}", message, severity, audio_ref)
+        channels = SEVERITY_CHANNELS[severity]
+        overflowing = [name for name in channels if not self.channel(name).submit(alert)]
+        return {
+            "broadcast_id": alert.broadcast_id,
+            "channels": list(channels),
+            "overflowing": overflowing,
+        }
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every channel has delivered what is queued; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            channels = list(self._channels.values())
+        return all(
+            channel.flush(None if deadline is None else max(deadline - time.monotonic(), 0))
+            for channel in channels
+        )
+
+    def close(self, timeout: float | None = None) -> None:
+        """Deliver what is queued on every channel and stop the workers."""
+        with self._lock:
+            channels, self._channels = list(self._channels.values()), {}
+        for channel in channels:
+            channel.close(timeout)
+
+    def stats(self) -> dict[str, dict]:
+        """Return per-channel queue depth and delivery counters."""
+        with self._lock:
+            channels = dict(self._channels)
+        return {name: channel.stats() for name, channel in sorted(channels.items())}
+
+
+_dispatcher: BroadcastDispatcher | None = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher() -> BroadcastDispatcher:
+    """Return the shared dispatcher used by ``voice_alert``."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = BroadcastDispatcher()
+        return _dispatcher
+
+
+@atexit.register
+def _close_dispatcher() -> None:
+    if _dispatcher is not None:
+        _dispatcher.close(timeout=5)
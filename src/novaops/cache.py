@@ -0,0 +1,240 @@
+"""TTL- and size-bounded response cache for idempotent tool calls.
+
+Read-only tools are wrapped with :func:`cached`. The cache key is built from
+the tool's bound arguments, with defaults applied and strings normalised, so
+``search_incidents(query="API  timeout ")`` and
+``search_incidents(query="api timeout")`` share an entry. Every entry carries
+tags (e.g. ``"dashboard"`` or ``"incident:INC-001"``). Write tools call
+:func:`invalidate` with the tags they affect. A result computed while one of
+its tags was invalidated is returned but not stored, since it may predate
+the write.
+
+Set ``NOVAOPS_CACHE=0`` to disable caching entirely.
+"""
+
+import copy
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+
+_caches: dict[str, "TTLCache"] = {}
+
+
+def caching_enabled() -> bool:
+    """Return False when caching is switched off with ``NOVAOPS_CACHE=0``."""
+    return os.getenv("NOVAOPS_CACHE", "1").lower() not in ("0", "false", "off")
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after ``ttl`` seconds.
+
+    Args:
+        name: Name used in :func:`cache_stats`.
+        maxsize: Maximum number of live entries; the least recently used is evicted.
+        ttl: Seconds an entry stays valid.
+        clock: Monotonic time source (overridable in tests).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 256,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, object, frozenset[str]]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._generations: dict[str, int] = {}  # tag -> times invalidated
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def get(self, key: str) -> tuple[bool, object]:
+        """Return ``(True, value)`` on a live hit, else ``(False, None)``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                self._drop(key)
+            self.misses += 1
+            return False, None
+
+    def generation(self, tags: Iterable[str]) -> dict[str, int]:
+        """Return how often each of ``tags`` has been invalidated, to pass to :meth:`set`."""
+        with self._lock:
+            return {tag: self._generations.get(tag, 0) for tag in tags}
+
+    def set(
+        self,
+        key: str,
+        value: object,
+        tags: Iterable[str] = (),
+        generation: dict[str, int] | None = None,
+    ) -> bool:
+        """Store ``value`` under ``key`` with the given invalidation tags.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            tags: Invalidation tags of the entry.
+            generation: What :meth:`generation` returned before ``value`` was
+                computed; the value is not stored if any of those tags has
+                been invalidated since.
+
+        Returns:
+            Whether the value was stored.
+        """
+        tags = frozenset(tags)
+        with self._lock:
+            if generation is not None and any(
+                self._generations.get(tag, 0) != count for tag, count in generation.items()
+            ):
+                return False
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (self._clock() + self.ttl, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+            return True
+
+    def invalidate(self, tag: str) -> int:
+        """Drop every entry carrying ``tag`` and return how many were dropped."""
+        with self._lock:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            keys = list(self._tags.get(tag, ()))
+            for key in keys:
+                self._drop(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def stats(self) -> dict:
+        """Return size and hit/miss/eviction/invalidation counters."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+def register_cache(cache: TTLCache) -> TTLCache:
+    """Make ``cache`` visible to :func:`invalidate`, :func:`clear_caches` and :func:`cache_stats`."""
+    _caches[cache.name] = cache
+    return cache
+
+
+def _normalize(value: object, casefold: bool) -> object:
+    if isinstance(value, str):
+        value = " ".join(value.split())
+        return value.casefold() if casefold else value
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v, casefold) for v in value]
+    return value
+
+
+def cache_key(name: str, arguments: dict, casefold: Iterable[str] = ()) -> str:
+    """Build a normalised cache key from a call's arguments."""
+    casefold = set(casefold)
+    params = {k: _normalize(v, k in casefold) for k, v in arguments.items()}
+    return json.dumps([name, params], sort_keys=True, default=str)
+
+
+def cached(
+    ttl: float,
+    maxsize: int = 256,
+    tags: Callable[[dict], Iterable[str]] | None = None,
+    casefold: Iterable[str] = (),
+):
+    """Cache a read-only function's results by its normalised arguments.
+
+    Apply it underneath ``@tool`` so that both agent and direct calls are cached.
+    Results are deep-copied in and out of the cache so callers cannot mutate
+    cached state.
+
+    Args:
+        ttl: Seconds a result stays valid.
+        maxsize: Maximum number of cached results.
+        tags: Maps the bound arguments to the entry's invalidation tags.
+        casefold: Argument names whose string values are compared case-insensitively.
+    """
+    casefold = tuple(casefold)
+
+    def decorate(func):
+        cache = register_cache(TTLCache(func.__name__, maxsize=maxsize, ttl=ttl))
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not caching_enabled():
+                return func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = cache_key(func.__name__, bound.arguments, casefold)
+            hit, value = cache.get(key)
+            if hit:
+                return copy.deepcopy(value)
+            entry_tags = tuple(tags(bound.arguments)) if tags else ()
+            generation = cache.generation(entry_tags)
+            value = func(*args, **kwargs)
+            cache.set(key, copy.deepcopy(value), entry_tags, generation)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorate
+
+
+def invalidate(*tags: str) -> int:
+    """Drop entries carrying any of ``tags`` from every registered cache."""
+    return sum(cache.invalidate(tag) for cache in list(_caches.values()) for tag in tags)
+
+
+def clear_caches() -> None:
+    """Empty every registered cache."""
+    for cache in list(_caches.values()):
+        cache.clear()
+
+
+def cache_stats() -> dict[str, dict]:
+    """Return hit/miss counters for every registered cache, keyed by cache name."""
+    return {name: cache.stats() for name, cache in sorted(_caches.items())}
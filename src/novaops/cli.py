@@ -39,8 +39,8 @@ def print_help():
 NovaOps — AI-powered DevOps command center
 
 Usage:
-  novaops run                              Start the Commander Agent interactive session
-  novaops health                           Run a quick infrastructure health check
+  novaops run [--no-stream] [--session ID] Start (or resume) a Commander Agent interactive session
+  novaops health [service ...]             Run a concurrent infrastructure health check
   novaops incident <title> [severity]      Create a new incident (severity: low/medium/high/critical)
   novaops analyze <query>                  Search incident history for similar incidents
   novaops dashboard                        Show current dashboard state
@@ -50,6 +50,8 @@ Usage:
 Examples:
   uv run novaops run
   uv run novaops health
+  NOVAOPS_SERVICES=api,auth,billing uv run novaops health
+  NOVAOPS_TRACING=1 NOVAOPS_METRICS_PORT=9464 uv run novaops run
   uv run novaops incident "API gateway timeout" high
   uv run novaops analyze "database replication lag"
   uv run novaops dashboard
@@ -60,10 +62,24 @@ Examples:
 
 def run_commander():
     """Start an interactive session with the Commander Agent."""
-    from novaops.agents.commander import commander_agent
+    import json
+    import uuid
+    from novaops.memory import get_session_agent
+    from novaops.router import get_router
+    from novaops.streaming import stream_response
+    from novaops.tracing import traced_call
+
+    args = sys.argv[2:]
+    streaming = "--no-stream" not in args
+    session_id = args[args.index("--session") + 1] if "--session" in args[:-1] else str(uuid.uuid4())
+    _start_metrics_server()
+    _start_event_server()
 
     print("🚀 NovaOps Commander starting...")
-    print("Type your commands (Ctrl+C to exit):\n")
+    commander_agent = get_session_agent(session_id)
+    router = get_router()
+    print(f"Session: {session_id}")
+    print("Type your commands (Ctrl+C to cancel a request, Ctrl+C at the prompt to exit):\n")
 
     try:
         while True:
@@ -73,24 +89,87 @@ def run_commander():
             if user_input.lower() in ("exit", "quit"):
                 print("👋 NovaOps Commander shutting down.")
                 break
-            response = commander_agent(user_input)
-            print(f"\n{response}\n")
+            if not streaming:
+                routed = router.handle(commander_agent, user_input, traced_call)
+                output = routed.output
+                if routed.route.tier == "fast":
+                    output = json.dumps(output, indent=2, default=str)
+                print(f"\n{output}\n  ⚡ {routed.route.tier} — {routed.latency_ms / 1000:.2f}s\n")
+                continue
+
+            print()
+            try:
+                routed = router.handle(commander_agent, user_input, stream_response)
+            except Exception as exc:
+                print(f"\n❌ Request failed: {exc}\n")
+                continue
+            if routed.route.tier == "fast":
+                print(json.dumps(routed.output, indent=2, default=str))
+                print(f"\n  ⚡ fast path ({routed.route.tool}) — {routed.latency_ms / 1000:.2f}s\n")
+                continue
+            stats = routed.output
+            ttft = f"{stats['ttft_ms'] / 1000:.2f}s" if stats["ttft_ms"] is not None else "n/a"
+            status = "cancelled" if stats["cancelled"] else "done"
+            print(
+                f"\n\n  ⏱  {status} on {routed.route.tier} — first token {ttft}, "
+                f"total {stats['total_ms'] / 1000:.2f}s\n"
+            )
     except (KeyboardInterrupt, EOFError):
         print("\n👋 NovaOps Commander shutting down.")
 
 
+def _start_metrics_server():
+    """Serve trace metrics locally when NOVAOPS_TRACING=1 and NOVAOPS_METRICS_PORT are set."""
+    import os
+    from novaops.tracing import serve_metrics, tracing_enabled
+
+    port = os.getenv("NOVAOPS_METRICS_PORT")
+    if tracing_enabled() and port:
+        serve_metrics(int(port))
+        print(f"📈 Trace metrics at http://127.0.0.1:{port}/metrics (spans at /spans)")
+
+
+def _start_event_server():
+    """Stream dashboard change events locally when NOVAOPS_EVENTS_PORT is set."""
+    import os
+    from novaops.events import serve_events
+
+    port = os.getenv("NOVAOPS_EVENTS_PORT")
+    if port:
+        serve_events(int(port))
+        print(f"📡 Dashboard events at http://127.0.0.1:{port}/events")
+
+
 def run_health_check():
-    """Run a quick health check across all default services."""
-    from novaops.tools.infra import check_health
+    """Run a concurrent health check across the service inventory."""
+    import os
+    import time
+    from novaops.health import (
+        DEFAULT_CONCURRENCY,
+        DEFAULT_TIMEOUT,
+        load_service_inventory,
+        run_health_checks,
+    )
 
-    services = ["api", "database", "cache", "queue"]
-    print("🔍 Running infrastructure health check...\n")
+    services = load_service_inventory(sys.argv[2:])
+    timeout = float(os.getenv("NOVAOPS_HEALTH_TIMEOUT", DEFAULT_TIMEOUT))
+    concurrency = int(os.getenv("NOVAOPS_HEALTH_CONCURRENCY", DEFAULT_CONCURRENCY))
+    print(f"🔍 Running infrastructure health check ({len(services)} services)...\n")
 
-    for svc in services:
-        result = check_health(service=svc)
+    def print_result(result):
         status_icon = "✅" if result["status"] == "healthy" else "⚠️" if result["status"] == "degraded" else "❌"
-        print(f"  {status_icon} {result['service']:12s} — {result['status']:10s} (uptime: {result['uptime_hours']}h)")
-
+        detail = f"uptime: {result['uptime_hours']}h" if result.get("uptime_hours") is not None else result.get("error", "")
+        print(f"  {status_icon} {result['service']:12s} — {result['status']:10s} ({detail})", flush=True)
+
+    started = time.perf_counter()
+    results = run_health_checks(services, on_result=print_result, timeout=timeout, concurrency=concurrency)
+    elapsed = time.perf_counter() - started
+
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+    print(f"\n  {len(results)} services checked in {elapsed:.2f}s ({summary})")
     print("\nDone.")
 
 
@@ -164,6 +243,7 @@ def run_dashboard():
 
 def run_voice_alert():
     """Broadcast a voice alert."""
+    from novaops.broadcast import get_dispatcher
     from novaops.tools.voice import voice_alert
 
     if len(sys.argv) < 3:
@@ -180,7 +260,8 @@ def run_voice_alert():
     print(f"  Message:    {result['message']}")
     print(f"  Severity:   {result['severity']}")
     print(f"  Channels:   {', '.join(result['channels'])}")
-    print(f"  Status:     {result['broadcast_status']}")
+    delivered = get_dispatcher().flush(timeout=30)
+    print(f"  Status:     {'delivered' if delivered else result['broadcast_status']}")
     print(f"  Recipients: {result['recipients_count']}")
     print("\nDone.")
 
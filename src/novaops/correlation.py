@@ -0,0 +1,366 @@
+"""Alert deduplication and correlation in front of incident creation.
+
+During a cascade every symptom fires its own alert. Rather than opening one
+incident per alert, :class:`AlertCorrelator` folds each alert into an open
+incident when it belongs to the same problem, and records it there as a
+linked child alert. Only alerts that match nothing open a new incident.
+
+Matching is done in two stages, both bounded by a time window:
+
+1. An exact fingerprint (service plus the alert title with numbers masked) is
+   looked up in a hash index, so repeats of the same alert cost one dict
+   lookup and are never embedded.
+2. Otherwise the alert is embedded and scored against the centroids of the
+   recently active groups with a single matrix-vector product. The score is
+   the cosine similarity plus a bonus when the group already covers the same
+   service or a service it depends on (e.g. ``api`` on ``database``).
+
+Groups are kept in last-seen order, so expiring the ones that fall out of the
+window only ever touches the front of the queue.
+
+The correlator's lock only covers its own index. Alerts are embedded, and
+incidents opened and updated, outside it: a new group is reserved under the
+lock before its incident exists, and alerts that join it meanwhile wait for
+the incident ID rather than opening a second one.
+"""
+
+import itertools
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+
+import numpy as np
+
+from novaops.embeddings import embed_text
+
+# Which services each service calls; alerts on either end of an edge are related.
+SERVICE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "api": ("database", "cache", "queue"),
+    "queue": ("database",),
+}
+
+_SEVERITY_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+_CLOSED_STATUSES = ("resolved", "closed")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+
+def fingerprint(service: str, title: str) -> tuple[str, str]:
+    """Key under which repeats of the same alert collapse (numbers are masked)."""
+    return service.lower(), _NUMBER_RE.sub("#", title.lower()).strip()
+
+
+def _related(dependencies: dict[str, tuple[str, ...]]) -> dict[str, frozenset[str]]:
+    related: dict[str, set[str]] = {}
+    for service, callees in dependencies.items():
+        for callee in callees:
+            related.setdefault(service, set()).add(callee)
+            related.setdefault(callee, set()).add(service)
+    return {service: frozenset(others) for service, others in related.items()}
+
+
+class _Group:
+    """Alerts folded into one incident."""
+
+    __slots__ = ("incident_id", "services", "severity", "vector_sum", "centroid",
+                 "fingerprints", "alerts", "count", "last_seen", "ready", "write_lock",
+                 "written_services", "written_severity")
+
+    def __init__(self, severity: str, vector: np.ndarray):
+        self.incident_id: str | None = None  # set once the incident is opened
+        self.services: dict[str, None] = {}
+        self.severity = severity
+        self.vector_sum = vector.astype(np.float32)
+        self.centroid = vector
+        self.fingerprints: list[tuple[str, str]] = []
+        self.alerts: list[dict] = []
+        self.count = 0
+        self.last_seen = 0.0
+        self.ready = threading.Event()  # set once the incident is opened, or failed to open
+        self.write_lock = threading.Lock()
+        self.written_services = 0
+        self.written_severity = severity
+
+
+class AlertCorrelator:
+    """Groups incoming alerts into incidents by service, time window and similarity.
+
+    Args:
+        window: Seconds after its last alert during which a group still
+            accepts new alerts.
+        threshold: Minimum score (cosine similarity plus service bonus) for
+            an alert to join an existing group.
+        same_service_bonus: Added to the score when the group already has
+            alerts from the alert's service.
+        related_bonus: Added to the score when the group has alerts from a
+            service related to the alert's service in ``dependencies``.
+        dependencies: Service call graph; defaults to ``SERVICE_DEPENDENCIES``.
+        max_candidates: Most recently active groups scored per alert.
+        max_alerts: Child alerts kept per incident (the count is not capped).
+        create: Opens an incident for a new group and returns its ID.
+        update: Applies fields to an existing incident.
+        status: Returns an incident's status, or None if it no longer exists.
+    """
+
+    def __init__(
+        self,
+        window: float = 600.0,
+        threshold: float = 0.45,
+        same_service_bonus: float = 0.3,
+        related_bonus: float = 0.25,
+        dependencies: dict[str, tuple[str, ...]] | None = None,
+        max_candidates: int = 256,
+        max_alerts: int = 200,
+        create: Callable[[dict], str] | None = None,
+        update: Callable[..., object] | None = None,
+        status: Callable[[str], str | None] | None = None,
+    ):
+        self.window = window
+        self.threshold = threshold
+        self.same_service_bonus = same_service_bonus
+        self.related_bonus = related_bonus
+        self.max_candidates = max_candidates
+        self.max_alerts = max_alerts
+        self._related = _related(SERVICE_DEPENDENCIES if dependencies is None else dependencies)
+        self._create = create or _create_incident
+        self._update = update or _update_incident
+        self._status = status or _incident_status
+        # Open groups, least recently alerted first, and those with an incident by its ID.
+        self._groups: OrderedDict[_Group, None] = OrderedDict()
+        self._by_incident: dict[str, _Group] = {}
+        self._by_fingerprint: dict[tuple[str, str], _Group] = {}
+        self._lock = threading.RLock()
+        self.alerts = 0
+        self.deduplicated = 0
+        self.correlated = 0
+        self.incidents = 0
+
+    def submit(
+        self,
+        service: str,
+        title: str,
+        severity: str = "medium",
+        description: str = "",
+        timestamp: float | None = None,
+    ) -> dict:
+        """Correlate one alert, opening a new incident only if it matches none.
+
+        Returns:
+            The child alert record, including the ``incident_id`` it was
+            linked to and ``match`` — ``"fingerprint"``, ``"similar"`` or
+            ``"new"``.
+        """
+        now = time.time() if timestamp is None else timestamp
+        if severity not in _SEVERITY_RANK:
+            severity = "medium"
+        alert = {
+            "alert_id": f"ALR-{uuid.uuid4().hex[:8].upper()}",
+            "service": service,
+            "title": title,
+            "severity": severity,
+            "description": description,
+            "timestamp": now,
+        }
+        key = fingerprint(service, title)
+        with self._lock:
+            self.alerts += 1
+        vector = None
+        while True:
+            with self._lock:
+                self._expire(now)
+                group = self._place(key, alert, vector)
+            if group is None:
+                # Not a repeat of an open alert: embed it outside the lock and look again.
+                vector = embed_text(f"{title} {description}")
+                continue
+            if alert["match"] == "new":
+                self._open_incident(group, alert)
+            else:
+                group.ready.wait()
+            if group.incident_id is not None:
+                break
+            # The group's incident failed to open and the group was dropped; place the alert again.
+        self._write(group, alert)
+        return alert
+
+    def _place(self, key: tuple[str, str], alert: dict, vector: np.ndarray | None) -> _Group | None:
+        """Add ``alert`` to its group, reserving a new one if it matches none.
+
+        Returns None if the alert is not a repeat and ``vector`` is still needed to match it.
+        """
+        group = self._open_group(self._by_fingerprint.get(key))
+        if group is not None:
+            alert["match"] = "fingerprint"
+        elif vector is None:
+            return None
+        else:
+            group = self._best_match(alert["service"], vector)
+            if group is not None:
+                alert["match"] = "similar"
+                group.vector_sum += vector
+                norm = np.linalg.norm(group.vector_sum)
+                group.centroid = group.vector_sum / norm if norm else group.vector_sum
+            else:
+                alert["match"] = "new"
+                group = _Group(alert["severity"], vector)
+                self._groups[group] = None
+            group.fingerprints.append(key)
+            self._by_fingerprint[key] = group
+        self._link(group, alert)
+        return group
+
+    def _open_group(self, group: _Group | None) -> _Group | None:
+        """Return ``group`` unless its incident has since been resolved, closed or removed."""
+        if group is None or group.incident_id is None:
+            return group
+        if self._status(group.incident_id) in (None, *_CLOSED_STATUSES):
+            self._drop(group)
+            return None
+        return group
+
+    def _best_match(self, service: str, vector: np.ndarray) -> _Group | None:
+        candidates = list(itertools.islice(reversed(self._groups), self.max_candidates))
+        if not candidates:
+            return None
+        scores = np.stack([g.centroid for g in candidates]) @ vector
+        related = self._related.get(service, frozenset())
+        for i, group in enumerate(candidates):
+            if service in group.services:
+                scores[i] += self.same_service_bonus
+            elif not related.isdisjoint(group.services):
+                scores[i] += self.related_bonus
+        # Try the best candidates first; skip any whose incident was closed meanwhile.
+        for i in np.argsort(-scores):
+            if scores[i] < self.threshold:
+                return None
+            group = self._open_group(candidates[i])
+            if group is not None:
+                return group
+        return None
+
+    def _open_incident(self, group: _Group, alert: dict) -> None:
+        """Open the incident for a newly reserved group, then let alerts waiting on it through."""
+        try:
+            incident_id = self._create(alert)
+        except BaseException:
+            with self._lock:
+                self._drop(group)
+            group.ready.set()
+            raise
+        with self._lock:
+            group.incident_id = incident_id
+            if group in self._groups:
+                self._by_incident[incident_id] = group
+            self.incidents += 1
+        group.ready.set()
+
+    def _link(self, group: _Group, alert: dict) -> None:
+        group.count += 1
+        group.last_seen = max(group.last_seen, alert["timestamp"])
+        if len(group.alerts) < self.max_alerts:
+            group.alerts.append(alert)
+        self._groups.move_to_end(group)
+        group.services.setdefault(alert["service"], None)
+        if _SEVERITY_RANK[alert["severity"]] > _SEVERITY_RANK[group.severity]:
+            group.severity = alert["severity"]
+
+    def _write(self, group: _Group, alert: dict) -> None:
+        """Bring the group's incident up to date with the alerts linked to it so far.
+
+        Writes for one group are serialized and each reads the group's current
+        state, so a slow write never overwrites a newer count or severity.
+        """
+        with group.write_lock:
+            with self._lock:
+                alert["incident_id"] = group.incident_id
+                if alert["match"] == "fingerprint":
+                    self.deduplicated += 1
+                elif alert["match"] == "similar":
+                    self.correlated += 1
+                services, severity = len(group.services), group.severity
+                fields = {"alert_count": group.count}
+                if services != group.written_services:
+                    fields["affected_services"] = list(group.services)
+                if severity != group.written_severity:
+                    fields["severity"] = severity
+            self._update(group.incident_id, **fields)
+            group.written_services, group.written_severity = services, severity
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._groups:
+            group = next(iter(self._groups))
+            if group.last_seen >= cutoff:
+                break
+            self._drop(group)
+
+    def _drop(self, group: _Group) -> None:
+        self._groups.pop(group, None)
+        if group.incident_id is not None:
+            self._by_incident.pop(group.incident_id, None)
+        for key in group.fingerprints:
+            if self._by_fingerprint.get(key) is group:
+                del self._by_fingerprint[key]
+
+    def get_alerts(self, incident_id: str) -> list[dict]:
+        """Return the child alerts linked to an incident still in the window."""
+        with self._lock:
+            group = self._by_incident.get(incident_id)
+            return [] if group is None else [dict(a) for a in group.alerts]
+
+    def stats(self) -> dict:
+        """Return counts of alerts seen, deduplicated, correlated and incidents opened."""
+        with self._lock:
+            return {
+                "alerts": self.alerts,
+                "deduplicated": self.deduplicated,
+                "correlated": self.correlated,
+                "incidents": self.incidents,
+                "open_groups": len(self._groups),
+            }
+
+    def clear(self) -> None:
+        """Forget every open group."""
+        with self._lock:
+            self._groups.clear()
+            self._by_incident.clear()
+            self._by_fingerprint.clear()
+
+
+def _create_incident(alert: dict) -> str:
+    from novaops.tools.dashboard import create_incident
+
+    incident = create_incident(
+        title=alert["title"], severity=alert["severity"], description=alert["description"]
+    )
+    return incident["incident_id"]
+
+
+def _update_incident(incident_id: str, **fields) -> None:
+    from novaops.cache import invalidate
+    from novaops.tools.dashboard import _incident_store
+
+    if _incident_store.update(incident_id, **fields) is not None:
+        invalidate("dashboard", f"incident:{incident_id}", "agents")
+
+
+def _incident_status(incident_id: str) -> str | None:
+    from novaops.tools.dashboard import _incident_store
+
+    incident = _incident_store.get(incident_id)
+    return None if incident is None else incident["status"]
+
+
+_correlator: AlertCorrelator | None = None
+_correlator_lock = threading.Lock()
+
+
+def get_correlator() -> AlertCorrelator:
+    """Return the shared correlator used by the dashboard tools."""
+    global _correlator
+    with _correlator_lock:
+        if _correlator is None:
+            _correlator = AlertCorrelator()
+        return _correlator
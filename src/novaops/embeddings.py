@@ -0,0 +1,188 @@
+"""Deterministic mock embeddings — stands in for the Amazon Nova Embeddings API.
+
+Each token maps to a fixed pseudo-random direction derived from its SHA-256
+hash, and a text embeds to the normalised sum of its token directions. Texts
+that share vocabulary therefore land close together in cosine space, which is
+what the incident index needs, while the output stays fully reproducible.
+
+Batch requests go through :func:`embed_texts`, which serves repeated texts
+from a content-addressed cache keyed by the SHA-256 of the text.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+
+EMBEDDING_MODEL = "amazon.nova-embed-v1"
+EMBEDDING_DIM = 256
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset(
+    {"a", "an", "and", "at", "by", "for", "in", "is", "of", "on", "or", "the", "to", "was", "with"}
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric tokens, dropping stop words."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOP_WORDS]
+
+
+@lru_cache(maxsize=65536)
+def _token_vector(token: str) -> np.ndarray:
+    """Return the fixed unit direction for a single token."""
+    seed = int.from_bytes(hashlib.sha256(token.encode()).digest()[:8], "little")
+    vec = np.random.default_rng(seed).standard_normal(EMBEDDING_DIM).astype(np.float32)
+    vec /= np.linalg.norm(vec)
+    vec.setflags(write=False)
+    return vec
+
+
+def _compute(texts: Sequence[str]) -> np.ndarray:
+    """Embed ``texts`` without consulting the cache."""
+    # Texts without any usable token still get a stable vector of their own.
+    token_lists = [tokenize(text) or [text] for text in texts]
+    vocab: dict[str, int] = {}
+    flat = [vocab.setdefault(t, len(vocab)) for tokens in token_lists for t in tokens]
+    token_matrix = np.vstack([_token_vector(t) for t in vocab])
+    offsets = np.cumsum([0] + [len(tokens) for tokens in token_lists[:-1]])
+    sums = np.add.reduceat(token_matrix[flat], offsets, axis=0)
+    norms = np.linalg.norm(sums, axis=1, keepdims=True)
+    return np.divide(sums, norms, out=sums, where=norms > 0)
+
+
+def text_key(text: str) -> str:
+    """Return the content address (SHA-256 hex digest) of a text."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class EmbeddingCache:
+    """Content-addressed embedding cache: in-memory LRU with optional disk spill.
+
+    Entries are keyed by the SHA-256 of the text. When ``cache_dir`` is set,
+    every computed vector is also written there as ``<key>.npy`` so that later
+    processes (e.g. an index rebuild after restart) skip recomputation.
+    """
+
+    def __init__(self, maxsize: int = 10_000, cache_dir: str | None = None):
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.npy")
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Return the cached vector for ``key``, or None on a miss."""
+        with self._lock:
+            vec = self._entries.get(key)
+            if vec is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return vec
+        if self.cache_dir and os.path.exists(self._path(key)):
+            vec = np.load(self._path(key), allow_pickle=False)
+            self._remember(key, vec)
+            with self._lock:
+                self.hits += 1
+            return vec
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, vec: np.ndarray) -> None:
+        """Store ``vec`` under ``key`` in memory and, if configured, on disk."""
+        vec.setflags(write=False)
+        self._remember(key, vec)
+        if self.cache_dir:
+            tmp = self._path(key) + f".{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, vec, allow_pickle=False)
+            os.replace(tmp, self._path(key))
+
+    def _remember(self, key: str, vec: np.ndarray) -> None:
+        with self._lock:
+            self._entries[key] = vec
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Return cache size and hit/miss counters."""
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_cache = EmbeddingCache(cache_dir=os.getenv("NOVAOPS_EMBEDDING_CACHE_DIR") or None)
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide embedding cache."""
+    return _cache
+
+
+def embed_texts(texts: Sequence[str], cache: EmbeddingCache | None = None) -> np.ndarray:
+    """Embed a batch of texts into one L2-normalised float32 matrix.
+
+    Cached texts are served from ``cache``; the remaining ones are embedded
+    together in a single vectorised pass and then added to the cache.
+
+    Args:
+        texts: The texts to embed.
+        cache: Cache to use. Defaults to the process-wide cache.
+
+    Returns:
+        A float32 array of shape ``(len(texts), EMBEDDING_DIM)``.
+    """
+    cache = _cache if cache is None else cache
+    out = np.empty((len(texts), EMBEDDING_DIM), dtype=np.float32)
+    pending: dict[str, list[int]] = {}
+    pending_texts: list[str] = []
+    for i, text in enumerate(texts):
+        key = text_key(text)
+        if key in pending:
+            pending[key].append(i)
+            continue
+        vec = cache.get(key)
+        if vec is None:
+            pending[key] = [i]
+            pending_texts.append(text)
+        else:
+            out[i] = vec
+    if pending_texts:
+        computed = _compute(pending_texts)
+        for (key, rows), vec in zip(pending.items(), computed):
+            out[rows] = vec
+            cache.put(key, vec.copy())
+    return out
+
+
+def embed_text(text: str) -> np.ndarray:
+    """Embed a single text into an L2-normalised float32 vector.
+
+    Args:
+        text: The text to embed.
+
+    Returns:
+        A float32 array of shape ``(EMBEDDING_DIM,)`` with unit norm.
+    """
+    return embed_texts([text])[0]
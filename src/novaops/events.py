@@ -0,0 +1,368 @@
+"""Change feed for the dashboard: incident, health and agent events as diffs.
+
+``get_dashboard_data`` rebuilds the whole dashboard state on every call, so a
+polling dashboard pays O(incidents) per refresh. The :class:`EventBus`
+instead publishes what changed, as it changes:
+
+- ``incident``: ``created`` (the full incident), ``updated`` (only the
+  changed fields) and ``cleared``, from the incident store.
+- ``health``: ``transition`` when a service's status differs from the last
+  one seen by ``check_health``.
+- ``agent``: ``activity`` when an agent starts or finishes an invocation or
+  calls a tool, from :class:`ActivityHooks`.
+
+Each :class:`Subscription` starts with a ``snapshot`` of the current state,
+then receives deltas, plus a fresh snapshot every ``snapshot_interval``
+seconds. A subscriber that falls ``max_queue`` events behind loses its
+backlog and is resynchronised with a snapshot instead. :func:`serve_events`
+streams a subscription as Server-Sent Events, standing in for the
+dashboard's push channel.
+
+``NOVAOPS_SNAPSHOT_INTERVAL`` sets the snapshot period (seconds) and
+``NOVAOPS_EVENTS_PORT`` the port the CLI serves events on.
+"""
+
+import json
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from strands.hooks import (
+    AfterInvocationEvent,
+    BeforeInvocationEvent,
+    BeforeToolCallEvent,
+    HookProvider,
+    HookRegistry,
+)
+
+TOPICS = ("incident", "health", "agent")
+
+
+@dataclass
+class Event:
+    """One change (or, for ``type == "snapshot"``, the whole state) on the bus."""
+
+    seq: int
+    topic: str
+    type: str
+    key: str | None
+    data: dict
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class Subscription:
+    """A subscriber's queue of events; read it with :meth:`get` or by iterating.
+
+    Args:
+        bus: The bus to subscribe to.
+        topics: Topics to receive; all of them by default.
+        snapshot_interval: Seconds between snapshots.
+        max_queue: Events held before the backlog is replaced by a snapshot.
+    """
+
+    def __init__(
+        self, bus: "EventBus", topics: Iterable[str], snapshot_interval: float, max_queue: int
+    ):
+        self.bus = bus
+        self.topics = frozenset(topics)
+        self.snapshot_interval = snapshot_interval
+        self.max_queue = max_queue
+        self.delivered = 0
+        self.resyncs = 0
+        self._queue: deque[Event] = deque()
+        self._next_snapshot = 0.0  # the first read is a snapshot
+        self._resync = False
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _offer(self, event: Event) -> None:
+        if event.topic not in self.topics:
+            return
+        with self._cond:
+            if len(self._queue) >= self.max_queue:
+                self._queue.clear()
+                self._resync = True
+                self.resyncs += 1
+            else:
+                self._queue.append(event)
+            self._cond.notify_all()
+
+    def get(self, timeout: float | None = None) -> Event | None:
+        """Return the next event, waiting up to ``timeout`` seconds; None on timeout or close."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                if self._resync or time.monotonic() >= self._next_snapshot:
+                    self._resync = False
+                    break
+                if self._queue:
+                    self.delivered += 1
+                    return self._queue.popleft()
+                wait = self._next_snapshot - time.monotonic()
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        return None
+                self._cond.wait(wait)
+        # Taken outside our lock (the bus offers events while holding its own).
+        snapshot = self.bus.snapshot(self.topics)
+        with self._cond:
+            # Queued events up to the snapshot are already part of it.
+            while self._queue and self._queue[0].seq <= snapshot.seq:
+                self._queue.popleft()
+            self._next_snapshot = time.monotonic() + self.snapshot_interval
+            self.delivered += 1
+        return snapshot
+
+    def __iter__(self) -> Iterator[Event]:
+        while (event := self.get()) is not None:
+            yield event
+
+    def close(self) -> None:
+        """Stop receiving events; blocked readers get None."""
+        self.bus.unsubscribe(self)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class EventBus:
+    """Publishes dashboard changes as diff events and keeps the state snapshots are cut from.
+
+    Args:
+        snapshot_interval: Default seconds between subscriber snapshots;
+            defaults to ``NOVAOPS_SNAPSHOT_INTERVAL`` (30).
+        max_queue: Default per-subscriber backlog before a resync.
+    """
+
+    def __init__(self, snapshot_interval: float | None = None, max_queue: int = 1000):
+        if snapshot_interval is None:
+            snapshot_interval = float(os.getenv("NOVAOPS_SNAPSHOT_INTERVAL", "30"))
+        self.snapshot_interval = snapshot_interval
+        self.max_queue = max_queue
+        self.published = 0
+        self._seq = 0
+        self._state: dict[str, dict[str, dict]] = {topic: {} for topic in TOPICS}
+        self._subscribers: list[Subscription] = []
+        self._lock = threading.Lock()
+
+    def _emit(self, topic: str, type: str, key: str | None, data: dict) -> Event:
+        self._seq += 1
+        self.published += 1
+        event = Event(self._seq, topic, type, key, data)
+        for subscriber in self._subscribers:
+            subscriber._offer(event)
+        return event
+
+    def _merge(self, topic: str, key: str, fields: dict, type: str | None = None) -> Event | None:
+        """Apply ``fields`` to ``key``'s state and publish what changed, if anything."""
+        with self._lock:
+            current = self._state[topic].get(key)
+            if current is None:
+                self._state[topic][key] = dict(fields)
+                return self._emit(topic, type or "created", key, dict(fields))
+            changes = {k: v for k, v in fields.items() if current.get(k, object()) != v}
+            if not changes:
+                return None
+            current.update(changes)
+            return self._emit(topic, type or "updated", key, changes)
+
+    def publish_incident(self, op: str, incident: dict | None = None) -> Event | None:
+        """Publish an incident store change (a listener for ``IncidentStore.subscribe``)."""
+        if op == "clear":
+            with self._lock:
+                self._state["incident"].clear()
+                return self._emit("incident", "cleared", None, {})
+        return self._merge("incident", incident["incident_id"], incident)
+
+    def watch_incidents(self, store) -> None:
+        """Load ``store``'s incidents into the bus state and publish its changes from now on."""
+        for incident in store.query():
+            self.publish_incident("add", incident)
+        store.subscribe(self.publish_incident)
+
+    def publish_health(self, service: str, status: str) -> Event | None:
+        """Publish a service's status if it differs from the last one seen."""
+        with self._lock:
+            current = self._state["health"].setdefault(service, {})
+            previous = current.get("status")
+            if previous == status:
+                return None
+            current["status"] = status
+            data = {"status": status, "previous": previous}
+            return self._emit("health", "transition", service, data)
+
+    def publish_agent(self, name: str, **fields: Any) -> Event | None:
+        """Publish changes to an agent's activity (``status``, ``last_action``)."""
+        return self._merge("agent", name, fields, type="activity")
+
+    def snapshot(self, topics: Iterable[str] = TOPICS) -> Event:
+        """Return the current state of ``topics`` as one ``snapshot`` event."""
+        with self._lock:
+            data = {
+                topic: {key: dict(value) for key, value in self._state[topic].items()}
+                for topic in TOPICS
+                if topic in topics
+            }
+            return Event(self._seq, "snapshot", "snapshot", None, data)
+
+    def subscribe(
+        self,
+        topics: Iterable[str] = TOPICS,
+        snapshot_interval: float | None = None,
+        max_queue: int | None = None,
+    ) -> Subscription:
+        """Start receiving events; the first one read is a snapshot."""
+        subscription = Subscription(
+            self,
+            topics,
+            self.snapshot_interval if snapshot_interval is None else snapshot_interval,
+            max_queue or self.max_queue,
+        )
+        with self._lock:
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def stats(self) -> dict:
+        """Return the event count, sequence number and subscriber backlogs."""
+        with self._lock:
+            return {
+                "published": self.published,
+                "seq": self._seq,
+                "subscribers": len(self._subscribers),
+                "backlogs": [len(s._queue) for s in self._subscribers],
+                "resyncs": sum(s.resyncs for s in self._subscribers),
+            }
+
+
+class ActivityHooks(HookProvider):
+    """Agent hooks that publish ``agent`` activity events.
+
+    Add to an agent with ``Agent(..., hooks=[ActivityHooks()])``. Agents are
+    tracked by name, and every session has its own agents under the same
+    names, so an agent is only published as ``idle`` once none of its
+    invocations is still running.
+
+    Args:
+        bus: Bus to publish on; defaults to :func:`get_event_bus`.
+    """
+
+    # Invocations in flight per bus and agent name, shared by every hooks instance.
+    _in_flight: "weakref.WeakKeyDictionary[EventBus, dict[str, int]]" = weakref.WeakKeyDictionary()
+    _in_flight_lock = threading.Lock()
+
+    def __init__(self, bus: EventBus | None = None):
+        self._bus = bus
+
+    @property
+    def bus(self) -> EventBus:
+        return self._bus or get_event_bus()
+
+    def register_hooks(self, registry: HookRegistry, **kwargs) -> None:
+        registry.add_callback(BeforeInvocationEvent, self._started)
+        registry.add_callback(BeforeToolCallEvent, self._tool)
+        registry.add_callback(AfterInvocationEvent, self._finished)
+
+    def _started(self, event: BeforeInvocationEvent) -> None:
+        bus, name = self.bus, event.agent.name
+        with self._in_flight_lock:
+            running = self._in_flight.setdefault(bus, {})
+            running[name] = running.get(name, 0) + 1
+            bus.publish_agent(name, status="active", last_action="thinking")
+
+    def _tool(self, event: BeforeToolCallEvent) -> None:
+        self.bus.publish_agent(event.agent.name, last_action=event.tool_use["name"])
+
+    def _finished(self, event: AfterInvocationEvent) -> None:
+        bus, name = self.bus, event.agent.name
+        with self._in_flight_lock:
+            running = self._in_flight.get(bus, {})
+            if running.get(name, 0) > 1:
+                running[name] -= 1
+                return
+            running.pop(name, None)
+            bus.publish_agent(name, status="idle")
+
+
+def format_sse(event: Event) -> str:
+    """Render an event as one Server-Sent Events message."""
+    data = json.dumps(event.to_dict(), default=str)
+    return f"id: {event.seq}\nevent: {event.type}\ndata: {data}\n\n"
+
+
+def sse_stream(subscription: Subscription, keepalive: float = 15.0) -> Iterator[str]:
+    """Yield a subscription as SSE messages, and a comment line after ``keepalive`` idle seconds."""
+    while True:
+        event = subscription.get(timeout=keepalive)
+        if event is not None:
+            yield format_sse(event)
+        elif subscription._closed:
+            return
+        else:
+            yield ": keepalive\n\n"
+
+
+def serve_events(port: int = 9465, host: str = "127.0.0.1", bus: EventBus | None = None):
+    """Serve ``/events`` as a Server-Sent Events stream on a daemon thread.
+
+    ``/events?topics=incident,health`` limits the stream to some topics.
+
+    Returns:
+        The running server; call ``shutdown()`` to stop it.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlparse
+
+    bus = bus or get_event_bus()
+
+    class EventsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != "/events":
+                self.send_error(404)
+                return
+            topics = parse_qs(url.query).get("topics", [",".join(TOPICS)])[0].split(",")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            subscription = bus.subscribe([t for t in topics if t in TOPICS])
+            try:
+                for message in sse_stream(subscription):
+                    self.wfile.write(message.encode())
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                subscription.close()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), EventsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="novaops-events", daemon=True).start()
+    return server
+
+
+_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Return the process-wide event bus."""
+    return _bus
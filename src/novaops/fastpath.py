@@ -0,0 +1,295 @@
+"""Deterministic fast path: commands that map exactly onto one tool.
+
+Inputs such as ``health api``, ``dashboard`` or ``resolve INC-ABC123`` need
+no model to understand. :class:`FastPathParser` compiles a command table
+from the tool registry (``novaops.tools.__all__``): each tool is reachable
+by its name as words (``check health``, ``update incident status``), by
+that name without a ``get``/``check`` prefix or ``data`` suffix
+(``health``, ``dashboard``), and by the short aliases in :data:`ALIASES`.
+
+The grammar is ``<command> [typed arguments...] [free text]``, with the
+command words either first or last (``api health``). Typed arguments are
+recognised from each tool's input schema:
+
+- a parameter whose description lists ``one of 'a', 'b'`` takes one of those
+  values (``any of`` takes several);
+- ``service`` takes a name from the service inventory, ``services`` several;
+- ``incident_id`` takes an ID like ``INC-ABC123``;
+- integer parameters take a number;
+- any parameter can be given as ``name=value``.
+
+Whatever follows the typed arguments is free text for the tool's first
+unfilled required text parameter (``voice alert info the api is back``);
+optional text parameters are only set with ``name=value``. Free text that
+asks for analysis or another step (``... then analyze the root cause``)
+rules the fast path out, since a single tool call would drop the rest of
+the request. Aliases never imply arguments for tools with side effects
+such as paging. An input only takes the fast path when exactly one
+reading of it fills every required argument; anything else returns None
+and is left to the agent chain.
+"""
+
+import re
+import threading
+from dataclasses import dataclass, field
+
+from strands.tools.decorator import DecoratedFunctionTool
+
+from novaops.health import load_service_inventory
+
+# Short names for commands, with the arguments they imply: phrase -> (tool name, fixed arguments).
+# Tools that speak or page are only reachable by their full name, with explicit arguments.
+ALIASES: dict[str, tuple[str, dict]] = {
+    "overview": ("get_dashboard_data", {}),
+    "status": ("get_dashboard_data", {}),
+    "search": ("search_incidents", {}),
+    "rca": ("root_cause_analysis", {}),
+    "transcribe": ("speech_to_text", {}),
+    "ack": ("update_incident_status", {"status": "investigating"}),
+    "acknowledge": ("update_incident_status", {"status": "investigating"}),
+    "mitigate": ("update_incident_status", {"status": "mitigated"}),
+    "resolve": ("update_incident_status", {"status": "resolved"}),
+    "close": ("update_incident_status", {"status": "closed"}),
+    "reopen": ("update_incident_status", {"status": "open"}),
+}
+
+# Words that may pad a command with no text argument ("show me the health of api").
+_FILLER = frozenset({"a", "an", "the", "of", "for", "on", "me", "show", "please", "now", "all"})
+_INCIDENT_ID = re.compile(r"^INC-[0-9A-Z]+$", re.IGNORECASE)
+_CHOICES = re.compile(r"\b(one|any) of ((?:'[^']+'[,\s]*(?:or\s+)?)+)", re.IGNORECASE)
+
+# Words that signal reasoning over several steps or sources (also used by the model router).
+ANALYSIS_PATTERN = re.compile(
+    r"\b(why|root cause|rca|analy[sz]e|analysis|investigate|correlat\w*|compare|diagnos\w*|"
+    r"postmortem|post-mortem|plan|recommend\w*|explain|impact|trade-?offs?)\b"
+)
+# Words that chain several requests together.
+STEP_PATTERN = re.compile(r"\b(then|after that|afterwards|and also)\b|;")
+
+
+@dataclass(frozen=True)
+class Param:
+    """One tool argument, as the parser sees it."""
+
+    name: str
+    kind: str  # "choice", "service", "incident", "int", "text"
+    required: bool
+    many: bool = False
+    choices: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Command:
+    """A phrase that invokes one tool, with any arguments it implies."""
+
+    phrase: tuple[str, ...]
+    tool: str
+    params: tuple[Param, ...]
+    fixed: dict = field(default_factory=dict, hash=False)
+
+
+def _param(name: str, schema: dict, required: bool) -> Param:
+    many = schema.get("type") == "array"
+    item_type = schema.get("items", {}).get("type") if many else schema.get("type")
+    choices = _CHOICES.search(schema.get("description", ""))
+    if choices:
+        values = tuple(re.findall(r"'([^']+)'", choices.group(2)))
+        return Param(name, "choice", required, many or choices.group(1).lower() == "any", values)
+    if name in ("service", "services"):
+        return Param(name, "service", required, many)
+    if name.endswith("incident_id"):
+        return Param(name, "incident", required, many)
+    if item_type == "integer":
+        return Param(name, "int", required, many)
+    return Param(name, "text", required, many)
+
+
+def _phrases(tool_name: str) -> set[tuple[str, ...]]:
+    words = tuple(tool_name.split("_"))
+    phrases = {words}
+    if words[0] in ("get", "check") and len(words) > 1:
+        phrases.add(words[1:])
+    if words[-1] == "data" and len(words) > 2:
+        phrases |= {p[:-1] for p in list(phrases)}
+    return phrases
+
+
+def build_commands(
+    tools: dict[str, DecoratedFunctionTool],
+    aliases: dict[str, tuple[str, dict]] = ALIASES,
+) -> list[Command]:
+    """Compile the command table for ``tools`` from their input schemas.
+
+    Args:
+        tools: Tools by name, e.g. everything in ``novaops.tools.__all__``.
+        aliases: Extra phrases, each naming a tool and the arguments it implies.
+            Aliases for tools not in ``tools`` are skipped.
+
+    Returns:
+        One command per (phrase, tool) pair, longest phrases first.
+    """
+    params = {}
+    for name, tool in tools.items():
+        schema = tool.tool_spec["inputSchema"]["json"]
+        required = set(schema.get("required", []))
+        params[name] = tuple(
+            _param(arg, spec, arg in required) for arg, spec in schema.get("properties", {}).items()
+        )
+
+    commands = [Command(p, name, params[name]) for name in tools for p in _phrases(name)]
+    commands += [
+        Command(tuple(phrase.split()), name, params[name], dict(fixed))
+        for phrase, (name, fixed) in aliases.items()
+        if name in tools
+    ]
+    return sorted(commands, key=lambda c: -len(c.phrase))
+
+
+class FastPathParser:
+    """Maps unambiguous commands onto ``(tool_name, arguments)`` without a model.
+
+    Args:
+        tools: Tools by name; defaults to everything in ``novaops.tools.__all__``.
+        aliases: Extra command phrases; see :data:`ALIASES`.
+        services: Valid service names; defaults to the service inventory.
+    """
+
+    def __init__(
+        self,
+        tools: dict[str, DecoratedFunctionTool] | None = None,
+        aliases: dict[str, tuple[str, dict]] = ALIASES,
+        services: list[str] | None = None,
+    ):
+        if tools is None:
+            import novaops.tools
+
+            tools = {name: getattr(novaops.tools, name) for name in novaops.tools.__all__}
+        self.commands = build_commands(tools, aliases)
+        self.services = frozenset(s.lower() for s in load_service_inventory(services))
+
+    def __call__(self, prompt: str) -> tuple[str, dict] | None:
+        return self.parse(prompt)
+
+    def parse(self, prompt: str) -> tuple[str, dict] | None:
+        """Return ``(tool_name, arguments)`` if exactly one reading of ``prompt`` fits a command."""
+        tokens = prompt.strip().rstrip("?!.").split()
+        while tokens and tokens[0].lower() in _FILLER:
+            tokens.pop(0)
+        if not tokens:
+            return None
+        lowered = [t.lower() for t in tokens]
+        readings = []
+        for command in self.commands:
+            if readings and len(command.phrase) < len(readings[0][0].phrase):
+                break  # a longer command already matched
+            n = len(command.phrase)
+            if tuple(lowered[:n]) == command.phrase:
+                rest = tokens[n:]
+            elif tuple(lowered[-n:]) == command.phrase:
+                rest = tokens[:-n]
+            else:
+                continue
+            arguments = self._bind(command, rest)
+            if arguments is not None:
+                readings.append((command, arguments))
+
+        outcomes = {(c.tool, repr(sorted(a.items()))) for c, a in readings}
+        if len(outcomes) != 1:
+            return None
+        command, arguments = readings[0]
+        return command.tool, arguments
+
+    def _bind(self, command: Command, tokens: list[str]) -> dict | None:
+        """Fill ``command``'s parameters from ``tokens``, or return None if they do not fit."""
+        arguments = dict(command.fixed)
+        open_params = [p for p in command.params if p.name not in arguments]
+        text_params = [p for p in open_params if p.kind == "text" and p.required]
+        if not text_params:
+            tokens = [t for t in tokens if t.lower() not in _FILLER]
+
+        index = 0
+        while index < len(tokens):
+            token = tokens[index]
+            name, sep, raw = token.partition("=")
+            param = next((p for p in command.params if p.name == name), None) if sep else None
+            if param is not None:
+                value = self._coerce(param, raw)
+                if value is None:
+                    return None
+                arguments[param.name] = value
+            elif not self._take(open_params, arguments, token):
+                break  # the rest is free text
+            index += 1
+
+        text = " ".join(tokens[index:])
+        if text:
+            lowered = text.lower()
+            if ANALYSIS_PATTERN.search(lowered) or STEP_PATTERN.search(lowered):
+                return None  # more than this one tool call is being asked for
+            target = next((p for p in text_params if p.name not in arguments), None)
+            if target is None:
+                return None
+            arguments[target.name] = text
+
+        if any(p.required and p.name not in arguments for p in command.params):
+            return None
+        return arguments
+
+    def _take(self, params: list[Param], arguments: dict, token: str) -> bool:
+        """Assign ``token`` to the first open typed parameter it is a valid value for."""
+        for param in params:
+            if param.kind == "text" or (param.name in arguments and not param.many):
+                continue
+            value = self._coerce(param, token)
+            if value is None:
+                continue
+            if param.many:
+                arguments.setdefault(param.name, []).extend(value)
+            else:
+                arguments[param.name] = value
+            return True
+        return False
+
+    def _coerce(self, param: Param, raw: str):
+        """Return ``raw`` as a value of ``param``, or None if it is not one."""
+        values = [v for v in raw.split(",") if v] if param.many else [raw]
+        if not values:
+            return None
+        coerced = []
+        for value in values:
+            if param.kind == "choice":
+                value = value.lower()
+                if value not in param.choices:
+                    return None
+            elif param.kind == "service":
+                value = value.lower()
+                if value not in self.services:
+                    return None
+            elif param.kind == "incident":
+                if not _INCIDENT_ID.match(value):
+                    return None
+                value = value.upper()
+            elif param.kind == "int":
+                if not value.isdigit():
+                    return None
+                value = int(value)
+            coerced.append(value)
+        return coerced if param.many else coerced[0]
+
+
+_parser: FastPathParser | None = None
+_parser_lock = threading.Lock()
+
+
+def get_fast_path() -> FastPathParser:
+    """Return the shared parser over ``novaops.tools``."""
+    global _parser
+    with _parser_lock:
+        if _parser is None:
+            _parser = FastPathParser()
+        return _parser
+
+
+def match_fast_path(prompt: str) -> tuple[str, dict] | None:
+    """Return ``(tool_name, arguments)`` if ``prompt`` maps exactly onto one tool, else None."""
+    return get_fast_path().parse(prompt)
@@ -0,0 +1,153 @@
+"""Concurrent fan-out health checks across the service inventory."""
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from novaops.tools.infra import check_health
+
+DEFAULT_SERVICES = ("api", "database", "cache", "queue")
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_CONCURRENCY = 256
+
+
+def load_service_inventory(services: Iterable[str] | None = None) -> list[str]:
+    """Resolve the list of services to probe.
+
+    Explicit ``services`` win, then the comma-separated ``NOVAOPS_SERVICES``
+    environment variable, then the built-in default inventory.
+    """
+    if services:
+        return list(dict.fromkeys(services))
+    env = os.getenv("NOVAOPS_SERVICES", "")
+    configured = [s.strip() for s in env.split(",") if s.strip()]
+    return list(dict.fromkeys(configured)) or list(DEFAULT_SERVICES)
+
+
+def _timeout_result(service: str, timeout: float) -> dict:
+    return {
+        "service": service,
+        "status": "unknown",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "uptime_hours": None,
+        "last_incident": None,
+        "error": f"Health probe timed out after {timeout}s",
+    }
+
+
+def _error_result(service: str, exc: Exception) -> dict:
+    return {
+        "service": service,
+        "status": "unknown",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "uptime_hours": None,
+        "last_incident": None,
+        "error": f"Health probe failed: {exc}",
+    }
+
+
+async def stream_health_checks(
+    services: Iterable[str],
+    probe: Callable[[str], dict] = check_health,
+    timeout: float = DEFAULT_TIMEOUT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> AsyncIterator[dict]:
+    """Probe every service concurrently and yield each result as it finishes.
+
+    At most ``concurrency`` probes run at once, each on a worker thread. A
+    probe's ``timeout`` runs from the start of the sweep and includes any wait
+    for a free slot, so the whole sweep finishes within ``timeout`` even when
+    hung probes hold every slot. A probe that times out, before or after it
+    starts, or raises yields a result with status ``unknown`` and an ``error``
+    message instead of aborting the sweep. Every result carries the time
+    spent on the service in ``latency_ms``.
+
+    Args:
+        services: Service names to probe.
+        probe: Synchronous health probe taking a service name.
+        timeout: Per-service timeout in seconds.
+        concurrency: Maximum number of probes in flight.
+
+    Yields:
+        One health result dictionary per service, in completion order.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    # shutdown(wait=False) below does not wait for hung probes, but the
+    # interpreter still joins their worker threads at exit.
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="novaops-health")
+
+    async def run_one(service: str) -> dict:
+        deadline = loop.time() + timeout
+        started = time.perf_counter()
+        running = asyncio.Event()
+        future = None
+
+        def run() -> dict:
+            try:
+                loop.call_soon_threadsafe(running.set)
+            except RuntimeError:  # the sweep has already finished
+                pass
+            return probe(service)
+
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout)
+            future = loop.run_in_executor(pool, run)
+            # A slot is freed when the probe's thread is, not when the probe times out,
+            # so hung probes cannot run more than ``concurrency`` threads between them.
+            future.add_done_callback(lambda _: semaphore.release())
+            await asyncio.wait_for(running.wait(), deadline - loop.time())
+            result = dict(await asyncio.wait_for(asyncio.shield(future), deadline - loop.time()))
+        except asyncio.TimeoutError:
+            if future is not None and not running.is_set():
+                future.cancel()  # never started; do not run it after the sweep gave up on it
+            result = _timeout_result(service, timeout)
+        except Exception as exc:
+            result = _error_result(service, exc)
+        result["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    try:
+        tasks = [asyncio.ensure_future(run_one(svc)) for svc in services]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run_health_checks(
+    services: Iterable[str],
+    on_result: Callable[[dict], None] | None = None,
+    probe: Callable[[str], dict] = check_health,
+    timeout: float = DEFAULT_TIMEOUT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[dict]:
+    """Synchronous wrapper around :func:`stream_health_checks`.
+
+    Args:
+        services: Service names to probe.
+        on_result: Optional callback invoked with each result as it arrives.
+        probe: Synchronous health probe taking a service name.
+        timeout: Per-service timeout in seconds.
+        concurrency: Maximum number of probes in flight.
+
+    Returns:
+        All results, in completion order.
+    """
+
+    async def collect() -> list[dict]:
+        results = []
+        async for result in stream_health_checks(services, probe, timeout, concurrency):
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+        return results
+
+    return asyncio.run(collect())
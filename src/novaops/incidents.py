@@ -0,0 +1,319 @@
+"""Indexed, thread-safe incident store backing the dashboard tools."""
+
+import atexit
+import bisect
+import itertools
+import logging
+import os
+import threading
+import uuid
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+
+from novaops.journal import IncidentJournal
+
+logger = logging.getLogger(__name__)
+
+
+def new_incident_id() -> str:
+    """Return a random incident ID such as ``INC-3F9A0C71B2DE`` (48 random bits)."""
+    return f"INC-{uuid.uuid4().hex[:12].upper()}"
+
+
+class IncidentStore:
+    """In-memory incident store with a primary ID index and secondary indexes.
+
+    Incidents are kept in an ID hash map (insertion ordered, so creation order
+    is preserved) plus secondary indexes by ``status`` and ``severity`` that
+    hold each incident's creation sequence number in sorted order, so filtered
+    reads come back in creation order however often incidents are updated.
+    Lookups and updates are O(1) apart from the sorted index insert; filtered
+    and paginated reads only touch the rows they return. Every public method
+    holds the store lock, and reads hand out copies, so concurrent tool calls
+    cannot observe or cause a half-applied change.
+    """
+
+    INDEXED_FIELDS = ("status", "severity")
+
+    def __init__(self):
+        self._by_id: dict[str, dict] = {}
+        # Creation sequence numbers, which order the secondary indexes.
+        self._seq_of: dict[str, int] = {}
+        self._id_at: dict[int, str] = {}
+        self._next_seq = 0
+        # field -> value -> sorted list of creation sequence numbers
+        self._indexes: dict[str, dict[str, list[int]]] = {
+            field: {} for field in self.INDEXED_FIELDS
+        }
+        # (status, severity) -> number of incidents, for counts filtered on both
+        self._pair_counts: Counter[tuple] = Counter()
+        self._listeners: list[Callable[[str, dict | None], None]] = []
+        self.listener_errors = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, incident_id: str) -> bool:
+        return incident_id in self._by_id
+
+    def subscribe(self, listener: Callable[[str, dict | None], None]) -> None:
+        """Call ``listener(op, incident)`` after every change.
+
+        ``op`` is ``"add"`` or ``"update"`` with a copy of the incident as it
+        now stands, or ``"clear"`` with None. Listeners run on the writing
+        thread, in the order the changes were applied. A listener that raises
+        is logged and counted in ``listener_errors``; the write still succeeds.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener) -> None:
+        """Stop calling ``listener``."""
+        self._listeners.remove(listener)
+
+    def _notify(self, op: str, incident: dict | None = None) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(op, None if incident is None else dict(incident))
+            except Exception:
+                self.listener_errors += 1
+                logger.exception("Incident store listener %r failed on %s", listener, op)
+
+    def _index_add(self, incident: dict, fields: Iterable[str] = INDEXED_FIELDS) -> None:
+        seq = self._seq_of[incident["incident_id"]]
+        for field in fields:
+            bisect.insort(self._indexes[field].setdefault(incident.get(field), []), seq)
+
+    def _index_remove(self, incident: dict, fields: Iterable[str] = INDEXED_FIELDS) -> None:
+        seq = self._seq_of[incident["incident_id"]]
+        for field in fields:
+            index = self._indexes[field]
+            bucket = index.get(incident.get(field))
+            if bucket is not None:
+                position = bisect.bisect_left(bucket, seq)
+                if position < len(bucket) and bucket[position] == seq:
+                    del bucket[position]
+                if not bucket:
+                    del index[incident.get(field)]
+
+    def add(self, incident: dict) -> dict:
+        """Insert a new incident and return a copy.
+
+        The incident is keyed by ``incident_id``; when that is missing or None
+        a new unique ID is assigned.
+        """
+        with self._lock:
+            stored = self._add(incident)
+            self._notify("add", stored)
+            return dict(stored)
+
+    def _add(self, incident: dict) -> dict:
+        """Insert ``incident`` without notifying listeners; returns the stored dict."""
+        stored = dict(incident)
+        if stored.get("incident_id") is None:
+            stored["incident_id"] = new_incident_id()
+            while stored["incident_id"] in self._by_id:
+                stored["incident_id"] = new_incident_id()
+        elif stored["incident_id"] in self._by_id:
+            raise KeyError(f"Incident '{stored['incident_id']}' already exists")
+        self._by_id[stored["incident_id"]] = stored
+        self._seq_of[stored["incident_id"]] = self._next_seq
+        self._id_at[self._next_seq] = stored["incident_id"]
+        self._next_seq += 1
+        self._index_add(stored)
+        self._pair_counts[_pair(stored)] += 1
+        return stored
+
+    def get(self, incident_id: str) -> dict | None:
+        """Return a copy of the incident with ``incident_id``, or None."""
+        with self._lock:
+            incident = self._by_id.get(incident_id)
+            return None if incident is None else dict(incident)
+
+    def update(self, incident_id: str, **fields) -> dict | None:
+        """Apply ``fields`` to an incident and return the updated copy, or None if missing."""
+        with self._lock:
+            incident = self._update(incident_id, fields)
+            if incident is None:
+                return None
+            self._notify("update", incident)
+            return dict(incident)
+
+    def _update(self, incident_id: str, fields: dict) -> dict | None:
+        """Apply ``fields`` without notifying listeners; returns the stored dict or None."""
+        incident = self._by_id.get(incident_id)
+        if incident is None:
+            return None
+        changed = [f for f in self.INDEXED_FIELDS if f in fields and fields[f] != incident.get(f)]
+        self._index_remove(incident, changed)
+        if changed:
+            self._pair_counts[_pair(incident)] -= 1
+        incident.update(fields)
+        self._index_add(incident, changed)
+        if changed:
+            self._pair_counts[_pair(incident)] += 1
+        return incident
+
+    def _ids(self, status: str | None, severity: str | None, newest_first: bool) -> Iterator[str]:
+        buckets = [
+            self._indexes[field].get(value, {})
+            for field, value in (("status", status), ("severity", severity))
+            if value
+        ]
+        if not buckets:
+            return reversed(self._by_id) if newest_first else iter(self._by_id)
+        # Walk the smallest matching bucket, checking membership in the rest.
+        buckets.sort(key=len)
+        ordered, rest = buckets[0], buckets[1:]
+        seqs = reversed(ordered) if newest_first else iter(ordered)
+        return (self._id_at[s] for s in seqs if all(_contains(r, s) for r in rest))
+
+    def query(
+        self,
+        status: str | None = None,
+        severity: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        newest_first: bool = False,
+    ) -> list[dict]:
+        """Return copies of incidents matching the filters, one page at a time.
+
+        Args:
+            status: Only return incidents with this status.
+            severity: Only return incidents with this severity.
+            offset: Number of matching incidents to skip.
+            limit: Maximum number of incidents to return (None for all).
+            newest_first: Return the most recently created incidents first.
+
+        Returns:
+            A list of incident dictionaries, in creation order (or reverse).
+        """
+        with self._lock:
+            ids = self._ids(status, severity, newest_first)
+            stop = None if limit is None else max(offset, 0) + max(limit, 0)
+            return [dict(self._by_id[i]) for i in itertools.islice(ids, max(offset, 0), stop)]
+
+    def count(self, status: str | None = None, severity: str | None = None) -> int:
+        """Count incidents matching the filters."""
+        with self._lock:
+            if status and severity:
+                return self._pair_counts[(status, severity)]
+            if status:
+                return len(self._indexes["status"].get(status, {}))
+            if severity:
+                return len(self._indexes["severity"].get(severity, {}))
+            return len(self._by_id)
+
+    def counts_by(self, field: str) -> dict[str, int]:
+        """Return the number of incidents per value of an indexed field."""
+        with self._lock:
+            return {value: len(ids) for value, ids in self._indexes[field].items()}
+
+    def clear(self) -> None:
+        """Remove every incident."""
+        with self._lock:
+            self._clear()
+            self._notify("clear")
+
+    def _clear(self) -> None:
+        self._by_id.clear()
+        self._seq_of.clear()
+        self._id_at.clear()
+        self._pair_counts.clear()
+        for index in self._indexes.values():
+            index.clear()
+
+
+def _pair(incident: dict) -> tuple:
+    return incident.get("status"), incident.get("severity")
+
+
+def _contains(bucket: list[int], seq: int) -> bool:
+    position = bisect.bisect_left(bucket, seq)
+    return position < len(bucket) and bucket[position] == seq
+
+
+class PersistentIncidentStore(IncidentStore):
+    """IncidentStore whose writes are journalled to disk and recovered on open.
+
+    Every mutation is appended to an :class:`~novaops.journal.IncidentJournal`
+    while the store lock is held, so log order always matches apply order, and
+    listeners are notified once the change is in the log. The caller then
+    waits for the group commit outside the lock, which lets concurrent
+    writers share a single ``fsync``. Opening a store on an existing
+    directory loads the last snapshot and replays the log written after it.
+
+    Args:
+        directory: Directory for the snapshot and log segments.
+        **journal_options: Passed through to :class:`~novaops.journal.IncidentJournal`.
+    """
+
+    def __init__(self, directory: str, **journal_options):
+        super().__init__()
+        self._journal = IncidentJournal(directory, **journal_options)
+        incidents, records = self._journal.recover()
+        for incident in incidents:
+            self._add(incident)
+        for record in records:
+            self._replay(record)
+        self._journal.start(self._state)
+
+    def _replay(self, record: dict) -> None:
+        op = record["op"]
+        if op == "add":
+            self._add(record["incident"])
+        elif op == "update":
+            self._update(record["incident_id"], record["fields"])
+        elif op == "clear":
+            self._clear()
+
+    def _state(self) -> tuple[int, list[dict]]:
+        with self._lock:
+            return self._journal.seq, [dict(i) for i in self._by_id.values()]
+
+    def add(self, incident: dict) -> dict:
+        with self._lock:
+            stored = dict(self._add(incident))
+            seq = self._journal.append({"op": "add", "incident": stored})
+            self._notify("add", stored)
+        self._journal.wait(seq)
+        return stored
+
+    def update(self, incident_id: str, **fields) -> dict | None:
+        with self._lock:
+            incident = self._update(incident_id, fields)
+            if incident is None:
+                return None
+            updated = dict(incident)
+            seq = self._journal.append(
+                {"op": "update", "incident_id": incident_id, "fields": fields}
+            )
+            self._notify("update", updated)
+        self._journal.wait(seq)
+        return updated
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clear()
+            seq = self._journal.append({"op": "clear"})
+            self._notify("clear")
+        self._journal.wait(seq)
+
+    def close(self) -> None:
+        """Flush pending writes and stop the journal writer."""
+        self._journal.close()
+
+
+def open_incident_store() -> IncidentStore:
+    """Create the dashboard incident store.
+
+    When ``NOVAOPS_DATA_DIR`` is set, incidents are persisted under
+    ``$NOVAOPS_DATA_DIR/incidents`` and recovered on restart; otherwise they
+    live in memory only.
+    """
+    data_dir = os.getenv("NOVAOPS_DATA_DIR")
+    if not data_dir:
+        return IncidentStore()
+    store = PersistentIncidentStore(os.path.join(data_dir, "incidents"))
+    atexit.register(store.close)
+    return store
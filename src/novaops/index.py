@@ -0,0 +1,136 @@
+"""Vector index over incident records for similarity search."""
+
+import json
+import threading
+from collections.abc import Iterable
+
+import numpy as np
+
+from novaops.embeddings import EMBEDDING_DIM, embed_text, embed_texts
+
+_INITIAL_CAPACITY = 64
+
+
+def incident_text(record: dict) -> str:
+    """Build the text that represents an incident in embedding space."""
+    return " ".join(
+        str(record.get(key) or "") for key in ("title", "description", "service")
+    ).strip()
+
+
+class IncidentIndex:
+    """Append-only cosine-similarity index over incident records.
+
+    Each record is embedded once on insert. Embeddings are L2-normalised and
+    packed into one contiguous float32 matrix, so a query is a single
+    matrix-vector product followed by a partial sort for the top-k rows.
+    Inserts are serialised by a lock; searches read a consistent prefix of the
+    matrix without blocking writers.
+    """
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        self.dim = dim
+        self._matrix = np.zeros((_INITIAL_CAPACITY, dim), dtype=np.float32)
+        self._records: list[dict] = []
+        self._positions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict], dim: int = EMBEDDING_DIM) -> "IncidentIndex":
+        """Build an index from an iterable of incident records."""
+        index = cls(dim=dim)
+        index.add_many(records)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, incident_id: str) -> bool:
+        return incident_id in self._positions
+
+    def get(self, incident_id: str) -> dict | None:
+        """Return the record stored under ``incident_id``, if any."""
+        pos = self._positions.get(incident_id)
+        return None if pos is None else self._records[pos]
+
+    def add(self, record: dict) -> None:
+        """Embed and insert a single incident record.
+
+        Re-adding an existing ID replaces its record and embedding in place.
+        """
+        self.add_many([record])
+
+    def add_many(self, records: Iterable[dict]) -> None:
+        """Embed and insert several incident records in one batch."""
+        records = list(records)
+        if not records:
+            return
+        vectors = embed_texts([incident_text(r) for r in records])
+        self._insert(records, vectors)
+
+    def _insert(self, records: list[dict], vectors: np.ndarray) -> None:
+        with self._lock:
+            for record, vec in zip(records, vectors):
+                incident_id = record["id"]
+                pos = self._positions.get(incident_id)
+                if pos is None:
+                    pos = len(self._records)
+                    if pos == self._matrix.shape[0]:
+                        self._grow()
+                    self._records.append(record)
+                    self._positions[incident_id] = pos
+                else:
+                    self._records[pos] = record
+                self._matrix[pos] = vec
+
+    def _grow(self) -> None:
+        grown = np.zeros((self._matrix.shape[0] * 2, self.dim), dtype=np.float32)
+        grown[: self._matrix.shape[0]] = self._matrix
+        self._matrix = grown
+
+    def search(self, query: str, k: int = 3) -> list[tuple[float, dict]]:
+        """Return the ``k`` records most similar to ``query``.
+
+        Scores are cosine similarities clipped to ``[0, 1]``. Ties are broken by
+        insertion order so results are fully deterministic.
+
+        Args:
+            query: Natural language query text.
+            k: Maximum number of results to return.
+
+        Returns:
+            A list of ``(score, record)`` pairs, best match first.
+        """
+        n = len(self._records)
+        if n == 0 or k <= 0:
+            return []
+        scores = self._matrix[:n] @ embed_text(query)
+        if k < n:
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(n)
+        order = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return [
+            (round(float(np.clip(scores[i], 0.0, 1.0)), 3), self._records[i])
+            for i in order[:k]
+        ]
+
+    def save(self, path: str) -> None:
+        """Persist the index (vectors and records) to a ``.npz`` file."""
+        with self._lock:
+            n = len(self._records)
+            np.savez(
+                path,
+                vectors=self._matrix[:n],
+                records=np.array(json.dumps(self._records)),
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "IncidentIndex":
+        """Load an index previously written by :meth:`save`."""
+        with np.load(path, allow_pickle=False) as data:
+            vectors = data["vectors"]
+            records = json.loads(str(data["records"]))
+        index = cls(dim=vectors.shape[1])
+        index._insert(records, vectors)
+        return index
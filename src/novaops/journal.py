@@ -0,0 +1,249 @@
+"""Append-only write-ahead log with group commit and compacted snapshots.
+
+On-disk layout inside the journal directory::
+
+    snapshot.json              {"seq": S, "incidents": [...]} — state after op S
+    wal-000000000123.log       log segment whose first record has seq 123
+
+Every log line is ``<crc32 hex> <json record>``. A record that fails its
+checksum, such as a torn write at the tail after a crash, ends replay of that
+segment. Records with ``seq <= S`` are already folded into the snapshot and
+are skipped, so replay after a crash that came mid-compaction is idempotent.
+
+A single writer thread drains the append queue. It writes every pending
+record, then issues one ``fsync`` for the whole batch (group commit). It
+wakes each appender whose record is now durable. After ``snapshot_every``
+records it writes a fresh snapshot, starts a new segment and deletes the
+old ones, which bounds replay time on restart.
+"""
+
+import json
+import os
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterator
+
+SNAPSHOT_FILE = "snapshot.json"
+_SEGMENT_PREFIX = "wal-"
+_SEGMENT_SUFFIX = ".log"
+
+
+def _encode(record: dict) -> bytes:
+    payload = json.dumps(record, separators=(",", ":")).encode()
+    return b"%08x " % zlib.crc32(payload) + payload + b"\n"
+
+
+def _decode(line: bytes) -> dict | None:
+    crc, _, payload = line.rstrip(b"\n").partition(b" ")
+    try:
+        if int(crc, 16) != zlib.crc32(payload):
+            return None
+        return json.loads(payload)
+    except ValueError:
+        return None
+
+
+def _fsync_dir(directory: str) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:  # e.g. Windows, where directories cannot be opened
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class IncidentJournal:
+    """Durable, crash-safe operation log for the incident store.
+
+    Args:
+        directory: Directory holding the snapshot and log segments.
+        snapshot_every: Number of logged records between compactions.
+        sync: ``fsync`` each group commit. Disable only for tests or benchmarks.
+        commit_delay: Seconds the writer waits after waking to gather more
+            records into the same commit.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        snapshot_every: int = 10_000,
+        sync: bool = True,
+        commit_delay: float = 0.0,
+    ):
+        self.directory = directory
+        self.snapshot_every = snapshot_every
+        self.sync = sync
+        self.commit_delay = commit_delay
+        os.makedirs(directory, exist_ok=True)
+
+        self._cond = threading.Condition()
+        self._queue: list[dict] = []
+        self._seq = 0
+        self._durable_seq = 0
+        self._since_snapshot = 0
+        self._closed = False
+        self._error: BaseException | None = None
+        self._segment = None
+        self._writer: threading.Thread | None = None
+        self._state_fn: Callable[[], tuple[int, list[dict]]] | None = None
+
+    # ── Recovery ────────────────────────────────────────────────────────
+
+    def _segments(self) -> list[str]:
+        names = [
+            n for n in os.listdir(self.directory)
+            if n.startswith(_SEGMENT_PREFIX) and n.endswith(_SEGMENT_SUFFIX)
+        ]
+        return [os.path.join(self.directory, n) for n in sorted(names)]
+
+    def recover(self) -> tuple[list[dict], Iterator[dict]]:
+        """Load the latest snapshot and the log records written after it.
+
+        Must be called before :meth:`start`. The returned iterator must be
+        exhausted before appending, since it advances the journal's sequence.
+
+        Returns:
+            The snapshot's incidents and an iterator over the records to replay.
+        """
+        snapshot_seq, incidents = 0, []
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        if os.path.exists(path):
+            with open(path) as f:
+                snapshot = json.load(f)
+            snapshot_seq, incidents = snapshot["seq"], snapshot["incidents"]
+        self._seq = self._durable_seq = snapshot_seq
+
+        def replay() -> Iterator[dict]:
+            for segment in self._segments():
+                with open(segment, "r+b") as f:
+                    while line := f.readline():
+                        record = _decode(line)
+                        if record is None:
+                            # Torn tail from a crash: drop it so new appends stay readable.
+                            f.truncate(f.tell() - len(line))
+                            break
+                        if record["seq"] <= snapshot_seq:
+                            continue
+                        self._seq = self._durable_seq = record["seq"]
+                        self._since_snapshot += 1
+                        yield record
+
+        return incidents, replay()
+
+    # ── Writing ─────────────────────────────────────────────────────────
+
+    def start(self, state_fn: Callable[[], tuple[int, list[dict]]]) -> None:
+        """Start the writer thread.
+
+        Args:
+            state_fn: Returns ``(seq, incidents)``, a consistent copy of the
+                store state that includes exactly the records up to ``seq``.
+                Used when compacting.
+        """
+        self._state_fn = state_fn
+        self._open_segment(self._seq + 1)
+        self._writer = threading.Thread(target=self._run, name="novaops-journal", daemon=True)
+        self._writer.start()
+
+    def _open_segment(self, first_seq: int) -> None:
+        if self._segment is not None:
+            self._segment.close()
+        name = f"{_SEGMENT_PREFIX}{first_seq:012d}{_SEGMENT_SUFFIX}"
+        self._segment = open(os.path.join(self.directory, name), "ab")
+        if self.sync:
+            _fsync_dir(self.directory)
+
+    def append(self, record: dict) -> int:
+        """Queue a record for the log and return its sequence number.
+
+        The caller must serialise appends with the state change they describe
+        (the store holds its lock across both), so that log order matches
+        apply order. Use :meth:`wait` to block until the record is durable.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Incident journal is closed")
+            self._seq += 1
+            self._queue.append({"seq": self._seq, **record})
+            self._cond.notify_all()
+            return self._seq
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the last appended record."""
+        return self._seq
+
+    def wait(self, seq: int) -> None:
+        """Block until the record with sequence ``seq`` has been committed."""
+        with self._cond:
+            while self._durable_seq < seq and self._error is None:
+                self._cond.wait()
+            if self._error is not None:
+                raise RuntimeError("Incident journal writer failed") from self._error
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    while not self._queue and not self._closed:
+                        self._cond.wait()
+                    if not self._queue and self._closed:
+                        return
+                if self.commit_delay:
+                    time.sleep(self.commit_delay)
+                with self._cond:
+                    batch, self._queue = self._queue, []
+                self._commit(batch)
+                if self._since_snapshot >= self.snapshot_every:
+                    self._compact()
+        except BaseException as exc:
+            with self._cond:
+                self._error = exc
+                self._cond.notify_all()
+            raise
+
+    def _commit(self, batch: list[dict]) -> None:
+        self._segment.write(b"".join(_encode(r) for r in batch))
+        self._segment.flush()
+        if self.sync:
+            os.fsync(self._segment.fileno())
+        self._since_snapshot += len(batch)
+        with self._cond:
+            self._durable_seq = batch[-1]["seq"]
+            self._cond.notify_all()
+
+    def _compact(self) -> None:
+        seq, incidents = self._state_fn()
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"seq": seq, "incidents": incidents}, f, separators=(",", ":"))
+            f.flush()
+            if self.sync:
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+        # Everything already written is covered by the snapshot; records still
+        # queued (seq > written) land in the new segment.
+        old_segments = self._segments()
+        self._open_segment(seq + 1)
+        current = self._segment.name
+        for segment in old_segments:
+            if segment != current:
+                os.remove(segment)
+        if self.sync:
+            _fsync_dir(self.directory)
+        self._since_snapshot = 0
+
+    def close(self) -> None:
+        """Flush outstanding records and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._writer is not None:
+            self._writer.join()
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
@@ -0,0 +1,276 @@
+"""Session-scoped conversation memory with a bounded context size.
+
+Every REPL session (and any other caller with a session ID, such as
+``CommandRequest.session_id``) gets its own Commander conversation from
+:class:`SessionStore`, keyed by session ID. Sessions are kept in LRU order;
+the least recently used one is dropped when there are more than
+``max_sessions``, and any session idle for ``idle_ttl`` seconds is dropped
+too.
+
+Each agent's history is kept under a token budget by
+:class:`TokenBudgetConversationManager`. When the history grows past the
+budget, the oldest whole turns are evicted and folded into a short running
+summary. The summary is carried at the front of the oldest remaining turn, so
+the model still knows what happened earlier in a long incident bridge while
+every prompt stays bounded.
+
+``NOVAOPS_CONTEXT_TOKENS`` sets the budget, ``NOVAOPS_MAX_SESSIONS`` and
+``NOVAOPS_SESSION_TTL`` the session limits.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from strands import Agent
+from strands.agent.conversation_manager import ConversationManager
+from strands.hooks import BeforeModelCallEvent, HookRegistry
+
+SUMMARY_PREFIX = "[Summary of the earlier conversation]"
+
+# Characters per token, for the size estimate (close enough for English and JSON).
+_CHARS_PER_TOKEN = 4
+
+
+def default_token_budget() -> int:
+    """Return the per-agent context budget in tokens (``NOVAOPS_CONTEXT_TOKENS``)."""
+    return int(os.getenv("NOVAOPS_CONTEXT_TOKENS", "8000"))
+
+
+def _block_chars(block: dict) -> int:
+    if "text" in block:
+        return len(block["text"])
+    if "toolUse" in block:
+        return len(block["toolUse"].get("name", "")) + len(json.dumps(block["toolUse"].get("input", {})))
+    if "toolResult" in block:
+        return sum(
+            len(c["text"]) if "text" in c else len(json.dumps(c.get("json"), default=str))
+            for c in block["toolResult"].get("content", [])
+        )
+    return len(json.dumps(block, default=str))
+
+
+def estimate_tokens(messages: list[dict]) -> int:
+    """Estimate the prompt tokens a list of messages costs."""
+    return sum(_block_chars(b) for m in messages for b in m.get("content", [])) // _CHARS_PER_TOKEN
+
+
+def _is_turn_start(message: dict) -> bool:
+    return message["role"] == "user" and not any("toolResult" in b for b in message.get("content", []))
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+class TokenBudgetConversationManager(ConversationManager):
+    """Keeps an agent's history within a token budget by summarising old turns.
+
+    A turn is a user prompt plus everything the agent did to answer it (tool
+    calls and results included), so trimming at turn boundaries never splits
+    a tool call from its result. The most recent ``keep_turns`` turns are
+    never evicted by routine management; on a context-window overflow
+    everything but the current turn may go.
+
+    The summary is extractive rather than generated: one line per evicted
+    turn with the prompt and the start of the answer, capped at
+    ``summary_tokens`` (oldest lines are dropped first). It costs no model
+    call.
+
+    Args:
+        budget: Maximum estimated tokens of history; defaults to
+            :func:`default_token_budget`.
+        keep_turns: Recent turns always kept verbatim.
+        summary_tokens: Maximum size of the running summary; defaults to a
+            quarter of the budget.
+    """
+
+    def __init__(self, budget: int | None = None, keep_turns: int = 2, summary_tokens: int | None = None):
+        super().__init__()
+        self.budget = budget or default_token_budget()
+        self.keep_turns = max(keep_turns, 1)
+        self.summary_tokens = summary_tokens or self.budget // 4
+        self.summarized_turns = 0
+
+    def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        super().register_hooks(registry, **kwargs)
+        # Also check before each model call, so long tool loops stay bounded mid-turn.
+        registry.add_callback(BeforeModelCallEvent, lambda event: self.apply_management(event.agent))
+
+    def apply_management(self, agent: Agent, **kwargs: Any) -> None:
+        if estimate_tokens(agent.messages) > self.budget:
+            self.reduce_context(agent)
+
+    def reduce_context(self, agent: Agent, e: Exception | None = None, **kwargs: Any) -> None:
+        messages = agent.messages
+        starts = [i for i, m in enumerate(messages) if _is_turn_start(m)]
+        keep = 1 if e is not None else self.keep_turns
+        if len(starts) <= keep:
+            if e is not None:
+                raise e
+            return
+
+        lines = self._summary_lines(messages[starts[0]])
+        carried = len(lines)
+        cut = starts[0]
+        # Evict whole turns, oldest first, until the rest fits (or only `keep` turns are left).
+        for turn, start in enumerate(starts[: len(starts) - keep]):
+            end = starts[turn + 1]
+            lines.append(self._summarize_turn(messages[start:end]))
+            cut = end
+            if estimate_tokens(messages[cut:]) + len("\n".join(lines)) // _CHARS_PER_TOKEN <= self.budget:
+                break
+
+        evicted = cut - starts[0]
+        self.removed_message_count += evicted
+        self.summarized_turns += len(lines) - carried
+        lines = self._cap(lines)
+        first = dict(messages[cut])
+        first["content"] = [
+            {"text": "\n".join([SUMMARY_PREFIX, *lines])},
+            *[b for b in first["content"] if not b.get("text", "").startswith(SUMMARY_PREFIX)],
+        ]
+        messages[:] = [*messages[: starts[0]], first, *messages[cut + 1:]]
+
+    @staticmethod
+    def _summary_lines(message: dict) -> list[str]:
+        """Return the summary lines already carried by ``message``, if any."""
+        for block in message.get("content", []):
+            text = block.get("text", "")
+            if text.startswith(SUMMARY_PREFIX):
+                return text.split("\n")[1:]
+        return []
+
+    @staticmethod
+    def _summarize_turn(turn: list[dict]) -> str:
+        texts = [
+            b["text"] for b in turn[0]["content"]
+            if "text" in b and not b["text"].startswith(SUMMARY_PREFIX)
+        ]
+        tools = [b["toolUse"]["name"] for m in turn for b in m["content"] if "toolUse" in b]
+        answer = next(
+            (b["text"] for m in reversed(turn) if m["role"] == "assistant" for b in m["content"] if "text" in b),
+            "",
+        )
+        line = f"- User: {_clip(' '.join(texts), 160)}"
+        if tools:
+            line += f" | tools: {', '.join(dict.fromkeys(tools))}"
+        if answer:
+            line += f" | Answer: {_clip(answer, 240)}"
+        return line
+
+    def _cap(self, lines: list[str]) -> list[str]:
+        limit = self.summary_tokens * _CHARS_PER_TOKEN
+        while len(lines) > 1 and len("\n".join(lines)) > limit:
+            lines.pop(0)
+        return lines
+
+    def get_state(self) -> dict[str, Any]:
+        state = super().get_state()
+        state["summarized_turns"] = self.summarized_turns
+        return state
+
+
+class SessionStore:
+    """Per-session agents, in LRU order, with idle expiry.
+
+    Args:
+        factory: Builds the agent for a new session.
+        max_sessions: Sessions kept before the least recently used is dropped.
+        idle_ttl: Seconds a session may sit unused before it is dropped.
+        clock: Monotonic time source (overridable in tests).
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Agent],
+        max_sessions: int | None = None,
+        idle_ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.factory = factory
+        self.max_sessions = max_sessions or int(os.getenv("NOVAOPS_MAX_SESSIONS", "64"))
+        self.idle_ttl = idle_ttl or float(os.getenv("NOVAOPS_SESSION_TTL", "3600"))
+        self._clock = clock
+        # session ID -> (agent, last used)
+        self._sessions: OrderedDict[str, tuple[Agent, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def get(self, session_id: str | None = None) -> Agent:
+        """Return the agent for ``session_id``, creating it (and the ID, if None) on first use."""
+        session_id = session_id or str(uuid.uuid4())
+        now = self._clock()
+        with self._lock:
+            self._expire(now)
+            entry = self._sessions.get(session_id)
+            agent = entry[0] if entry is not None else None
+            if agent is None:
+                agent = self.factory()
+                while len(self._sessions) >= self.max_sessions:
+                    self._sessions.popitem(last=False)
+                    self.evictions += 1
+            self._sessions[session_id] = (agent, now)
+            self._sessions.move_to_end(session_id)
+            return agent
+
+    def _expire(self, now: float) -> None:
+        while self._sessions:
+            _, last_used = next(iter(self._sessions.values()))
+            if now - last_used < self.idle_ttl:
+                break
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+
+    def drop(self, session_id: str) -> bool:
+        """Forget a session's conversation; returns False if it did not exist."""
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+    def stats(self) -> dict:
+        """Return the live session count, evictions and context size per session."""
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "evictions": self.evictions,
+                "context_tokens": {
+                    session_id: estimate_tokens(agent.messages)
+                    for session_id, (agent, _) in self._sessions.items()
+                },
+            }
+
+
+_sessions: SessionStore | None = None
+_sessions_lock = threading.Lock()
+
+
+def get_session_store() -> SessionStore:
+    """Return the shared store of Commander sessions."""
+    global _sessions
+    with _sessions_lock:
+        if _sessions is None:
+            from novaops.agents.commander import create_commander_agent
+
+            _sessions = SessionStore(create_commander_agent)
+        return _sessions
+
+
+def get_session_agent(session_id: str | None = None) -> Agent:
+    """Return the Commander for ``session_id`` (e.g. ``CommandRequest.session_id``)."""
+    return get_session_store().get(session_id)
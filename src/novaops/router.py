@@ -0,0 +1,179 @@
+"""Model tier routing in front of the Commander.
+
+Every request is classified into one of three tiers before any model is
+called:
+
+- ``fast``: the command maps exactly onto one tool (e.g. "dashboard",
+  "health api", "resolve INC-ABC123"; see :mod:`novaops.fastpath`). The tool
+  is called directly and no model is involved.
+- ``lite``: routine requests, answered by the Commander on Nova Lite.
+- ``pro``: multi-step analysis (root causes, investigations, requests that
+  span several sub-agents), answered by the Commander on Nova Pro.
+
+The tier only swaps the Commander's model for the request; the session's
+conversation carries over between tiers. Latency is recorded per tier, in
+:meth:`ModelRouter.stats` and, when tracing is on, as ``route`` spans.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from strands import Agent
+
+from novaops.agents.bedrock import get_lite_model, get_model
+from novaops.fastpath import ANALYSIS_PATTERN, STEP_PATTERN, match_fast_path
+from novaops.tracing import span
+
+TIERS = ("fast", "lite", "pro")
+
+# Words naming each sub-agent's domain; a request touching several goes to Pro.
+_DOMAINS = {
+    "monitor": ("health", "metric", "cpu", "memory", "latency", "throughput"),
+    "analyst": ("similar", "search", "history", "embed"),
+    "voice": ("alert", "page", "on-call", "speak", "say", "transcribe", "voice"),
+    "dashboard": ("dashboard", "incident", "resolve", "overview"),
+}
+_PRO_WORD_LIMIT = 30
+
+
+def _percentile(ordered: list[float], q: float) -> float | None:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] if ordered else None
+
+
+@dataclass
+class Route:
+    """Where a request goes and why."""
+
+    tier: str
+    reason: str
+    tool: str | None = None
+    arguments: dict = field(default_factory=dict)
+
+
+@dataclass
+class Routed:
+    """The outcome of a routed request."""
+
+    route: Route
+    output: object
+    latency_ms: float
+
+
+class ModelRouter:
+    """Classifies requests into tiers and runs them on the matching model.
+
+    Args:
+        fast_path: Maps a prompt to ``(tool_name, arguments)`` when one tool
+            answers it, else None; defaults to :func:`~novaops.fastpath.match_fast_path`.
+        lite_model: Model for the ``lite`` tier; defaults to :func:`get_lite_model`.
+        pro_model: Model for the ``pro`` tier; defaults to :func:`get_model`.
+        tools: Tool callables by name, for the fast path; defaults to
+            ``novaops.tools``.
+        window: Latency samples kept per tier for the percentiles.
+    """
+
+    def __init__(
+        self,
+        fast_path: Callable[[str], tuple[str, dict] | None] = match_fast_path,
+        lite_model=None,
+        pro_model=None,
+        tools: dict[str, Callable] | None = None,
+        window: int = 1000,
+    ):
+        self.fast_path = fast_path
+        self._lite_model = lite_model
+        self._pro_model = pro_model
+        self._tools = tools
+        self._latencies = {tier: deque(maxlen=window) for tier in TIERS}
+        self._counts = dict.fromkeys(TIERS, 0)
+        self._lock = threading.Lock()
+
+    def model_for(self, tier: str):
+        """Return the model that serves ``tier`` (``lite`` or ``pro``)."""
+        if tier == "lite":
+            return self._lite_model or get_lite_model()
+        return self._pro_model or get_model()
+
+    def tool(self, name: str) -> Callable:
+        """Return the fast-path tool called ``name``."""
+        if self._tools is None:
+            import novaops.tools
+
+            self._tools = {n: getattr(novaops.tools, n) for n in novaops.tools.__all__}
+        return self._tools[name]
+
+    def classify(self, prompt: str) -> Route:
+        """Pick the tier for a request without calling any model."""
+        fast = self.fast_path(prompt)
+        if fast is not None:
+            return Route("fast", "maps onto one tool", *fast)
+        text = prompt.lower()
+        if ANALYSIS_PATTERN.search(text):
+            return Route("pro", "asks for analysis")
+        domains = [name for name, words in _DOMAINS.items() if any(w in text for w in words)]
+        if len(domains) > 1:
+            return Route("pro", f"spans {', '.join(domains)}")
+        if STEP_PATTERN.search(text):
+            return Route("pro", "has several steps")
+        if len(text.split()) > _PRO_WORD_LIMIT:
+            return Route("pro", "long request")
+        return Route("lite", "routine request")
+
+    def handle(self, agent: Agent, prompt: str, invoke: Callable[[Agent, str], object]) -> Routed:
+        """Answer ``prompt`` on the tier it classifies into.
+
+        Args:
+            agent: The session's Commander; its model is set to the tier's model.
+            prompt: The user's request.
+            invoke: Runs the Commander, e.g. ``traced_call`` or ``stream_response``.
+
+        Returns:
+            The route taken, the tool result (``fast``) or ``invoke``'s return
+            value, and the latency.
+        """
+        route = self.classify(prompt)
+        started = time.perf_counter()
+        with span(route.tier, kind="route", reason=route.reason):
+            if route.tier == "fast":
+                output = self.tool(route.tool)(**route.arguments)
+            else:
+                agent.model = self.model_for(route.tier)
+                output = invoke(agent, prompt)
+        latency_ms = round((time.perf_counter() - started) * 1000, 1)
+        self.record(route.tier, latency_ms)
+        return Routed(route, output, latency_ms)
+
+    def record(self, tier: str, latency_ms: float) -> None:
+        """Record one request's latency on ``tier``."""
+        with self._lock:
+            self._counts[tier] += 1
+            self._latencies[tier].append(latency_ms)
+
+    def stats(self) -> dict[str, dict]:
+        """Return request count and latency percentiles (ms) per tier."""
+        with self._lock:
+            result = {}
+            for tier in TIERS:
+                samples = sorted(self._latencies[tier])
+                result[tier] = {
+                    "count": self._counts[tier],
+                    "p50_ms": _percentile(samples, 0.5),
+                    "p95_ms": _percentile(samples, 0.95),
+                }
+            return result
+
+
+_router: ModelRouter | None = None
+_router_lock = threading.Lock()
+
+
+def get_router() -> ModelRouter:
+    """Return the shared router used by the CLI."""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = ModelRouter()
+        return _router
@@ -0,0 +1,123 @@
+"""Streaming renderer for Commander responses in the interactive REPL."""
+
+import asyncio
+import queue
+import sys
+import threading
+import time
+from typing import TextIO
+
+from strands import Agent
+from novaops.tracing import traced_stream
+
+_DONE = object()
+# How long a cancelled request gets to stop before the REPL moves on.
+_STOP_TIMEOUT = 5.0
+
+
+class _Failure:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def _pump(agent: Agent, prompt: str, events: queue.Queue) -> None:
+    """Run ``agent.stream_async`` on a private event loop, forwarding every event."""
+
+    async def run():
+        async for event in traced_stream(agent, prompt):
+            events.put(event)
+
+    try:
+        asyncio.run(run())
+    except BaseException as exc:
+        events.put(_Failure(exc))
+    finally:
+        events.put(_DONE)
+
+
+def stream_response(agent: Agent, prompt: str, out: TextIO | None = None) -> dict:
+    """Stream an agent's answer to ``out`` as it is generated.
+
+    Text tokens are written as they arrive. Tool calls made by the agent, and
+    tool calls made inside sub-agents, are written as one-line events. The
+    agent runs on a background thread so that Ctrl+C stays responsive. The
+    first Ctrl+C cancels the in-flight request and lets the agent stop
+    cleanly; a second one stops rendering, and the call returns once the
+    agent has stopped (or after a few seconds).
+
+    Args:
+        agent: The agent to invoke (normally the Commander).
+        prompt: The user's request.
+        out: Stream to render to. Defaults to ``sys.stdout``.
+
+    Returns:
+        A dictionary with ``ttft_ms`` (time to first text token, or None),
+        ``total_ms``, ``cancelled`` and the final ``result`` (or None).
+
+    Raises:
+        Exception: Any error raised by the agent is re-raised here.
+    """
+    out = out or sys.stdout
+    events: queue.Queue = queue.Queue()
+    started = time.perf_counter()
+    stats = {"ttft_ms": None, "total_ms": None, "cancelled": False, "result": None}
+    seen_tools: set[str] = set()
+    failure = None
+
+    worker = threading.Thread(target=_pump, args=(agent, prompt, events), daemon=True)
+    worker.start()
+
+    def render(event) -> None:
+        nonlocal failure
+        if isinstance(event, _Failure):
+            failure = event.exc
+        elif "data" in event and event["data"]:
+            if stats["ttft_ms"] is None:
+                stats["ttft_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            out.write(event["data"])
+        elif "current_tool_use" in event:
+            tool_use = event["current_tool_use"]
+            if tool_use.get("name") and tool_use.get("toolUseId") not in seen_tools:
+                seen_tools.add(tool_use.get("toolUseId"))
+                out.write(f"\n  ↳ {tool_use['name']}\n")
+        elif "tool_stream_event" in event:
+            data = event["tool_stream_event"].get("data")
+            if isinstance(data, dict) and "tool_call" in data:
+                out.write(f"    · {data['agent']} → {data['tool_call']}\n")
+        elif "result" in event:
+            stats["result"] = event["result"]
+        out.flush()
+
+    # Ctrl+C can land anywhere in here, including while output is written.
+    while True:
+        try:
+            try:
+                event = events.get(timeout=0.1)
+            except queue.Empty:
+                # The end marker can be lost to an interrupt; a finished worker is the backstop.
+                if not worker.is_alive() and events.empty():
+                    break
+                continue
+            if event is _DONE:
+                break
+            render(event)
+        except KeyboardInterrupt:
+            if stats["cancelled"]:
+                break
+            stats["cancelled"] = True
+            agent.cancel()
+            out.write("\n⏹  Cancelling request (Ctrl+C again to stop waiting)...\n")
+            out.flush()
+
+    if stats["cancelled"]:
+        # Let the cancelled invocation wind down, so the next request on this
+        # agent does not collide with it.
+        try:
+            worker.join(_STOP_TIMEOUT)
+        except KeyboardInterrupt:
+            pass
+
+    stats["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    if failure is not None and not stats["cancelled"]:
+        raise failure
+    return stats
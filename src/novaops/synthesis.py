@@ -0,0 +1,440 @@
+"""Streaming text-to-speech: sentence chunks synthesized concurrently, played in order.
+
+Synthesizing a long Commander summary in one request makes the operator wait
+for the whole clip before hearing anything. :func:`stream_speech` instead
+splits the text at sentence boundaries (keeping the first chunk short),
+synthesizes a few chunks ahead concurrently on the shared worker pool, and
+yields 16-bit mono PCM frames in order as soon as each chunk is ready. The
+time to first audio is the synthesis time of the first chunk, whatever the
+length of the text.
+
+The synthesis backend is pluggable: any object with a ``sample_rate`` and a
+``synthesize(text, voice) -> bytes`` method returning raw PCM can be set with
+:func:`set_synthesizer`. The default is :class:`StubSynthesizer`, which runs
+offline; ``NOVAOPS_TTS_LATENCY`` sets its simulated per-request latency.
+
+Synthesized chunks are kept in a content-addressed :class:`AudioCache`, so a
+repeated voice alert during a flapping outage costs no synthesis at all.
+The cache holds ``NOVAOPS_AUDIO_CACHE_MB`` in memory; with
+``NOVAOPS_AUDIO_CACHE_DIR`` set, entries evicted from memory spill to files
+there (up to ``NOVAOPS_AUDIO_CACHE_DISK_MB``) and are served memory-mapped.
+"""
+
+import contextvars
+import hashlib
+import mmap
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from concurrent.futures import Future
+
+import numpy as np
+
+from novaops.aio import get_executor
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2  # bytes per sample, 16-bit signed little-endian
+DEFAULT_VOICE = "tiffany"
+DEFAULT_FRAME_MS = 20
+
+# Speaking rate used to size stub audio (~150 words per minute).
+_WORDS_PER_SECOND = 2.5
+_MB = 1024 * 1024
+_SENTENCE_END = re.compile(r"(?<=[.!?;:])\s+")
+
+
+def _split_long(text: str, limit: int) -> list[str]:
+    """Split ``text`` between words into pieces of at most ``limit``, preferring clause ends."""
+    pieces: list[str] = []
+    current = ""
+    for word in text.split(" "):
+        if current and len(current) + 1 + len(word) > limit:
+            pieces.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+        if current.endswith((",", ")", "—")) and len(current) >= limit // 2:
+            pieces.append(current)
+            current = ""
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_sentences(text: str, max_chars: int = 200, first_chars: int = 80) -> list[str]:
+    """Split ``text`` into chunks for synthesis.
+
+    Chunks end at sentence boundaries where possible. A sentence longer than
+    ``max_chars`` is split at clause boundaries, then between words. The
+    first chunk is held to ``first_chars`` so the first audio comes back fast.
+
+    Args:
+        text: Text to speak.
+        max_chars: Maximum length of a chunk.
+        first_chars: Maximum length of the first chunk.
+
+    Returns:
+        Non-empty chunks, in order.
+    """
+    chunks: list[str] = []
+    for sentence in _SENTENCE_END.split(" ".join(text.split())):
+        if not sentence:
+            continue
+        limit = first_chars if not chunks else max_chars
+        if len(sentence) <= limit:
+            chunks.append(sentence)
+            continue
+        head, *rest = _split_long(sentence, limit)
+        chunks.append(head)
+        if rest:
+            chunks.extend(_split_long(" ".join(rest), max_chars))
+    return chunks
+
+
+class StubSynthesizer:
+    """Offline stand-in for a speech synthesis backend.
+
+    Returns a quiet tone whose length follows the speaking rate of the text
+    and whose pitch depends on the text, so output is deterministic.
+
+    Args:
+        latency: Seconds each request takes before returning audio.
+        sample_rate: Output sample rate in Hz.
+    """
+
+    model_id = "stub"
+
+    def __init__(self, latency: float | None = None, sample_rate: int = SAMPLE_RATE):
+        self.latency = float(os.getenv("NOVAOPS_TTS_LATENCY", "0")) if latency is None else latency
+        self.sample_rate = sample_rate
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def synthesize(self, text: str, voice: str = DEFAULT_VOICE) -> bytes:
+        """Return 16-bit mono PCM audio for ``text``."""
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        seconds = max(len(text.split()) / _WORDS_PER_SECOND, 0.25)
+        digest = hashlib.md5(f"{voice}:{text}".encode()).digest()
+        frequency = 180 + digest[0]
+        t = np.arange(int(seconds * self.sample_rate)) / self.sample_rate
+        return (np.sin(2 * np.pi * frequency * t) * 3000).astype("<i2").tobytes()
+
+
+_synthesizer = None
+_synthesizer_lock = threading.Lock()
+
+
+def get_synthesizer():
+    """Return the configured synthesis backend (a :class:`StubSynthesizer` by default)."""
+    global _synthesizer
+    with _synthesizer_lock:
+        if _synthesizer is None:
+            _synthesizer = StubSynthesizer()
+        return _synthesizer
+
+
+def set_synthesizer(backend) -> None:
+    """Use ``backend`` for all speech synthesis; None restores the default."""
+    global _synthesizer
+    with _synthesizer_lock:
+        _synthesizer = backend
+
+
+def audio_key(text: str, voice: str, audio_format: str) -> str:
+    """Return the content address (SHA-256 hex digest) of a synthesized clip."""
+    return hashlib.sha256(f"{audio_format}\n{voice}\n{text}".encode()).hexdigest()
+
+
+class AudioCache:
+    """Content-addressed cache of synthesized audio: in-memory LRU with disk spill.
+
+    Entries are kept in memory up to ``max_bytes``. The least recently used
+    ones are then written to ``spill_dir`` as ``<key>.pcm`` (or dropped, if
+    no directory is set) and served from there memory-mapped, so they cost
+    page cache rather than heap. Files are written outside the cache lock,
+    and an entry whose write fails is dropped rather than failing the caller.
+    Spilled files are reused after a restart; past ``max_disk_bytes`` the
+    least recently used are deleted.
+
+    Args:
+        max_bytes: Audio held in memory; defaults to ``NOVAOPS_AUDIO_CACHE_MB`` (64 MB).
+        spill_dir: Directory for spilled entries; defaults to ``NOVAOPS_AUDIO_CACHE_DIR``.
+        max_disk_bytes: Audio kept on disk; defaults to ``NOVAOPS_AUDIO_CACHE_DISK_MB`` (1 GB).
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        spill_dir: str | None = None,
+        max_disk_bytes: int | None = None,
+    ):
+        if max_bytes is None:
+            max_bytes = int(os.getenv("NOVAOPS_AUDIO_CACHE_MB", "64")) * _MB
+        if max_disk_bytes is None:
+            max_disk_bytes = int(os.getenv("NOVAOPS_AUDIO_CACHE_DISK_MB", "1024")) * _MB
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.spill_dir = spill_dir or os.getenv("NOVAOPS_AUDIO_CACHE_DIR") or None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.spill_errors = 0
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: OrderedDict[str, int] = OrderedDict()  # key -> size
+        self._disk_bytes = 0
+        self._spilling: dict[str, bytes] = {}  # evicted, being written to disk
+        self._lock = threading.Lock()
+        if self.spill_dir:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            self._load_spilled()
+
+    def __len__(self) -> int:
+        return len(self._memory.keys() | self._spilling.keys() | self._disk.keys())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.spill_dir, f"{key}.pcm")
+
+    def _load_spilled(self) -> None:
+        entries = [e for e in os.scandir(self.spill_dir) if e.name.endswith(".pcm")]
+        for entry in sorted(entries, key=lambda e: e.stat().st_mtime):
+            size = entry.stat().st_size
+            self._disk[entry.name[:-4]] = size
+            self._disk_bytes += size
+
+    def get(self, key: str) -> bytes | memoryview | None:
+        """Return the cached audio for ``key``, or None on a miss."""
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+            elif key in self._spilling:
+                audio = self._spilling[key]
+            elif key in self._disk:
+                self._disk.move_to_end(key)
+                audio = self._map(key)
+            if audio is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += isinstance(audio, memoryview)
+            self.bytes_saved += len(audio)
+            return audio
+
+    def _map(self, key: str) -> memoryview | None:
+        try:
+            with open(self._path(key), "rb") as f:
+                return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except (OSError, ValueError):  # deleted underneath us, or empty
+            self._disk_bytes -= self._disk.pop(key, 0)
+            return None
+
+    def put(self, key: str, audio: bytes) -> None:
+        """Store ``audio`` under ``key``, spilling older entries past the memory cap."""
+        evicted = []
+        with self._lock:
+            if key in self._memory:
+                return
+            self._memory[key] = audio
+            self._memory_bytes += len(audio)
+            while self._memory_bytes > self.max_bytes and self._memory:
+                old_key, old_audio = self._memory.popitem(last=False)
+                self._memory_bytes -= len(old_audio)
+                if self.spill_dir and old_key not in self._disk and old_key not in self._spilling:
+                    self._spilling[old_key] = old_audio
+                    evicted.append((old_key, old_audio))
+        for old_key, old_audio in evicted:
+            self._spill(old_key, old_audio)
+
+    def _spill(self, key: str, audio: bytes) -> None:
+        tmp = self._path(key) + f".{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(audio)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            # Disk full or directory gone: the entry is dropped, the clip is resynthesized later.
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            with self._lock:
+                self._spilling.pop(key, None)
+                self.spill_errors += 1
+            return
+        stale = []
+        with self._lock:
+            self._spilling.pop(key, None)
+            self._disk[key] = len(audio)
+            self._disk_bytes += len(audio)
+            while self._disk_bytes > self.max_disk_bytes and self._disk:
+                old_key, size = self._disk.popitem(last=False)
+                self._disk_bytes -= size
+                stale.append(old_key)
+        for old_key in stale:
+            try:
+                os.remove(self._path(old_key))
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Drop the in-memory entries and reset the counters (spilled files are kept)."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self.hits = self.disk_hits = self.misses = self.bytes_saved = 0
+
+    def stats(self) -> dict:
+        """Return entry counts, sizes, hit/miss counters and the audio bytes served from cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "spill_errors": self.spill_errors,
+            }
+
+
+_audio_cache: AudioCache | None = None
+
+
+def get_audio_cache() -> AudioCache:
+    """Return the process-wide audio cache."""
+    global _audio_cache
+    with _synthesizer_lock:
+        if _audio_cache is None:
+            _audio_cache = AudioCache()
+        return _audio_cache
+
+
+class SpeechStream:
+    """An ordered stream of PCM frames for one text; iterate it to play the audio.
+
+    Chunks already in ``cache`` are not synthesized again; new ones are added
+    to it. Up to ``concurrency`` chunks are in flight at once. Iteration yields
+    frames of ``frame_ms`` milliseconds (the last one may be shorter) and
+    re-raises any synthesis error. Closing the stream, or abandoning the
+    iteration, cancels chunks not yet started.
+
+    Args:
+        text: Text to speak.
+        voice: Voice name passed to the backend.
+        backend: Synthesis backend; defaults to :func:`get_synthesizer`.
+        concurrency: Chunks synthesized ahead of playback.
+        frame_ms: Duration of each yielded frame.
+        cache: Audio cache; defaults to :func:`get_audio_cache`.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        voice: str = DEFAULT_VOICE,
+        backend=None,
+        concurrency: int = 4,
+        frame_ms: int = DEFAULT_FRAME_MS,
+        cache: AudioCache | None = None,
+    ):
+        self.backend = backend or get_synthesizer()
+        self.cache = cache if cache is not None else get_audio_cache()
+        self.voice = voice
+        model = getattr(self.backend, "model_id", type(self.backend).__name__)
+        self.format = f"{model}/pcm_{self.backend.sample_rate}"
+        self.chunks = split_sentences(text)
+        self.concurrency = max(concurrency, 1)
+        self.frame_bytes = self.backend.sample_rate * frame_ms // 1000 * SAMPLE_WIDTH
+        self.bytes = 0
+        self.first_audio_ms: float | None = None
+        self.total_ms: float | None = None
+        self.cached_chunks = 0
+        self._pending: deque = deque()
+
+    def _submit(self, chunk: str) -> None:
+        key = audio_key(chunk, self.voice, self.format)
+        audio = self.cache.get(key)
+        if audio is not None:
+            self.cached_chunks += 1
+            future = Future()
+            future.set_result(audio)
+            self._pending.append(future)
+            return
+        call = contextvars.copy_context().run
+        self._pending.append(get_executor().submit(call, self._synthesize, key, chunk))
+
+    def _synthesize(self, key: str, chunk: str) -> bytes:
+        audio = self.backend.synthesize(chunk, self.voice)
+        self.cache.put(key, audio)
+        return audio
+
+    def __iter__(self) -> Iterator[bytes]:
+        started = time.perf_counter()
+        upcoming = iter(self.chunks)
+        for chunk in upcoming:
+            self._submit(chunk)
+            if len(self._pending) >= self.concurrency:
+                break
+        carry = b""
+        try:
+            while self._pending:
+                audio = carry + self._pending.popleft().result()
+                next_chunk = next(upcoming, None)
+                if next_chunk is not None:
+                    self._submit(next_chunk)
+                whole = len(audio) - len(audio) % self.frame_bytes
+                for offset in range(0, whole, self.frame_bytes):
+                    if self.first_audio_ms is None:
+                        self.first_audio_ms = round((time.perf_counter() - started) * 1000, 1)
+                    self.bytes += self.frame_bytes
+                    yield audio[offset:offset + self.frame_bytes]
+                carry = audio[whole:]
+            if carry:
+                self.bytes += len(carry)
+                yield carry
+            self.total_ms = round((time.perf_counter() - started) * 1000, 1)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Cancel chunks that have not started synthesizing."""
+        while self._pending:
+            self._pending.popleft().cancel()
+
+    @property
+    def duration_seconds(self) -> float:
+        """Seconds of audio yielded so far."""
+        return round(self.bytes / SAMPLE_WIDTH / self.backend.sample_rate, 2)
+
+    def stats(self) -> dict:
+        """Return chunk counts, audio size and duration, and time to first audio."""
+        return {
+            "chunks": len(self.chunks),
+            "cached_chunks": self.cached_chunks,
+            "bytes": self.bytes,
+            "duration_seconds": self.duration_seconds,
+            "first_audio_ms": self.first_audio_ms,
+            "total_ms": self.total_ms,
+        }
+
+
+def stream_speech(
+    text: str,
+    voice: str = DEFAULT_VOICE,
+    backend=None,
+    concurrency: int = 4,
+    cache: AudioCache | None = None,
+) -> SpeechStream:
+    """Return a :class:`SpeechStream` of PCM frames for ``text``."""
+    return SpeechStream(text, voice=voice, backend=backend, concurrency=concurrency, cache=cache)
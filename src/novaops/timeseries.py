@@ -0,0 +1,324 @@
+"""Columnar in-memory time-series store with ring-buffer retention and rollups.
+
+Each ``(service, metric)`` series keeps its raw samples in two parallel
+float64 ring buffers (timestamps and values). Once a buffer is full, the
+oldest samples are overwritten. As samples arrive, they are also folded into
+rollups at 1 minute, 5 minute and 1 hour resolution. Each rollup bucket stores
+min, max, avg, p95 and count, in its own longer-lived ring buffer. Range
+queries are a binary search plus a slice, so they return in well under a
+millisecond for a day of raw samples.
+
+Samples must arrive in time order per series; older ones are counted in
+``dropped`` and ignored. Listeners added with :meth:`MetricStore.subscribe`
+see every accepted batch, which is how online consumers such as the anomaly
+detector follow the metric stream.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Sequence
+
+import numpy as np
+
+# Rollup bucket width (seconds) -> number of buckets retained.
+ROLLUPS = {60: 1440, 300: 2016, 3600: 720}
+
+# Default number of raw samples kept per series (one day at a 10 second interval).
+DEFAULT_RETENTION = 8640
+
+_ROLLUP_COLUMNS = ("timestamp", "min", "max", "avg", "p95", "count")
+
+
+class _Ring:
+    """Fixed-capacity ring of parallel float64 columns, appended in time order."""
+
+    def __init__(self, capacity: int, columns: Sequence[str]):
+        self.capacity = capacity
+        self.columns = tuple(columns)
+        self._data = np.empty((len(columns), capacity), dtype=np.float64)
+        self._next = 0
+        self.size = 0
+
+    def extend(self, rows: np.ndarray) -> None:
+        """Append ``rows``, shaped ``(len(columns), n)``, overwriting the oldest entries."""
+        n = rows.shape[1]
+        if n >= self.capacity:
+            self._data[:] = rows[:, n - self.capacity:]
+            self._next, self.size = 0, self.capacity
+            return
+        positions = (self._next + np.arange(n)) % self.capacity
+        self._data[:, positions] = rows
+        self._next = (self._next + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+
+    def ordered(self) -> np.ndarray:
+        """Return every live entry in time order (a view unless the ring has wrapped)."""
+        if self.size < self.capacity:
+            return self._data[:, :self.size]
+        if self._next == 0:
+            return self._data
+        return np.concatenate((self._data[:, self._next:], self._data[:, :self._next]), axis=1)
+
+    def first_timestamp(self) -> float | None:
+        if not self.size:
+            return None
+        return float(self._data[0, 0 if self.size < self.capacity else self._next])
+
+    def between(self, start: float, end: float) -> np.ndarray:
+        """Return the entries with ``start <= timestamp <= end``."""
+        data = self.ordered()
+        lo = np.searchsorted(data[0], start, side="left")
+        hi = np.searchsorted(data[0], end, side="right")
+        return data[:, lo:hi]
+
+
+def _aggregate(bucket: float, values: np.ndarray) -> np.ndarray:
+    return np.array([
+        bucket, values.min(), values.max(), values.mean(), np.percentile(values, 95), len(values),
+    ])
+
+
+class Series:
+    """Raw samples and rollups for one metric of one service.
+
+    Args:
+        retention: Number of raw samples kept.
+        rollups: Rollup bucket width in seconds -> number of buckets kept.
+    """
+
+    def __init__(self, retention: int = DEFAULT_RETENTION, rollups: dict[int, int] = ROLLUPS):
+        self.raw = _Ring(retention, ("timestamp", "value"))
+        self.rollups = {res: _Ring(n, _ROLLUP_COLUMNS) for res, n in rollups.items()}
+        # res -> (bucket start, chunks of values in the still-open bucket)
+        self._open: dict[int, tuple[float, list[np.ndarray]]] = {}
+        self.last_timestamp = float("-inf")
+        self.dropped = 0
+
+    def extend(self, timestamps: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Append samples and return the ones that were accepted."""
+        keep = timestamps >= self.last_timestamp
+        if not keep.all():
+            # Keep only the samples that do not go back in time.
+            keep = np.maximum.accumulate(timestamps) == timestamps
+            keep &= timestamps >= self.last_timestamp
+            self.dropped += int((~keep).sum())
+            timestamps, values = timestamps[keep], values[keep]
+        if not len(timestamps):
+            return timestamps, values
+        self.raw.extend(np.vstack((timestamps, values)))
+        self.last_timestamp = float(timestamps[-1])
+        for res, ring in self.rollups.items():
+            self._roll(res, ring, timestamps, values)
+        return timestamps, values
+
+    def _roll(self, res: int, ring: _Ring, timestamps: np.ndarray, values: np.ndarray) -> None:
+        buckets = np.floor(timestamps / res) * res
+        starts = np.flatnonzero(np.diff(buckets)) + 1
+        closed = []
+        for chunk_buckets, chunk_values in zip(np.split(buckets, starts), np.split(values, starts)):
+            bucket = float(chunk_buckets[0])
+            current = self._open.get(res)
+            if current is not None and current[0] == bucket:
+                current[1].append(chunk_values)
+                continue
+            if current is not None:
+                closed.append(_aggregate(current[0], np.concatenate(current[1])))
+            self._open[res] = (bucket, [chunk_values])
+        if closed:
+            ring.extend(np.array(closed).T)
+
+    def open_bucket(self, res: int) -> np.ndarray | None:
+        """Aggregate of the still-filling bucket at resolution ``res``, or None."""
+        current = self._open.get(res)
+        if current is None:
+            return None
+        return _aggregate(current[0], np.concatenate(current[1]))
+
+
+class MetricStore:
+    """Thread-safe collection of :class:`Series`, keyed by ``(service, metric)``.
+
+    Args:
+        retention: Raw samples kept per series.
+        rollups: Rollup bucket width in seconds -> number of buckets kept.
+    """
+
+    def __init__(self, retention: int = DEFAULT_RETENTION, rollups: dict[int, int] = ROLLUPS):
+        self.retention = retention
+        self.rollup_retention = dict(rollups)
+        self._series: dict[tuple[str, str], Series] = {}
+        self._listeners: list[Callable[[str, str, np.ndarray, np.ndarray], None]] = []
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._series
+
+    def keys(self) -> list[tuple[str, str]]:
+        """Return every ``(service, metric)`` pair that has data."""
+        with self._lock:
+            return list(self._series)
+
+    def subscribe(self, listener: Callable[[str, str, np.ndarray, np.ndarray], None]) -> None:
+        """Call ``listener(service, metric, timestamps, values)`` after every accepted batch.
+
+        Listeners run on the recording thread, outside the store lock, in the
+        order they subscribed.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener) -> None:
+        """Stop calling ``listener``."""
+        self._listeners.remove(listener)
+
+    def _get(self, service: str, metric: str, create: bool = False) -> Series | None:
+        series = self._series.get((service, metric))
+        if series is None and create:
+            series = self._series[(service, metric)] = Series(self.retention, self.rollup_retention)
+        return series
+
+    def record(self, service: str, metric: str, value: float, timestamp: float | None = None) -> None:
+        """Append one sample (``timestamp`` in epoch seconds, default now)."""
+        self.record_many(service, metric, [time.time() if timestamp is None else timestamp], [value])
+
+    def record_many(
+        self, service: str, metric: str, timestamps: Sequence[float], values: Sequence[float]
+    ) -> None:
+        """Append samples in time order."""
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        if timestamps.shape != values.shape:
+            raise ValueError("timestamps and values must have the same length")
+        with self._lock:
+            timestamps, values = self._get(service, metric, create=True).extend(timestamps, values)
+        if len(timestamps):
+            for listener in list(self._listeners):
+                listener(service, metric, timestamps, values)
+
+    def last_timestamp(self, service: str, metric: str) -> float | None:
+        """Timestamp of the newest sample of a series, or None if it has none."""
+        with self._lock:
+            series = self._get(service, metric)
+            return series.last_timestamp if series is not None and series.raw.size else None
+
+    def latest(self, service: str, metric: str) -> tuple[float, float] | None:
+        """Return ``(timestamp, value)`` of the newest sample, or None."""
+        with self._lock:
+            series = self._get(service, metric)
+            if series is None or not series.raw.size:
+                return None
+            timestamp, value = series.raw.ordered()[:, -1]
+            return float(timestamp), float(value)
+
+    def query(
+        self,
+        service: str,
+        metric: str,
+        start: float | None = None,
+        end: float | None = None,
+        resolution: int = 0,
+    ) -> dict:
+        """Return samples or rollup buckets in ``[start, end]`` as columns.
+
+        Args:
+            service: Service name.
+            metric: Metric name.
+            start: Range start in epoch seconds (default: everything retained).
+            end: Range end in epoch seconds (default: now).
+            resolution: 0 for raw samples, or a rollup width from :data:`ROLLUPS`.
+
+        Returns:
+            ``{"resolution": ..., "timestamp": [...], "value": [...]}`` for raw
+            samples, or ``timestamp``/``min``/``max``/``avg``/``p95``/``count``
+            columns for rollups. The newest, still-filling bucket is included.
+        """
+        if resolution and resolution not in self.rollup_retention:
+            raise ValueError(f"resolution must be 0 or one of {sorted(self.rollup_retention)}")
+        start = float("-inf") if start is None else start
+        end = time.time() if end is None else end
+        with self._lock:
+            series = self._get(service, metric)
+            ring = None if series is None else series.rollups[resolution] if resolution else series.raw
+            columns = ring.columns if ring else ("timestamp", "value") if not resolution else _ROLLUP_COLUMNS
+            if ring is None:
+                data = np.empty((len(columns), 0))
+            else:
+                data = ring.between(start, end)
+                partial = series.open_bucket(resolution) if resolution else None
+                if partial is not None and start <= partial[0] <= end:
+                    data = np.concatenate((data, partial[:, None]), axis=1)
+        result = {"resolution": resolution}
+        result.update({name: data[i].tolist() for i, name in enumerate(columns)})
+        return result
+
+    def summary(self, service: str, metric: str, start: float, end: float | None = None) -> dict | None:
+        """Return ``count``/``min``/``max``/``avg``/``p95``/``last`` over ``[start, end]``.
+
+        Raw samples are used while they still cover ``start``. For older
+        ranges, the finest rollup that does is used instead, and ``p95`` is then
+        the largest bucket p95 (an upper bound).
+        """
+        end = time.time() if end is None else end
+        with self._lock:
+            series = self._get(service, metric)
+            if series is None or not series.raw.size:
+                return None
+            first = series.raw.first_timestamp()
+            if first <= start or not any(r.size for r in series.rollups.values()):
+                data = series.raw.between(start, end)
+                if not data.shape[1]:
+                    return None
+                values = data[1]
+                return {
+                    "count": int(len(values)),
+                    "min": float(values.min()),
+                    "max": float(values.max()),
+                    "avg": float(values.mean()),
+                    "p95": float(np.percentile(values, 95)),
+                    "last": float(values[-1]),
+                }
+            for res in sorted(series.rollups):
+                ring = series.rollups[res]
+                if (ring.size and ring.first_timestamp() <= start) or res == max(series.rollups):
+                    data = ring.between(start, end)
+                    partial = series.open_bucket(res)
+                    if partial is not None and start <= partial[0] <= end:
+                        data = np.concatenate((data, partial[:, None]), axis=1)
+                    break
+            _, mins, maxs, avgs, p95s, counts = data
+            if not counts.sum():
+                return None
+            return {
+                "count": int(counts.sum()),
+                "min": float(mins.min()),
+                "max": float(maxs.max()),
+                "avg": float((avgs * counts).sum() / counts.sum()),
+                "p95": float(p95s.max()),
+                "last": float(series.raw.ordered()[1, -1]),
+            }
+
+    def trend(self, service: str, metric: str, window: float = 900.0, end: float | None = None) -> str:
+        """Classify the last ``window`` seconds as increasing, decreasing, stable or volatile.
+
+        A least-squares line is fitted to the raw samples. The series is
+        ``volatile`` when the scatter around that line exceeds 25% of the mean.
+        It is ``increasing`` or ``decreasing`` when the fitted change across
+        the window exceeds 5% of the mean. Otherwise it is ``stable``, which is
+        also the answer when there are fewer than three samples.
+        """
+        end = time.time() if end is None else end
+        with self._lock:
+            series = self._get(service, metric)
+            data = None if series is None else series.raw.between(end - window, end)
+        if data is None or data.shape[1] < 3:
+            return "stable"
+        t, v = data[0] - data[0, 0], data[1]
+        scale = abs(v.mean()) or 1.0
+        slope, intercept = np.polyfit(t, v, 1)
+        if (v - (slope * t + intercept)).std() > 0.25 * scale:
+            return "volatile"
+        change = slope * (t[-1] - t[0]) / scale
+        if change > 0.05:
+            return "increasing"
+        if change < -0.05:
+            return "decreasing"
+        return "stable"
@@ -1,13 +1,16 @@
 """NovaOps tool definitions."""
 
-from novaops.tools.infra import check_health, get_metrics
+from novaops.tools.infra import check_health, get_metrics, get_metrics_batch
 from novaops.tools.analysis import search_incidents, root_cause_analysis, get_embeddings
 from novaops.tools.voice import text_to_speech, speech_to_text, voice_alert
-from novaops.tools.dashboard import get_dashboard_data, create_incident, update_incident_status
+from novaops.tools.dashboard import (
+    get_dashboard_data, create_incident, report_alert, update_incident_status,
+)
 
 __all__ = [
     "check_health",
     "get_metrics",
+    "get_metrics_batch",
     "search_incidents",
     "root_cause_analysis",
     "get_embeddings",
@@ -16,5 +19,6 @@ __all__ = [
     "voice_alert",
     "get_dashboard_data",
     "create_incident",
+    "report_alert",
     "update_incident_status",
 ]
@@ -0,0 +1,64 @@
+"""Async variants of every NovaOps tool.
+
+Each tool here has the same name, parameters and docstring as its synchronous
+counterpart in :mod:`novaops.tools`, which keeps working unchanged for the
+CLI and tests. The async variant runs the call on the shared event loop of
+:mod:`novaops.aio`, holding a connection from its backend's pool, so an agent
+calling several tools at once overlaps their I/O instead of parking one
+thread per call. The agents are built with these variants.
+"""
+
+import functools
+
+from strands import tool
+from strands.tools.decorator import DecoratedFunctionTool
+
+from novaops import aio
+from novaops.tools import analysis, dashboard, infra, voice
+
+# Backend (connection pool) each group of tools talks to
+BACKENDS = {
+    "monitoring": (infra.check_health, infra.get_metrics, infra.get_metrics_batch),
+    "incident-search": (analysis.search_incidents, analysis.root_cause_analysis, analysis.get_embeddings),
+    "nova-sonic": (voice.text_to_speech, voice.speech_to_text, voice.voice_alert),
+    "incident-store": (
+        dashboard.get_dashboard_data,
+        dashboard.create_incident,
+        dashboard.report_alert,
+        dashboard.update_incident_status,
+    ),
+}
+
+
+def async_tool(sync_tool: DecoratedFunctionTool, backend: str) -> DecoratedFunctionTool:
+    """Build the async variant of ``sync_tool``, served through ``backend``'s pool."""
+    func = sync_tool._tool_func
+
+    @functools.wraps(func)
+    async def variant(**kwargs):
+        return await aio.call_backend(backend, func, **kwargs)
+
+    return tool(name=sync_tool.tool_name)(variant)
+
+
+_variants = {
+    sync_tool.tool_name: async_tool(sync_tool, backend)
+    for backend, tools in BACKENDS.items()
+    for sync_tool in tools
+}
+
+check_health = _variants["check_health"]
+get_metrics = _variants["get_metrics"]
+get_metrics_batch = _variants["get_metrics_batch"]
+search_incidents = _variants["search_incidents"]
+root_cause_analysis = _variants["root_cause_analysis"]
+get_embeddings = _variants["get_embeddings"]
+text_to_speech = _variants["text_to_speech"]
+speech_to_text = _variants["speech_to_text"]
+voice_alert = _variants["voice_alert"]
+get_dashboard_data = _variants["get_dashboard_data"]
+create_incident = _variants["create_incident"]
+report_alert = _variants["report_alert"]
+update_incident_status = _variants["update_incident_status"]
+
+__all__ = list(_variants)
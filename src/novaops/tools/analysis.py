@@ -1,11 +1,16 @@
 """Analyst tools — incident search, root cause analysis, and embeddings."""
 
 import random
-import hashlib
+import threading
 from datetime import datetime, timezone
+import numpy as np
 from strands import tool
+from novaops.cache import cached
+from novaops.tracing import traced
+from novaops.embeddings import EMBEDDING_DIM, EMBEDDING_MODEL, embed_text
+from novaops.index import IncidentIndex
 
-# Mock incident database for FAISS-style vector search
+# Mock incident database backing the vector index
 _INCIDENT_DB = [
     {
         "id": "INC-001",
@@ -60,12 +65,28 @@ _INCIDENT_DB = [
 ]
 
 
+_incident_index: IncidentIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_incident_index() -> IncidentIndex:
+    """Return the shared incident index, building it from history on first use."""
+    global _incident_index
+    if _incident_index is None:
+        with _index_lock:
+            if _incident_index is None:
+                _incident_index = IncidentIndex.from_records(_INCIDENT_DB)
+    return _incident_index
+
+
 @tool
+@traced
+@cached(ttl=60.0, tags=lambda args: {"search"}, casefold=("query",))
 def search_incidents(query: str) -> dict:
-    """Search incident history using mock FAISS vector similarity search.
+    """Search incident history using vector similarity search.
 
-    Simulates embedding the query and finding the top-k most similar incidents
-    from the historical incident database.
+    Embeds the query and returns the top-k most similar incidents by cosine
+    similarity from the incident index.
 
     Args:
         query: Natural language search query describing the incident or symptoms.
@@ -73,20 +94,7 @@ def search_incidents(query: str) -> dict:
     Returns:
         A dictionary with the search query, result count, and matching incidents.
     """
-    query_lower = query.lower()
-    scored = []
-    for inc in _INCIDENT_DB:
-        score = 0.0
-        text = f"{inc['title']} {inc['description']} {inc['service']}".lower()
-        for word in query_lower.split():
-            if word in text:
-                score += 0.15
-        # Add base similarity so results always come back
-        score = min(score + random.uniform(0.3, 0.6), 1.0)
-        scored.append((round(score, 3), inc))
-
-    scored.sort(key=lambda x: x[0], reverse=True)
-    top_k = scored[:3]
+    top_k = get_incident_index().search(query, k=3)
 
     return {
         "query": query,
@@ -107,6 +115,8 @@ def search_incidents(query: str) -> dict:
 
 
 @tool
+@traced
+@cached(ttl=300.0, tags=lambda args: {f"incident:{args['incident_id']}"})
 def root_cause_analysis(incident_id: str) -> dict:
     """Analyze an incident and return probable root causes.
 
@@ -151,11 +161,12 @@ def root_cause_analysis(incident_id: str) -> dict:
 
 
 @tool
+@traced
 def get_embeddings(text: str) -> dict:
     """Generate mock embeddings for the given text.
 
-    Simulates Amazon Nova Embeddings API. Returns a deterministic fake vector
-    based on the text hash for consistency.
+    Simulates Amazon Nova Embeddings API. Returns a deterministic vector for
+    the text, served from the shared content-addressed embedding cache.
 
     Args:
         text: The text to generate embeddings for.
@@ -163,17 +174,12 @@ def get_embeddings(text: str) -> dict:
     Returns:
         A dictionary with the embedding vector and metadata.
     """
-    # Generate a deterministic pseudo-random vector from text hash
-    text_hash = hashlib.sha256(text.encode()).hexdigest()
-    random.seed(text_hash)
-    dimension = 256
-    vector = [round(random.uniform(-1.0, 1.0), 6) for _ in range(dimension)]
-    random.seed()  # Reset seed
+    vector = np.round(embed_text(text).astype(np.float64), 6)
 
     return {
         "text": text[:100] + ("..." if len(text) > 100 else ""),
-        "model": "amazon.nova-embed-v1",
-        "dimension": dimension,
-        "vector": vector,
+        "model": EMBEDDING_MODEL,
+        "dimension": EMBEDDING_DIM,
+        "vector": vector.tolist(),
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
@@ -1,18 +1,58 @@
 """Dashboard tools — incident management and aggregated dashboard state."""
 
 import random
-import uuid
 from datetime import datetime, timezone
 from strands import tool
+from novaops.cache import cached, invalidate
+from novaops.tracing import traced
+from novaops.correlation import get_correlator
+from novaops.events import get_event_bus
+from novaops.incidents import open_incident_store
+from novaops.tools.analysis import get_incident_index
 
-# In-memory incident store for dashboard operations
-_active_incidents: list[dict] = []
+# Indexed incident store for dashboard operations (persistent if NOVAOPS_DATA_DIR is set)
+_incident_store = open_incident_store()
+# Incident changes are pushed to dashboard subscribers as they happen
+get_event_bus().watch_incidents(_incident_store)
+
+
+def _search_record(incident: dict) -> dict:
+    """Return the incident-search record for a dashboard incident."""
+    return {
+        "id": incident["incident_id"],
+        "title": incident["title"],
+        "severity": incident["severity"],
+        "service": incident.get("service", "unknown"),
+        "description": incident.get("description", ""),
+        "resolved": incident.get("status") in ("resolved", "closed"),
+        "timestamp": incident["created_at"],
+    }
+
+
+def _index_recovered(store) -> None:
+    """Add incidents recovered from disk to the search index, so they stay searchable."""
+    if len(store):
+        get_incident_index().add_many(_search_record(i) for i in store.query())
+
+
+_index_recovered(_incident_store)
 
 
 @tool
-def get_dashboard_data() -> dict:
+@traced
+@cached(ttl=5.0, tags=lambda args: {"dashboard"})
+def get_dashboard_data(status: str = "", severity: str = "", limit: int = 50, offset: int = 0) -> dict:
     """Get aggregated dashboard state including service statuses, active incidents, and agent activity.
 
+    Incidents are returned newest first, one page at a time; ``incident_count``
+    is the total number of incidents matching the filters.
+
+    Args:
+        status: Only include incidents with this status (empty for all).
+        severity: Only include incidents with this severity (empty for all).
+        limit: Maximum number of incidents to include.
+        offset: Number of matching incidents to skip, for paging.
+
     Returns:
         A dictionary with the full dashboard state.
     """
@@ -33,8 +73,16 @@ def get_dashboard_data() -> dict:
 
     return {
         "services": services,
-        "active_incidents": _active_incidents.copy(),
-        "incident_count": len(_active_incidents),
+        "active_incidents": _incident_store.query(
+            status=status or None,
+            severity=severity or None,
+            offset=offset,
+            limit=limit,
+            newest_first=True,
+        ),
+        "incident_count": _incident_store.count(status=status or None, severity=severity or None),
+        "incidents_by_status": _incident_store.counts_by("status"),
+        "incidents_by_severity": _incident_store.counts_by("severity"),
         "agents": agents,
         "system_health": "operational" if all(s["status"] == "healthy" for s in services) else "degraded",
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -42,6 +90,7 @@ def get_dashboard_data() -> dict:
 
 
 @tool
+@traced
 def create_incident(title: str, severity: str, description: str) -> dict:
     """Create a new incident in the dashboard.
 
@@ -57,9 +106,8 @@ def create_incident(title: str, severity: str, description: str) -> dict:
     if severity not in valid_severities:
         severity = "medium"
 
-    incident_id = f"INC-{uuid.uuid4().hex[:6].upper()}"
     incident = {
-        "incident_id": incident_id,
+        "incident_id": None,  # assigned by the store, unique under its lock
         "title": title,
         "severity": severity,
         "description": description,
@@ -68,12 +116,44 @@ def create_incident(title: str, severity: str, description: str) -> dict:
         "updated_at": datetime.now(timezone.utc).isoformat(),
         "assigned_to": None,
     }
-    _active_incidents.append(incident)
+    incident = _incident_store.add(incident)
+    get_incident_index().add(_search_record(incident))
+    invalidate("dashboard", "search", "agents")
 
     return incident
 
 
 @tool
+@traced
+def report_alert(service: str, title: str, severity: str = "medium", description: str = "") -> dict:
+    """Report a monitoring alert, folding it into a related open incident when there is one.
+
+    Alerts that repeat, or that look like symptoms of a problem already being
+    tracked on the same or a dependent service, are linked to that incident as
+    child alerts instead of opening a new one. Prefer this over create_incident
+    for alerts raised by monitoring.
+
+    Args:
+        service: The service the alert fired on (e.g. 'api', 'database').
+        title: Short title of the alert.
+        severity: Alert severity — one of 'low', 'medium', 'high', 'critical'.
+        description: Detailed description of the alert.
+
+    Returns:
+        A dictionary with the alert ID, the incident it was linked to, and
+        whether it opened a new incident.
+    """
+    alert = get_correlator().submit(service, title, severity, description)
+    return {
+        "alert_id": alert["alert_id"],
+        "incident_id": alert["incident_id"],
+        "new_incident": alert["match"] == "new",
+        "match": alert["match"],
+    }
+
+
+@tool
+@traced
 def update_incident_status(incident_id: str, status: str) -> dict:
     """Update the status of an existing incident.
 
@@ -91,16 +171,17 @@ def update_incident_status(incident_id: str, status: str) -> dict:
             "error": f"Invalid status '{status}'. Must be one of {valid_statuses}.",
         }
 
-    for inc in _active_incidents:
-        if inc["incident_id"] == incident_id:
-            inc["status"] = status
-            inc["updated_at"] = datetime.now(timezone.utc).isoformat()
-            return {
-                "incident_id": incident_id,
-                "status": status,
-                "message": f"Incident {incident_id} updated to '{status}'.",
-                "updated_at": inc["updated_at"],
-            }
+    updated = _incident_store.update(
+        incident_id, status=status, updated_at=datetime.now(timezone.utc).isoformat()
+    )
+    if updated is not None:
+        invalidate("dashboard", f"incident:{incident_id}", "agents")
+        return {
+            "incident_id": incident_id,
+            "status": status,
+            "message": f"Incident {incident_id} updated to '{status}'.",
+            "updated_at": updated["updated_at"],
+        }
 
     return {
         "incident_id": incident_id,
@@ -1,11 +1,21 @@
 """Infrastructure monitoring tools for the Monitor Agent."""
 
 import random
+import threading
+import time
 from datetime import datetime, timezone
+import numpy as np
 from strands import tool
+from novaops.cache import cached
+from novaops.anomaly import detection_enabled, start_detection
+from novaops.events import get_event_bus
+from novaops.timeseries import MetricStore
+from novaops.tracing import traced
 
 
 @tool
+@traced
+@cached(ttl=10.0, tags=lambda args: {f"service:{args['service']}"})
 def check_health(service: str) -> dict:
     """Check the health status of a given infrastructure service.
 
@@ -18,6 +28,7 @@ def check_health(service: str) -> dict:
     # Mock health check data
     statuses = ["healthy", "healthy", "healthy", "degraded", "unhealthy"]
     status = random.choice(statuses)
+    get_event_bus().publish_health(service, status)
     return {
         "service": service,
         "status": status,
@@ -27,7 +38,56 @@ def check_health(service: str) -> dict:
     }
 
 
+# Mock value ranges and units per metric type
+_METRIC_SPECS = {
+    "cpu": (5.0, 95.0, "%"),
+    "memory": (20.0, 90.0, "%"),
+    "latency": (1.0, 500.0, "ms"),
+    "throughput": (100.0, 10000.0, "req/s"),
+}
+
+# Seconds between mock samples, and how much history a series starts with.
+SAMPLE_INTERVAL = 10.0
+_BACKFILL_SECONDS = 3600.0
+
+# Time-series store serving get_metrics / get_metrics_batch
+_metric_store = MetricStore()
+_collect_lock = threading.Lock()
+_rng = np.random.default_rng()
+
+# Online anomaly detection opens incidents straight from the metric stream (opt-in)
+if detection_enabled():
+    start_detection(_metric_store)
+
+
+def get_metric_store() -> MetricStore:
+    """Return the shared metric time-series store."""
+    return _metric_store
+
+
+def _collect(service: str, metric_type: str, now: float, history: float = _BACKFILL_SECONDS) -> None:
+    """Bring a series up to ``now`` with mock samples (stands in for a metrics scraper).
+
+    Samples follow a bounded random walk, so trends and window aggregates
+    computed from the store reflect a plausible history.
+    """
+    low, high, _ = _METRIC_SPECS.get(metric_type, _METRIC_SPECS["cpu"])
+    with _collect_lock:
+        latest = _metric_store.latest(service, metric_type)
+        if latest is None:
+            first, start_value = now - history, _rng.uniform(low, high)
+        else:
+            first, start_value = latest[0] + SAMPLE_INTERVAL, latest[1]
+        if first > now:
+            return
+        timestamps = np.arange(first, now + 1e-9, SAMPLE_INTERVAL)
+        steps = _rng.normal(0.0, (high - low) * 0.02, len(timestamps))
+        values = np.clip(start_value + np.cumsum(steps), low, high).round(1)
+        _metric_store.record_many(service, metric_type, timestamps, values)
+
+
 @tool
+@traced
 def get_metrics(service: str, metric_type: str = "cpu") -> dict:
     """Retrieve performance metrics for a given infrastructure service.
 
@@ -36,21 +96,70 @@ def get_metrics(service: str, metric_type: str = "cpu") -> dict:
         metric_type: The type of metric to retrieve. One of 'cpu', 'memory', 'latency', 'throughput'.
 
     Returns:
-        A dictionary containing the requested metrics.
+        A dictionary containing the latest reading and its trend over the last 15 minutes
+        ('increasing', 'decreasing', 'stable' or 'volatile').
     """
-    # Mock metrics data
-    metric_ranges = {
-        "cpu": {"value": round(random.uniform(5.0, 95.0), 1), "unit": "%"},
-        "memory": {"value": round(random.uniform(20.0, 90.0), 1), "unit": "%"},
-        "latency": {"value": round(random.uniform(1.0, 500.0), 1), "unit": "ms"},
-        "throughput": {"value": round(random.uniform(100.0, 10000.0), 1), "unit": "req/s"},
-    }
-    metric = metric_ranges.get(metric_type, metric_ranges["cpu"])
+    now = time.time()
+    _collect(service, metric_type, now)
+    timestamp, value = _metric_store.latest(service, metric_type)
     return {
         "service": service,
         "metric_type": metric_type,
-        "value": metric["value"],
-        "unit": metric["unit"],
+        "value": round(value, 1),
+        "unit": _METRIC_SPECS.get(metric_type, _METRIC_SPECS["cpu"])[2],
+        "timestamp": datetime.fromtimestamp(timestamp, timezone.utc).isoformat(),
+        "trend": _metric_store.trend(service, metric_type, window=900, end=now),
+    }
+
+
+@tool
+@traced
+def get_metrics_batch(
+    services: list[str],
+    metric_types: list[str] | None = None,
+    window_minutes: int = 5,
+) -> dict:
+    """Retrieve several metrics for several services in one call.
+
+    Use this instead of repeated get_metrics calls when building a fleet or
+    multi-service report. Results are columnar: every list under ``columns``
+    has one entry per (service, metric_type) row, in service-major order.
+
+    Args:
+        services: The names of the services to query.
+        metric_types: Metric types to retrieve for every service. Any of 'cpu', 'memory',
+            'latency', 'throughput'. Defaults to all four.
+        window_minutes: Size of the trailing window, in minutes, that min/avg/max and trend cover.
+
+    Returns:
+        A dictionary with the query echo, row count, and columnar metric data.
+    """
+    metric_types = list(metric_types) if metric_types else list(_METRIC_SPECS)
+    window_minutes = max(int(window_minutes), 1)
+
+    columns: dict[str, list] = {
+        name: [] for name in ("service", "metric_type", "value", "min", "avg", "max", "unit", "trend")
+    }
+    now = time.time()
+    window = window_minutes * 60.0
+    for service in services:
+        for metric_type in metric_types:
+            _collect(service, metric_type, now, history=max(window, _BACKFILL_SECONDS))
+            stats = _metric_store.summary(service, metric_type, now - window, now)
+            columns["service"].append(service)
+            columns["metric_type"].append(metric_type)
+            columns["value"].append(round(stats["last"], 1))
+            columns["min"].append(round(stats["min"], 1))
+            columns["avg"].append(round(stats["avg"], 1))
+            columns["max"].append(round(stats["max"], 1))
+            columns["unit"].append(_METRIC_SPECS.get(metric_type, _METRIC_SPECS["cpu"])[2])
+            columns["trend"].append(_metric_store.trend(service, metric_type, window=window, end=now))
+
+    return {
+        "services": list(services),
+        "metric_types": metric_types,
+        "window_minutes": window_minutes,
+        "row_count": len(columns["service"]),
+        "columns": columns,
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "trend": random.choice(["stable", "increasing", "decreasing"]),
     }
@@ -4,11 +4,18 @@ import hashlib
 import random
 from datetime import datetime, timezone
 from strands import tool
+from novaops.broadcast import CHANNEL_RECIPIENTS, SEVERITY_CHANNELS, get_dispatcher
+from novaops.synthesis import SAMPLE_RATE, stream_speech
+from novaops.tracing import traced
 
 
 @tool
+@traced
 def text_to_speech(text: str) -> dict:
-    """Convert text to speech using mock TTS (simulates Amazon Nova Sonic integration).
+    """Convert text to speech with the configured synthesis backend (simulates Amazon Nova Sonic).
+
+    The text is synthesized sentence by sentence through the streaming
+    pipeline in :mod:`novaops.synthesis`.
 
     Args:
         text: The text to convert to speech audio.
@@ -17,16 +24,19 @@ def text_to_speech(text: str) -> dict:
         A dictionary with audio metadata including format, duration, and reference ID.
     """
     text_hash = hashlib.md5(text.encode()).hexdigest()[:12]
-    word_count = len(text.split())
-    # Approximate duration: ~150 words per minute
-    duration_seconds = round(max(word_count / 2.5, 0.5), 2)
+    stream = stream_speech(text)
+    for _ in stream:
+        pass
 
     return {
         "text": text[:200] + ("..." if len(text) > 200 else ""),
         "audio_ref": f"audio-{text_hash}",
-        "format": "pcm_16000",
-        "sample_rate": 16000,
-        "duration_seconds": duration_seconds,
+        "format": f"pcm_{SAMPLE_RATE}",
+        "sample_rate": SAMPLE_RATE,
+        "duration_seconds": stream.duration_seconds,
+        "chunks": len(stream.chunks),
+        "cached_chunks": stream.cached_chunks,
+        "first_audio_ms": stream.first_audio_ms,
         "model": "amazon.nova-sonic-v1:0",
         "status": "synthesized",
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -34,6 +44,7 @@ def text_to_speech(text: str) -> dict:
 
 
 @tool
+@traced
 def speech_to_text(audio_ref: str) -> dict:
     """Transcribe speech audio to text using mock STT (simulates Amazon Nova Sonic integration).
 
@@ -72,33 +83,36 @@ def speech_to_text(audio_ref: str) -> dict:
 
 
 @tool
+@traced
 def voice_alert(message: str, severity: str) -> dict:
     """Broadcast a voice alert to the operations team.
 
+    The alert is queued for delivery and the call returns at once; speech is
+    synthesized when each channel delivers it. Alerts that follow each other
+    closely on a channel are coalesced into one digest, and each channel is
+    rate limited, so an alert storm does not page the on-call engineer for
+    every alert.
+
     Args:
         message: The alert message to broadcast.
         severity: Alert severity level — one of 'info', 'warning', 'critical'.
 
     Returns:
-        A dictionary with the alert broadcast status and metadata.
+        A dictionary with the broadcast ID, channels and queueing status.
     """
-    valid_severities = ("info", "warning", "critical")
-    if severity not in valid_severities:
+    if severity not in SEVERITY_CHANNELS:
         severity = "info"
 
-    channels = {
-        "info": ["ops-general"],
-        "warning": ["ops-general", "ops-oncall"],
-        "critical": ["ops-general", "ops-oncall", "ops-escalation"],
-    }
-
+    audio_ref = f"alert-{hashlib.md5(message.encode()).hexdigest()[:8]}"
+    broadcast = get_dispatcher().submit(message, severity, audio_ref=audio_ref)
     return {
         "message": message,
         "severity": severity,
-        "channels": channels[severity],
-        "broadcast_status": "delivered",
-        "recipients_count": len(channels[severity]) * random.randint(2, 8),
-        "audio_ref": f"alert-{hashlib.md5(message.encode()).hexdigest()[:8]}",
+        "broadcast_id": broadcast["broadcast_id"],
+        "channels": broadcast["channels"],
+        "broadcast_status": "queued",
+        "recipients_count": sum(CHANNEL_RECIPIENTS[c] for c in broadcast["channels"]),
+        "audio_ref": audio_ref,
         "model": "amazon.nova-sonic-v1:0",
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
@@ -0,0 +1,448 @@
+"""Lightweight latency and token tracing for tools, agents and model calls.
+
+Four kinds of span are recorded:
+
+- ``tool``: a ``@tool`` function call, via :func:`traced`.
+- ``agent``: an agent invocation, via :func:`traced_stream` or :func:`traced_call`.
+- ``model``: a single model call inside an agent, via :class:`TracingHooks`.
+- ``route``: a request on one model tier, via :class:`novaops.router.ModelRouter`.
+
+Spans nest through a context variable, so the tools and model calls of a
+sub-agent are children of that sub-agent's span. The sub-agent span is itself a
+child of the Commander request that delegated to it. Each finished span is
+kept in a bounded buffer and folded into per-``(kind, name)`` aggregates.
+The buffer can be exported as JSON lines. The aggregates can be rendered in
+the Prometheus text format, and :func:`serve_metrics` serves both locally.
+
+Tracing is off by default. Set ``NOVAOPS_TRACING=1`` (or call :func:`enable`)
+to turn it on. When it is off, a traced call costs one global flag check.
+``NOVAOPS_TRACE_FILE`` additionally appends every finished span to a JSON
+lines file.
+"""
+
+import contextlib
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from typing import IO
+
+from strands.hooks import AfterModelCallEvent, BeforeModelCallEvent, HookProvider, HookRegistry
+
+# Upper bounds, in seconds, of the duration histogram buckets.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_enabled = os.getenv("NOVAOPS_TRACING", "0").lower() in ("1", "true", "on")
+_current: contextvars.ContextVar["Span | None"] = contextvars.ContextVar(
+    "novaops_span", default=None
+)
+_span_ids = itertools.count(1)
+
+
+def tracing_enabled() -> bool:
+    """Return True when spans are being recorded."""
+    return _enabled
+
+
+def enable(on: bool = True) -> None:
+    """Switch tracing on (or off with ``enable(False)``) at runtime."""
+    global _enabled
+    _enabled = on
+
+
+class Span:
+    """One timed operation, with token usage and an optional error.
+
+    Args:
+        name: Tool, agent or model-owner name, or a route tier.
+        kind: ``"tool"``, ``"agent"``, ``"model"`` or ``"route"``.
+        parent: Enclosing span; None starts a new trace.
+        attributes: Extra key/value pairs exported with the span.
+    """
+
+    __slots__ = (
+        "name", "kind", "trace_id", "span_id", "parent_id", "attributes",
+        "start", "duration_ms", "input_tokens", "output_tokens", "error", "_t0",
+    )
+
+    def __init__(self, name: str, kind: str, parent: "Span | None" = None, **attributes):
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex[:16]
+        self.span_id = next(_span_ids)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.start = time.time()
+        self.duration_ms: float | None = None
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.error: str | None = None
+        self._t0 = time.perf_counter()
+
+    def add_tokens(self, input_tokens: int = 0, output_tokens: int = 0) -> None:
+        """Add model token usage to this span."""
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+
+    def fail(self, exc: BaseException) -> None:
+        """Mark the span as failed with ``exc``."""
+        self.error = f"{type(exc).__name__}: {exc}"
+
+    def finish(self) -> None:
+        """Stop the clock and hand the span to the recorder."""
+        self.duration_ms = round((time.perf_counter() - self._t0) * 1000, 3)
+        _recorder.record(self)
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": self.duration_ms,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class _Aggregate:
+    __slots__ = ("count", "errors", "duration_sum", "buckets", "input_tokens", "output_tokens")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.duration_sum = 0.0
+        self.buckets = [0] * len(DURATION_BUCKETS)
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+
+class SpanRecorder:
+    """Bounded buffer of finished spans plus per-name aggregates.
+
+    Args:
+        maxlen: Number of most recent spans kept for export.
+        sink_path: Optional JSON lines file every finished span is appended to.
+    """
+
+    def __init__(self, maxlen: int = 10_000, sink_path: str | None = None):
+        self._spans: deque[Span] = deque(maxlen=maxlen)
+        self._aggregates: dict[tuple[str, str], _Aggregate] = {}
+        self._lock = threading.Lock()
+        self._sink: IO[str] | None = open(sink_path, "a") if sink_path else None
+
+    def record(self, span: Span) -> None:
+        seconds = span.duration_ms / 1000
+        line = json.dumps(span.to_dict(), default=str) if self._sink else None
+        with self._lock:
+            self._spans.append(span)
+            agg = self._aggregates.get((span.kind, span.name))
+            if agg is None:
+                agg = self._aggregates[(span.kind, span.name)] = _Aggregate()
+            agg.count += 1
+            agg.errors += span.error is not None
+            agg.duration_sum += seconds
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if seconds <= bound:
+                    agg.buckets[i] += 1
+                    break
+            agg.input_tokens += span.input_tokens
+            agg.output_tokens += span.output_tokens
+            if line is not None:
+                self._sink.write(line + "\n")
+                self._sink.flush()
+
+    def spans(self) -> list[dict]:
+        """Return the buffered spans, oldest first, as dictionaries."""
+        with self._lock:
+            return [span.to_dict() for span in self._spans]
+
+    def summary(self) -> dict[str, dict]:
+        """Return count, error, latency and token totals keyed by ``"kind:name"``."""
+        with self._lock:
+            return {
+                f"{kind}:{name}": {
+                    "count": agg.count,
+                    "errors": agg.errors,
+                    "total_ms": round(agg.duration_sum * 1000, 3),
+                    "avg_ms": round(agg.duration_sum * 1000 / agg.count, 3),
+                    "input_tokens": agg.input_tokens,
+                    "output_tokens": agg.output_tokens,
+                }
+                for (kind, name), agg in sorted(self._aggregates.items())
+            }
+
+    def prometheus(self) -> str:
+        """Render the aggregates in the Prometheus text exposition format."""
+        lines = [
+            "# HELP novaops_span_duration_seconds Duration of traced tool, agent and model calls.",
+            "# TYPE novaops_span_duration_seconds histogram",
+        ]
+        with self._lock:
+            aggregates = sorted(self._aggregates.items())
+            for (kind, name), agg in aggregates:
+                labels = f'kind="{kind}",name="{name}"'
+                cumulative = 0
+                for bound, n in zip(DURATION_BUCKETS, agg.buckets):
+                    cumulative += n
+                    lines.append(
+                        f'novaops_span_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                    )
+                lines.append(f'novaops_span_duration_seconds_bucket{{{labels},le="+Inf"}} {agg.count}')
+                lines.append(f"novaops_span_duration_seconds_sum{{{labels}}} {agg.duration_sum:.6f}")
+                lines.append(f"novaops_span_duration_seconds_count{{{labels}}} {agg.count}")
+            lines += [
+                "# HELP novaops_span_errors_total Traced calls that raised an error.",
+                "# TYPE novaops_span_errors_total counter",
+            ]
+            for (kind, name), agg in aggregates:
+                lines.append(f'novaops_span_errors_total{{kind="{kind}",name="{name}"}} {agg.errors}')
+            lines += [
+                "# HELP novaops_tokens_total Model tokens used, by span and direction.",
+                "# TYPE novaops_tokens_total counter",
+            ]
+            for (kind, name), agg in aggregates:
+                if kind == "tool":
+                    continue
+                for direction, n in (("input", agg.input_tokens), ("output", agg.output_tokens)):
+                    lines.append(
+                        f'novaops_tokens_total{{kind="{kind}",name="{name}",direction="{direction}"}} {n}'
+                    )
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Drop every buffered span and aggregate."""
+        with self._lock:
+            self._spans.clear()
+            self._aggregates.clear()
+
+
+_recorder = SpanRecorder(
+    maxlen=int(os.getenv("NOVAOPS_TRACE_BUFFER", "10000")),
+    sink_path=os.getenv("NOVAOPS_TRACE_FILE") or None,
+)
+
+
+def current_span() -> Span | None:
+    """Return the innermost open span in this context, if any."""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def span(name: str, kind: str = "tool", **attributes):
+    """Time the enclosed block as a child of the current span.
+
+    Yields the :class:`Span`, or None when tracing is disabled.
+    """
+    if not _enabled:
+        yield None
+        return
+    current = Span(name, kind, _current.get(), **attributes)
+    token = _current.set(current)
+    try:
+        yield current
+    except GeneratorExit:
+        raise
+    except BaseException as exc:
+        current.fail(exc)
+        raise
+    finally:
+        try:
+            _current.reset(token)
+        except ValueError:
+            # Async generators may be finalised from another context.
+            _current.set(None)
+        current.finish()
+
+
+def traced(func=None, *, name: str | None = None, kind: str = "tool"):
+    """Record a span around every call of a function.
+
+    Works on plain functions and async generator functions (streaming tools).
+    Apply it directly underneath ``@tool`` so direct calls and agent calls
+    are both traced, and cache hits show up as fast spans.
+
+    Args:
+        name: Span name; defaults to the function name.
+        kind: Span kind.
+    """
+
+    def decorate(func):
+        span_name = name or func.__name__
+
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def stream_wrapper(*args, **kwargs):
+                if not _enabled:
+                    async for event in func(*args, **kwargs):
+                        yield event
+                    return
+                with span(span_name, kind):
+                    async for event in func(*args, **kwargs):
+                        yield event
+
+            return stream_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with span(span_name, kind):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate(func) if func is not None else decorate
+
+
+def _usage_of(result) -> dict:
+    invocation = getattr(getattr(result, "metrics", None), "latest_agent_invocation", None)
+    return invocation.usage if invocation is not None else {}
+
+
+async def traced_stream(agent, prompt, **kwargs):
+    """``agent.stream_async(prompt)`` wrapped in an ``agent`` span.
+
+    The span carries the invocation's token usage, taken from the final result.
+    """
+    if not _enabled:
+        async for event in agent.stream_async(prompt, **kwargs):
+            yield event
+        return
+    with span(agent.name, "agent") as current:
+        async for event in agent.stream_async(prompt, **kwargs):
+            if "result" in event:
+                usage = _usage_of(event["result"])
+                current.add_tokens(usage.get("inputTokens", 0), usage.get("outputTokens", 0))
+            yield event
+
+
+def traced_call(agent, prompt, **kwargs):
+    """``agent(prompt)`` wrapped in an ``agent`` span carrying its token usage."""
+    if not _enabled:
+        return agent(prompt, **kwargs)
+    with span(agent.name, "agent") as current:
+        result = agent(prompt, **kwargs)
+        usage = _usage_of(result)
+        current.add_tokens(usage.get("inputTokens", 0), usage.get("outputTokens", 0))
+        return result
+
+
+class TracingHooks(HookProvider):
+    """Agent hooks that record one ``model`` span per model call.
+
+    Add to an agent with ``Agent(..., hooks=[TracingHooks()])``. Together
+    with the agent span, these show how much of an invocation was spent
+    waiting on the model rather than in tools.
+    """
+
+    _KEY = "novaops_model_span"
+
+    def register_hooks(self, registry: HookRegistry, **kwargs) -> None:
+        registry.add_callback(BeforeModelCallEvent, self._before)
+        registry.add_callback(AfterModelCallEvent, self._after)
+
+    def _before(self, event: BeforeModelCallEvent) -> None:
+        if _enabled:
+            event.invocation_state[self._KEY] = Span(event.agent.name, "model", _current.get())
+
+    def _after(self, event: AfterModelCallEvent) -> None:
+        current = event.invocation_state.pop(self._KEY, None)
+        if current is None:
+            return
+        if event.exception is not None:
+            current.fail(event.exception)
+        elif event.stop_response is not None:
+            usage = event.stop_response.message.get("metadata", {}).get("usage", {})
+            current.add_tokens(usage.get("inputTokens", 0), usage.get("outputTokens", 0))
+        current.finish()
+
+
+def get_spans() -> list[dict]:
+    """Return the buffered finished spans, oldest first."""
+    return _recorder.spans()
+
+
+def trace_summary() -> dict[str, dict]:
+    """Return per-``kind:name`` call counts, errors, latency and tokens."""
+    return _recorder.summary()
+
+
+def clear_traces() -> None:
+    """Drop every buffered span and aggregate."""
+    _recorder.clear()
+
+
+def export_jsonl(target: str | IO[str]) -> int:
+    """Write the buffered spans as JSON lines to a path or open file.
+
+    Returns:
+        The number of spans written.
+    """
+    spans = get_spans()
+    text = "".join(json.dumps(s, default=str) + "\n" for s in spans)
+    if isinstance(target, str):
+        with open(target, "a") as f:
+            f.write(text)
+    else:
+        target.write(text)
+    return len(spans)
+
+
+def prometheus_text() -> str:
+    """Render span aggregates and response-cache counters for Prometheus."""
+    from novaops.cache import cache_stats
+
+    lines = [_recorder.prometheus()]
+    stats = cache_stats()
+    for metric in ("hits", "misses", "evictions", "invalidations"):
+        lines.append(f"# TYPE novaops_cache_{metric}_total counter\n")
+        lines.extend(
+            f'novaops_cache_{metric}_total{{cache="{name}"}} {s[metric]}\n'
+            for name, s in stats.items()
+        )
+    return "".join(lines)
+
+
+def serve_metrics(port: int = 9464, host: str = "127.0.0.1"):
+    """Serve ``/metrics`` (Prometheus text) and ``/spans`` (JSON lines) on a daemon thread.
+
+    Returns:
+        The running server; call ``shutdown()`` to stop it.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body, content_type = prometheus_text(), "text/plain; version=0.0.4"
+            elif self.path == "/spans":
+                body = "".join(json.dumps(s, default=str) + "\n" for s in get_spans())
+                content_type = "application/x-ndjson"
+            else:
+                self.send_error(404)
+                return
+            payload = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="novaops-metrics", daemon=True).start()
+    return server
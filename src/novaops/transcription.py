@@ -0,0 +1,280 @@
+"""Streaming speech-to-text over raw PCM frames, with voice-activity detection.
+
+Voice commands used to be recorded in full and then transcribed from an
+``audio_ref``. :class:`StreamingTranscriber` instead takes 16 kHz 16-bit
+mono PCM as it arrives, in chunks of any size, and:
+
+- cuts utterances with an energy-based voice-activity detector that tracks
+  the background noise floor, keeps a short pre-roll so the onset of speech
+  is not clipped, and ends an utterance after a stretch of silence;
+- emits a partial hypothesis every ``partial_ms`` of speech and a final one
+  as soon as the utterance ends.
+
+:func:`transcribe_stream` and :func:`atranscribe_stream` drive it from a
+generator or an async iterator. :func:`voice_commands` hands every final
+transcript to the Commander's router straight away, so a spoken "health
+api" is answered by the fast path while the operator is still listening.
+
+The recognizer is pluggable: any object with ``recognize(pcm, final) ->
+(text, confidence)`` can be passed in. :class:`StubRecognizer` runs offline.
+"""
+
+import math
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from dataclasses import dataclass
+
+import numpy as np
+from strands import Agent
+
+from novaops.aio import to_thread
+from novaops.synthesis import SAMPLE_RATE, SAMPLE_WIDTH
+
+_DEFAULT_TRANSCRIPT = "Check the current system status and report any issues"
+# Speaking rate the stub assumes when revealing words of a partial (~150 words per minute).
+_WORDS_PER_SECOND = 2.5
+# Share of the gap the noise floor closes per frame when the level drops below it.
+_FLOOR_FALL_RATE = 0.2
+
+
+@dataclass
+class Hypothesis:
+    """A partial or final transcription of one utterance."""
+
+    text: str
+    final: bool
+    utterance: int
+    start_ms: int
+    end_ms: int
+    confidence: float
+
+
+class StubRecognizer:
+    """Offline stand-in for a speech recognition backend.
+
+    It cannot understand audio: the final text of the n-th utterance is the
+    n-th scripted transcript (or a fixed status request once the script runs
+    out), and a partial reveals as many of its words as fit the speech heard
+    so far.
+
+    Args:
+        transcripts: Final texts, one per utterance, in order.
+    """
+
+    def __init__(self, transcripts: Iterable[str] = ()):
+        self._transcripts = deque(transcripts)
+        self.requests = 0
+
+    def recognize(self, pcm: bytes, final: bool) -> tuple[str, float]:
+        """Return ``(text, confidence)`` for the utterance audio heard so far."""
+        self.requests += 1
+        text = self._transcripts[0] if self._transcripts else _DEFAULT_TRANSCRIPT
+        if final:
+            if self._transcripts:
+                self._transcripts.popleft()
+            return text, 0.95
+        words = text.split()
+        heard = len(pcm) / SAMPLE_WIDTH / SAMPLE_RATE * _WORDS_PER_SECOND
+        return " ".join(words[: min(len(words), math.ceil(heard))]), 0.6
+
+
+class StreamingTranscriber:
+    """Cuts a PCM stream into utterances and transcribes them incrementally.
+
+    A frame is voiced when its RMS level is ``threshold`` times the noise
+    floor (and at least ``min_rms``). The floor follows every frame, falling
+    fast and rising slowly (``noise_rise_ms``), so steady background noise is
+    soon treated as silence while speech, whose level keeps moving, is not.
+    An utterance no louder than the floor it ended on was noise after all and
+    is dropped without a final hypothesis.
+
+    Args:
+        recognizer: Speech recognition backend; defaults to :class:`StubRecognizer`.
+        sample_rate: Input sample rate in Hz.
+        frame_ms: Length of the frames the detector works on.
+        threshold: Ratio of speech level to noise floor that counts as voiced.
+        min_rms: Lowest level (of 32768) that counts as voiced.
+        start_ms: Voiced audio needed to open an utterance.
+        end_ms: Silence that ends an utterance.
+        partial_ms: Speech between partial hypotheses.
+        max_utterance_ms: Longest utterance before it is cut.
+        preroll_ms: Audio kept from before the utterance opened.
+        noise_rise_ms: Time constant of the noise floor rising towards a louder level.
+    """
+
+    def __init__(
+        self,
+        recognizer=None,
+        sample_rate: int = SAMPLE_RATE,
+        frame_ms: int = 20,
+        threshold: float = 3.0,
+        min_rms: float = 300.0,
+        start_ms: int = 60,
+        end_ms: int = 500,
+        partial_ms: int = 300,
+        max_utterance_ms: int = 15_000,
+        preroll_ms: int = 200,
+        noise_rise_ms: int = 8000,
+    ):
+        self.recognizer = recognizer or StubRecognizer()
+        self.frame_ms = frame_ms
+        self.frame_bytes = sample_rate * frame_ms // 1000 * SAMPLE_WIDTH
+        self.threshold = threshold
+        self.min_rms = min_rms
+        self.start_frames = max(start_ms // frame_ms, 1)
+        self.end_frames = max(end_ms // frame_ms, 1)
+        self.partial_frames = max(partial_ms // frame_ms, 1)
+        self.max_frames = max(max_utterance_ms // frame_ms, 1)
+        self.noise_floor = min_rms / threshold
+        self.rise_rate = min(frame_ms / noise_rise_ms, 1.0)
+        self.utterances = 0
+        self.discarded = 0
+        self._pending = b""
+        self._position = 0  # frames seen
+        self._preroll: deque[bytes] = deque(maxlen=max(preroll_ms // frame_ms, self.start_frames))
+        self._voiced_run = 0
+        self._speech: list[bytes] | None = None
+        self._start = 0
+        self._silent_run = 0
+        self._since_partial = 0
+
+    def _is_voiced(self, frame: bytes) -> bool:
+        samples = np.frombuffer(frame, dtype="<i2").astype(np.float32)
+        rms = float(np.sqrt(np.mean(samples * samples)))
+        voiced = rms >= max(self.noise_floor * self.threshold, self.min_rms)
+        rate = self.rise_rate if rms > self.noise_floor else _FLOOR_FALL_RATE
+        self.noise_floor += rate * (rms - self.noise_floor)
+        return voiced
+
+    def feed(self, pcm: bytes) -> list[Hypothesis]:
+        """Process more audio; return the hypotheses it produced, in order."""
+        data = self._pending + pcm
+        whole = len(data) - len(data) % self.frame_bytes
+        self._pending = data[whole:]
+        hypotheses = []
+        for offset in range(0, whole, self.frame_bytes):
+            hypothesis = self._frame(data[offset:offset + self.frame_bytes])
+            if hypothesis is not None:
+                hypotheses.append(hypothesis)
+        return hypotheses
+
+    def flush(self) -> list[Hypothesis]:
+        """End the stream: finish any open utterance."""
+        self._pending = b""
+        hypothesis = self._finish() if self._speech is not None else None
+        return [] if hypothesis is None else [hypothesis]
+
+    def _frame(self, frame: bytes) -> Hypothesis | None:
+        self._position += 1
+        voiced = self._is_voiced(frame)
+        if self._speech is None:
+            self._preroll.append(frame)
+            self._voiced_run = self._voiced_run + 1 if voiced else 0
+            if self._voiced_run >= self.start_frames:
+                self._speech = list(self._preroll)
+                self._start = self._position - len(self._speech)
+                self._preroll.clear()
+                self._voiced_run = self._silent_run = self._since_partial = 0
+            return None
+
+        self._speech.append(frame)
+        self._silent_run = 0 if voiced else self._silent_run + 1
+        self._since_partial += 1
+        if self._silent_run >= self.end_frames or len(self._speech) >= self.max_frames:
+            return self._finish()
+        if self._since_partial >= self.partial_frames:
+            self._since_partial = 0
+            return self._hypothesis(final=False)
+        return None
+
+    def _hypothesis(self, final: bool) -> Hypothesis:
+        text, confidence = self.recognizer.recognize(b"".join(self._speech), final)
+        return Hypothesis(
+            text=text,
+            final=final,
+            utterance=self.utterances,
+            start_ms=self._start * self.frame_ms,
+            end_ms=(self._start + len(self._speech)) * self.frame_ms,
+            confidence=confidence,
+        )
+
+    def _finish(self) -> Hypothesis | None:
+        if self._is_noise():
+            self._speech = None
+            self.discarded += 1
+            return None
+        hypothesis = self._hypothesis(final=True)
+        self._speech = None
+        self.utterances += 1
+        return hypothesis
+
+    def _is_noise(self) -> bool:
+        """Whether the open utterance, without its trailing silence, is no louder than the floor."""
+        frames = self._speech[: len(self._speech) - self._silent_run] or self._speech
+        samples = np.frombuffer(b"".join(frames), dtype="<i2").astype(np.float32)
+        levels = np.sqrt(np.mean(samples.reshape(len(frames), -1) ** 2, axis=1))
+        return float(np.median(levels)) < self.noise_floor * self.threshold
+
+
+def transcribe_stream(frames: Iterable[bytes], recognizer=None, **options) -> Iterator[Hypothesis]:
+    """Transcribe PCM chunks from ``frames``, yielding hypotheses as they are produced.
+
+    Args:
+        frames: 16 kHz 16-bit mono PCM, in chunks of any size.
+        recognizer: Speech recognition backend; defaults to :class:`StubRecognizer`.
+        **options: Voice-activity settings for :class:`StreamingTranscriber`.
+    """
+    transcriber = StreamingTranscriber(recognizer, **options)
+    for chunk in frames:
+        yield from transcriber.feed(chunk)
+    yield from transcriber.flush()
+
+
+async def atranscribe_stream(
+    frames: AsyncIterable[bytes], recognizer=None, **options
+) -> AsyncIterator[Hypothesis]:
+    """Async variant of :func:`transcribe_stream`; recognition runs on the shared worker pool."""
+    transcriber = StreamingTranscriber(recognizer, **options)
+    async for chunk in frames:
+        for hypothesis in await to_thread(transcriber.feed, chunk):
+            yield hypothesis
+    for hypothesis in transcriber.flush():
+        yield hypothesis
+
+
+def voice_commands(
+    frames: Iterable[bytes],
+    agent: Agent | None = None,
+    invoke: Callable[[Agent, str], object] | None = None,
+    router=None,
+    recognizer=None,
+    **options,
+) -> Iterator[tuple[Hypothesis, object]]:
+    """Run each spoken command through the Commander's router as soon as it ends.
+
+    Args:
+        frames: 16 kHz 16-bit mono PCM, in chunks of any size.
+        agent: Commander for commands the fast path cannot answer; defaults
+            to a new session from :func:`novaops.memory.get_session_agent`.
+        invoke: Runs the Commander; defaults to ``traced_call``.
+        router: Defaults to :func:`novaops.router.get_router`.
+        recognizer: Speech recognition backend.
+        **options: Voice-activity settings for :class:`StreamingTranscriber`.
+
+    Yields:
+        ``(final hypothesis, routed result)`` per utterance. Empty
+        transcripts are skipped.
+    """
+    from novaops.router import get_router
+    from novaops.tracing import traced_call
+
+    router = router or get_router()
+    invoke = invoke or traced_call
+    for hypothesis in transcribe_stream(frames, recognizer, **options):
+        if not hypothesis.final or not hypothesis.text.strip():
+            continue
+        if agent is None and router.classify(hypothesis.text).tier != "fast":
+            from novaops.memory import get_session_agent
+
+            agent = get_session_agent()
+        yield hypothesis, router.handle(agent, hypothesis.text, invoke)
@@ -0,0 +1,46 @@
+"""Shared fixtures for NovaOps tests."""
+
+import pytest
+from novaops.agents import analyst, bedrock, commander, dashboard, monitor, voice
+from novaops.cache import clear_caches
+from novaops.agents.stub import StubModel
+
+_FACTORIES = [
+    commander.get_commander_agent,
+    monitor.get_monitor_agent,
+    analyst.get_analyst_agent,
+    voice.get_voice_agent,
+    dashboard.get_dashboard_agent,
+]
+
+
+def _default_plan(prompt, tool_names):
+    if "monitor_agent" in tool_names:
+        return [("monitor_agent", {"query": prompt})]
+    if "check_health" in tool_names:
+        return [("check_health", {"service": "api"})]
+    return []
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    """Start every test with empty response caches."""
+    clear_caches()
+    yield
+    clear_caches()
+
+
+@pytest.fixture
+def install_stub(monkeypatch):
+    """Return a function that routes every agent factory to the given StubModel."""
+
+    def install(stub: StubModel | None = None) -> StubModel:
+        stub = stub or StubModel(plan=_default_plan)
+        monkeypatch.setattr(bedrock, "_model", lambda *args: stub)
+        for factory in _FACTORIES:
+            factory.cache_clear()
+        return stub
+
+    yield install
+    for factory in _FACTORIES:
+        factory.cache_clear()
@@ -0,0 +1,89 @@
+"""Tests for the shared event loop and the async tool variants."""
+
+import asyncio
+import threading
+
+import pytest
+from novaops import aio, tracing
+from novaops.tools import aio as async_tools
+from novaops.tools import check_health, get_metrics
+
+
+class TestSharedLoop:
+    """Tests for the shared loop, worker pool and backend pools."""
+
+    def test_run_executes_on_shared_loop(self):
+        async def where():
+            return threading.current_thread().name
+
+        assert aio.run(where()) == "novaops-loop"
+
+    def test_run_from_shared_loop_is_rejected(self):
+        async def nested():
+            aio.run(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError):
+            aio.run(nested())
+
+    def test_pool_caps_concurrency_across_loops(self):
+        pool = aio.get_pool("test-backend", size=2)
+
+        async def request():
+            await asyncio.sleep(0.02)
+            return pool.in_use
+
+        async def burst():
+            return await asyncio.gather(*(aio.call_backend("test-backend", request) for _ in range(4)))
+
+        # Two independent loops, as two agent invocations would have.
+        results = []
+        threads = [threading.Thread(target=lambda: results.extend(asyncio.run(burst()))) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(results) == 8
+        assert pool.stats()["peak"] == 2
+        assert pool.stats()["waits"] > 0
+
+    def test_to_thread_keeps_trace_context(self):
+        tracing.enable()
+        tracing.clear_traces()
+        try:
+            with tracing.span("outer", kind="agent"):
+                asyncio.run(async_tools.check_health(service="api"))
+            spans = {s["name"]: s for s in tracing.get_spans()}
+            assert spans["check_health"]["parent_id"] == spans["outer"]["span_id"]
+        finally:
+            tracing.enable(False)
+            tracing.clear_traces()
+
+
+class TestAsyncTools:
+    """Tests that async variants mirror the sync tools."""
+
+    def test_every_tool_has_an_async_variant(self):
+        from novaops import tools
+
+        assert set(async_tools.__all__) == set(tools.__all__)
+
+    def test_same_spec_as_sync_tool(self):
+        assert async_tools.get_metrics.tool_spec == get_metrics.tool_spec
+
+    def test_async_and_sync_share_the_cache(self):
+        sync_result = check_health(service="cache")
+        assert asyncio.run(async_tools.check_health(service="cache")) == sync_result
+
+    def test_tools_overlap(self):
+        async def fan_out():
+            return await asyncio.gather(
+                async_tools.get_metrics(service="api", metric_type="cpu"),
+                async_tools.search_incidents(query="database latency"),
+                async_tools.voice_alert(message="disk filling", severity="warning"),
+            )
+
+        metrics, search, alert = asyncio.run(fan_out())
+        assert metrics["service"] == "api"
+        assert search["result_count"] == 3
+        assert alert["severity"] == "warning"
+        assert {"monitoring", "incident-search", "nova-sonic"} <= set(aio.pool_stats())
@@ -0,0 +1,125 @@
+"""Tests for online anomaly detection."""
+
+import numpy as np
+import pytest
+from novaops.anomaly import Anomaly, AnomalyEngine, SeriesDetector, open_incident
+from novaops.timeseries import MetricStore
+from novaops.tools.dashboard import _incident_store, update_incident_status
+
+
+def _noise(n, mean=100.0, std=2.0, seed=0):
+    return np.random.default_rng(seed).normal(mean, std, n)
+
+
+class TestSeriesDetector:
+    """Tests for the per-series EWMA and seasonal detector."""
+
+    def test_noise_is_not_anomalous(self):
+        detector = SeriesDetector()
+        assert not any(detector.observe(v, t * 10.0) for t, v in enumerate(_noise(2000)))
+
+    def test_sustained_spike_is_reported_once(self):
+        detector = SeriesDetector(sustain=3)
+        for t, v in enumerate(_noise(200)):
+            detector.observe(v, t * 10.0)
+        hits = [detector.observe(200.0, (200 + i) * 10.0) for i in range(6)]
+        assert [h is not None for h in hits] == [False, False, True, False, False, False]
+        z, _, mean, _ = hits[2]
+        assert z > 4 and mean == pytest.approx(100, abs=10)
+
+    def test_single_outlier_is_ignored(self):
+        detector = SeriesDetector(sustain=3)
+        for t, v in enumerate(_noise(200)):
+            detector.observe(v, t * 10.0)
+        assert detector.observe(500.0, 2000.0) is None
+        assert detector.observe(100.0, 2010.0) is None
+        assert detector.streak == 0
+
+    def test_seasonal_baseline_suppresses_regular_peaks(self):
+        # A 100 s "day" of 10 slots; slot 5 is always busy.
+        def value(t):
+            return 400.0 if int(t % 100 // 10) == 5 else 100.0 + (t % 3)
+
+        seasonal = SeriesDetector(period=100, slots=10, warmup=20)
+        level_only = SeriesDetector(period=100, slots=10, warmup=20, seasonal_warmup=10**9)
+        seasonal_hits = level_hits = 0
+        for t in range(20_000):
+            seasonal_hits += seasonal.observe(value(t), float(t)) is not None
+            level_hits += level_only.observe(value(t), float(t)) is not None
+        assert level_hits > 100
+        assert seasonal_hits <= 2  # only until slot 5 has seen two busy periods
+
+
+class TestAnomalyEngine:
+    """Tests for incident creation and deduplication."""
+
+    def setup_method(self):
+        _incident_store.clear()
+
+    def _feed_spike(self, engine, start=0):
+        engine.observe_many("api", "latency", np.arange(start, start + 200) * 10.0, _noise(200))
+        return engine.observe_many(
+            "api", "latency", np.arange(start + 200, start + 210) * 10.0, np.full(10, 400.0)
+        )
+
+    def test_spike_opens_an_incident(self):
+        engine = AnomalyEngine()
+        (anomaly,) = self._feed_spike(engine)
+        (incident,) = _incident_store.query()
+        assert incident["title"] == "api latency spike detected"
+        assert incident["severity"] == anomaly.severity
+        assert "latency on api was 400" in incident["description"]
+
+    def test_duplicate_while_incident_open(self):
+        engine = AnomalyEngine(cooldown=0)
+        self._feed_spike(engine)
+        assert self._feed_spike(engine, start=1000) == []
+        assert len(_incident_store) == 1
+        assert engine.stats()["suppressed"] == 1
+
+    def test_new_incident_after_resolution(self):
+        engine = AnomalyEngine(cooldown=0)
+        self._feed_spike(engine)
+        (incident,) = _incident_store.query()
+        update_incident_status(incident_id=incident["incident_id"], status="resolved")
+        assert len(self._feed_spike(engine, start=1000)) == 1
+        assert len(_incident_store) == 2
+
+    def test_cooldown_blocks_reopening(self):
+        engine = AnomalyEngine(cooldown=3600)
+        self._feed_spike(engine)
+        (incident,) = _incident_store.query()
+        update_incident_status(incident_id=incident["incident_id"], status="resolved")
+        assert self._feed_spike(engine, start=1000) == []
+
+    def test_a_failed_incident_creation_does_not_suppress_the_series(self):
+        calls = []
+
+        def on_anomaly(anomaly):
+            calls.append(anomaly)
+            if len(calls) == 1:
+                raise OSError("journal fsync failed")
+            return "INC-X"
+
+        engine = AnomalyEngine(on_anomaly=on_anomaly, cooldown=0, incident_status=lambda _: None)
+        with pytest.raises(OSError):
+            self._feed_spike(engine)
+        assert len(self._feed_spike(engine, start=1000)) == 1
+        assert len(calls) == 2 and engine.stats()["suppressed"] == 0
+
+    def test_backfilled_anomalies_are_grouped_by_report_time(self):
+        def anomaly(timestamp):
+            return Anomaly("api", "latency", 400.0, timestamp, 7.0, 100.0, 2.0, None)
+
+        assert open_incident(anomaly(0.0)) == open_incident(anomaly(86400.0))
+        assert len(_incident_store) == 1
+
+    def test_follows_metric_store(self):
+        seen = []
+        engine = AnomalyEngine(on_anomaly=lambda a: seen.append(a) or "INC-X")
+        store = MetricStore()
+        engine.attach(store)
+        store.record_many("db", "cpu", np.arange(200) * 10.0, _noise(200, mean=40))
+        store.record_many("db", "cpu", np.arange(200, 205) * 10.0, np.full(5, 95.0))
+        assert [(a.service, a.metric, a.direction) for a in seen] == [("db", "cpu", "spike")]
+        engine.detach(store)
@@ -0,0 +1,167 @@
+"""Tests for the voice alert broadcast dispatcher."""
+
+import threading
+import time
+
+import pytest
+from novaops.broadcast import BroadcastDispatcher, TokenBucket, digest, Alert
+
+
+class _Gateway:
+    """Records deliveries; optionally fails the first few."""
+
+    def __init__(self, failures: int = 0, delay: float = 0.0):
+        self.failures = failures
+        self.delay = delay
+        self.sent = []
+        self.audio = []
+        self.lock = threading.Lock()
+
+    def __call__(self, channel, message, severity, audio):
+        time.sleep(self.delay)
+        with self.lock:
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("gateway unavailable")
+            self.sent.append((channel, message, severity))
+            self.audio.append(audio)
+        return 2
+
+    def on(self, channel):
+        return [m for c, m, _ in self.sent if c == channel]
+
+
+@pytest.fixture
+def dispatcher_factory():
+    dispatchers = []
+
+    def make(**kwargs):
+        kwargs.setdefault("rates", {c: (1000.0, 1000) for c in ("ops-general", "ops-oncall", "ops-escalation")})
+        dispatcher = BroadcastDispatcher(**kwargs)
+        dispatchers.append(dispatcher)
+        return dispatcher
+
+    yield make
+    for dispatcher in dispatchers:
+        dispatcher.close(timeout=5)
+
+
+class TestTokenBucket:
+    """Tests for the per-channel rate limit."""
+
+    def test_allows_a_burst_then_the_rate(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=2.0, burst=3, clock=lambda: now[0])
+        assert [bucket.take() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.take() == pytest.approx(0.5)
+        now[0] = 0.5
+        assert bucket.take() == 0.0
+        assert bucket.take() > 0
+
+
+class TestDigest:
+    """Tests for summarising coalesced alerts."""
+
+    def test_most_frequent_messages_first_and_the_rest_counted(self):
+        alerts = [Alert("1", "API down", "critical")] * 5 + [
+            Alert(str(i), f"disk {i} full", "warning") for i in range(4)
+        ]
+        text = digest(alerts, dropped=2)
+        assert text.startswith("11 critical alerts: 5x API down; disk 0 full; disk 1 full; and 4 more")
+
+
+class TestBroadcastDispatcher:
+    """Tests for queued, coalesced and rate-limited delivery."""
+
+    def test_submit_returns_without_waiting_for_delivery(self, dispatcher_factory):
+        gateway = _Gateway(delay=0.2)
+        dispatcher = dispatcher_factory(deliver=gateway, window=0)
+        started = time.perf_counter()
+        result = dispatcher.submit("Critical alert on API", "critical")
+        assert time.perf_counter() - started < 0.05
+        assert result["channels"] == ["ops-general", "ops-oncall", "ops-escalation"]
+        assert dispatcher.flush(timeout=5)
+        assert sorted(c for c, _, _ in gateway.sent) == ["ops-escalation", "ops-general", "ops-oncall"]
+
+    def test_an_alert_storm_pages_on_call_a_few_times(self, dispatcher_factory):
+        gateway = _Gateway()
+        dispatcher = dispatcher_factory(deliver=gateway, window=0.2)
+        dispatcher.submit("Critical alert on API (0)", "critical")
+        time.sleep(0.05)
+        for i in range(1, 500):
+            dispatcher.submit(f"Critical alert on API ({i % 3})", "critical")
+        assert dispatcher.flush(timeout=5)
+        pages = gateway.on("ops-oncall")
+        # The first alert goes out at once; the rest are held for the window and sent as a digest.
+        assert len(pages) <= 3
+        assert pages[0] == "Critical alert on API (0)"
+        assert "499 critical alerts" in pages[1]
+        stats = dispatcher.stats()["ops-oncall"]
+        assert stats["alerts_delivered"] == 500 and stats["digests"] >= 1
+
+    def test_rate_limit_folds_waiting_alerts_into_the_next_delivery(self, dispatcher_factory):
+        gateway = _Gateway()
+        dispatcher = dispatcher_factory(deliver=gateway, window=0, rates={"ops-general": (5.0, 1)})
+        for i in range(20):
+            dispatcher.submit(f"info {i}", "info")
+            time.sleep(0.01)
+        assert dispatcher.flush(timeout=5)
+        sent = gateway.on("ops-general")
+        assert 2 <= len(sent) <= 4
+        stats = dispatcher.stats()["ops-general"]
+        assert stats["throttled"] >= 1 and stats["alerts_delivered"] == 20
+
+    def test_failed_deliveries_are_retried(self, dispatcher_factory):
+        gateway = _Gateway(failures=2)
+        dispatcher = dispatcher_factory(deliver=gateway, window=0, backoff=0.01)
+        dispatcher.submit("Queue backlog growing", "info")
+        assert dispatcher.flush(timeout=5)
+        assert gateway.on("ops-general") == ["Queue backlog growing"]
+        assert dispatcher.stats()["ops-general"]["retries"] == 2
+
+    def test_deliveries_are_given_up_after_the_retries(self, dispatcher_factory):
+        gateway = _Gateway(failures=10)
+        dispatcher = dispatcher_factory(deliver=gateway, window=0, backoff=0.001, max_retries=2)
+        dispatcher.submit("Queue backlog growing", "info")
+        assert dispatcher.flush(timeout=5)
+        stats = dispatcher.stats()["ops-general"]
+        assert stats["failed"] == 1 and stats["deliveries"] == 0
+
+    def test_full_queues_still_count_alerts_in_the_digest(self, dispatcher_factory):
+        gateway = _Gateway()
+        dispatcher = dispatcher_factory(deliver=gateway, window=0.2, max_pending=10)
+        results = [dispatcher.submit(f"alert {i}", "info") for i in range(50)]
+        assert any(r["overflowing"] for r in results)
+        assert dispatcher.flush(timeout=5)
+        assert dispatcher.stats()["ops-general"]["alerts_delivered"] == 50
+
+    def test_each_delivery_carries_the_clip_of_what_was_sent(self, dispatcher_factory):
+        gateway = _Gateway()
+        dispatcher = dispatcher_factory(deliver=gateway, synthesize=str.encode, window=0.2)
+        dispatcher.submit("Disk full on db-1", "info")
+        time.sleep(0.05)
+        for i in range(5):
+            dispatcher.submit(f"Disk full on db-{i}", "info")
+        assert dispatcher.flush(timeout=5)
+        assert [m.encode() for _, m, _ in gateway.sent] == gateway.audio
+        assert "5 info alerts" in gateway.on("ops-general")[1]
+
+    def test_a_failed_synthesis_still_delivers_the_text(self, dispatcher_factory):
+        def synthesize(message):
+            raise RuntimeError("speech backend down")
+
+        gateway = _Gateway()
+        dispatcher = dispatcher_factory(deliver=gateway, synthesize=synthesize, window=0)
+        dispatcher.submit("Queue backlog growing", "info")
+        assert dispatcher.flush(timeout=5)
+        assert gateway.on("ops-general") == ["Queue backlog growing"] and gateway.audio == [None]
+        assert dispatcher.stats()["ops-general"]["synthesis_failed"] == 1
+
+    def test_close_delivers_what_is_queued(self):
+        gateway = _Gateway()
+        dispatcher = BroadcastDispatcher(deliver=gateway, window=60)
+        dispatcher.submit("first", "info")
+        dispatcher.flush(timeout=5)
+        dispatcher.submit("second", "info")
+        dispatcher.close(timeout=5)
+        assert gateway.on("ops-general") == ["first", "second"]
@@ -0,0 +1,143 @@
+"""Tests for the tool response cache."""
+
+from novaops.cache import TTLCache, cache_key, cache_stats, cached, invalidate
+from novaops.tools.analysis import root_cause_analysis, search_incidents
+from novaops.tools.dashboard import (
+    _incident_store,
+    create_incident,
+    get_dashboard_data,
+    update_incident_status,
+)
+from novaops.tools.infra import check_health
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = TTLCache("t", ttl=10, clock=clock)
+        cache.set("k", 1)
+        assert cache.get("k") == (True, 1)
+        clock.now = 11
+        assert cache.get("k") == (False, None)
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = TTLCache("t", maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.stats()["evictions"] == 1
+
+    def test_tag_invalidation(self):
+        cache = TTLCache("t")
+        cache.set("a", 1, tags={"x"})
+        cache.set("b", 2, tags={"y"})
+        assert cache.invalidate("x") == 1
+        assert cache.get("a") == (False, None)
+        assert cache.get("b") == (True, 2)
+
+    def test_key_normalization(self):
+        assert cache_key("f", {"query": " API  timeout "}, casefold=("query",)) == cache_key(
+            "f", {"query": "api timeout"}, casefold=("query",)
+        )
+        assert cache_key("f", {"id": "INC-1"}) != cache_key("f", {"id": "inc-1"})
+
+
+class TestCachedDecorator:
+    """Tests for the cached decorator."""
+
+    def test_defaults_are_part_of_the_key(self):
+        calls = []
+
+        @cached(ttl=60)
+        def fetch(service: str, window: int = 5) -> dict:
+            calls.append((service, window))
+            return {"service": service}
+
+        fetch("api")
+        fetch("api", window=5)
+        fetch(service="api", window=10)
+        assert calls == [("api", 5), ("api", 10)]
+
+    def test_results_are_copied(self):
+        @cached(ttl=60)
+        def fetch() -> dict:
+            return {"items": [1]}
+
+        fetch()["items"].append(2)
+        assert fetch() == {"items": [1]}
+
+    def test_result_read_during_an_invalidation_is_not_stored(self):
+        state = {"status": "open"}
+
+        @cached(ttl=60, tags=lambda arguments: ["incident:INC-1"])
+        def fetch() -> str:
+            status = state["status"]
+            if status == "open":
+                # A write lands after the read but before the result is cached.
+                state["status"] = "resolved"
+                invalidate("incident:INC-1")
+            return status
+
+        assert fetch() == "open"
+        assert fetch() == "resolved"
+        assert fetch.cache.get(cache_key("fetch", {})) == (True, "resolved")
+
+    def test_disabled_by_env(self, monkeypatch):
+        calls = []
+
+        @cached(ttl=60)
+        def fetch() -> int:
+            calls.append(1)
+            return 1
+
+        monkeypatch.setenv("NOVAOPS_CACHE", "0")
+        fetch()
+        fetch()
+        assert len(calls) == 2
+
+
+class TestToolCaching:
+    """Tests for caching on the read-only tools."""
+
+    def setup_method(self):
+        _incident_store.clear()
+
+    def test_repeat_health_check_hits_cache(self):
+        first = check_health(service="api")
+        assert check_health(service="api") == first
+        assert cache_stats()["check_health"]["hits"] >= 1
+
+    def test_search_queries_are_normalized(self):
+        search_incidents(query="Database replication lag")
+        before = cache_stats()["search_incidents"]["hits"]
+        search_incidents(query="database   replication lag")
+        assert cache_stats()["search_incidents"]["hits"] == before + 1
+
+    def test_create_incident_invalidates_dashboard(self):
+        assert get_dashboard_data()["incident_count"] == 0
+        create_incident(title="Cache test", severity="low", description="x")
+        assert get_dashboard_data()["incident_count"] == 1
+
+    def test_update_invalidates_dashboard(self):
+        inc = create_incident(title="Cache test", severity="low", description="x")
+        get_dashboard_data()
+        update_incident_status(incident_id=inc["incident_id"], status="resolved")
+        (listed,) = get_dashboard_data()["active_incidents"]
+        assert listed["status"] == "resolved"
+
+    def test_root_cause_analysis_is_cached(self):
+        assert root_cause_analysis(incident_id="INC-001") == root_cause_analysis(incident_id="INC-001")
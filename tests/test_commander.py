@@ -1,7 +1,7 @@
 """Tests for NovaOps agents and tools."""
 
 import pytest
-from novaops.tools.infra import check_health, get_metrics
+from novaops.tools.infra import check_health, get_metrics, get_metrics_batch
 
 
 class TestCheckHealth:
@@ -59,6 +59,35 @@ class TestGetMetrics:
         assert result["metric_type"] == "cpu"
 
 
+class TestGetMetricsBatch:
+    """Tests for the get_metrics_batch tool."""
+
+    def test_returns_one_row_per_service_metric_pair(self):
+        result = get_metrics_batch(services=["api", "database", "cache"], metric_types=["cpu", "latency"])
+        assert result["row_count"] == 6
+        assert all(len(col) == 6 for col in result["columns"].values())
+
+    def test_rows_are_service_major(self):
+        result = get_metrics_batch(services=["api", "cache"], metric_types=["cpu", "memory"])
+        assert result["columns"]["service"] == ["api", "api", "cache", "cache"]
+        assert result["columns"]["metric_type"] == ["cpu", "memory", "cpu", "memory"]
+
+    def test_defaults_to_all_metric_types(self):
+        result = get_metrics_batch(services=["api"])
+        assert result["metric_types"] == ["cpu", "memory", "latency", "throughput"]
+
+    def test_window_aggregates_are_ordered(self):
+        result = get_metrics_batch(services=["api"], metric_types=["latency"], window_minutes=15)
+        cols = result["columns"]
+        assert result["window_minutes"] == 15
+        assert cols["min"][0] <= cols["avg"][0] <= cols["max"][0]
+        assert cols["unit"][0] == "ms"
+
+    def test_tool_spec_accepts_lists(self):
+        schema = get_metrics_batch.tool_spec["inputSchema"]["json"]
+        assert "services" in schema["required"]
+
+
 class TestVersion:
     """Test package metadata."""
 
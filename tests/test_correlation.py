@@ -0,0 +1,136 @@
+"""Tests for alert deduplication and correlation."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from novaops.correlation import AlertCorrelator, fingerprint
+from novaops.tools.dashboard import (
+    _incident_store,
+    get_dashboard_data,
+    report_alert,
+    update_incident_status,
+)
+
+
+class TestAlertCorrelator:
+    """Tests for grouping alerts into incidents."""
+
+    def setup_method(self):
+        _incident_store.clear()
+
+    def test_fingerprint_masks_numbers(self):
+        assert fingerprint("api", "P99 latency 812ms") == fingerprint("API", "p99 latency 950ms")
+
+    def test_repeats_are_deduplicated(self):
+        correlator = AlertCorrelator()
+        alerts = [correlator.submit("api", f"P99 latency {ms}ms", "high", timestamp=i) for i, ms in enumerate((800, 900, 950))]
+        assert [a["match"] for a in alerts] == ["new", "fingerprint", "fingerprint"]
+        (incident,) = _incident_store.query()
+        assert incident["alert_count"] == 3
+        assert [a["alert_id"] for a in correlator.get_alerts(incident["incident_id"])] == [a["alert_id"] for a in alerts]
+
+    def test_cascade_across_dependent_services_is_one_incident(self):
+        correlator = AlertCorrelator()
+        first = correlator.submit(
+            "database", "Connection pool exhausted", "high",
+            "Database connection pool exhausted, queries waiting for connections", timestamp=0,
+        )
+        second = correlator.submit(
+            "api", "Gateway timeouts", "critical",
+            "API gateway timeouts waiting for database connections", timestamp=30,
+        )
+        assert second["match"] == "similar"
+        assert second["incident_id"] == first["incident_id"]
+        incident = _incident_store.get(first["incident_id"])
+        assert incident["affected_services"] == ["database", "api"]
+        assert incident["severity"] == "critical"
+
+    def test_unrelated_alerts_open_separate_incidents(self):
+        correlator = AlertCorrelator()
+        first = correlator.submit("cache", "Eviction storm", "medium", "Redis hit ratio dropped", timestamp=0)
+        second = correlator.submit("api", "TLS certificate expiring", "high", "Certificate expires in 3 days", timestamp=5)
+        assert second["match"] == "new"
+        assert second["incident_id"] != first["incident_id"]
+
+    def test_window_expiry_opens_new_incident(self):
+        correlator = AlertCorrelator(window=60)
+        first = correlator.submit("api", "High error rate", timestamp=0)
+        later = correlator.submit("api", "High error rate", timestamp=600)
+        assert later["match"] == "new" and later["incident_id"] != first["incident_id"]
+        assert correlator.stats()["open_groups"] == 1
+
+    def test_resolved_incident_is_not_reused(self):
+        correlator = AlertCorrelator()
+        first = correlator.submit("api", "High error rate", timestamp=0)
+        update_incident_status(incident_id=first["incident_id"], status="resolved")
+        assert correlator.submit("api", "High error rate", timestamp=10)["match"] == "new"
+
+    def test_incident_is_opened_outside_the_lock(self):
+        opening, release = threading.Event(), threading.Event()
+
+        def create(alert):
+            opening.set()
+            release.wait(5)
+            return "INC-SLOW"
+
+        updates = []
+        correlator = AlertCorrelator(create=create, update=lambda i, **fields: updates.append(fields),
+                                     status=lambda incident_id: "open")
+        with ThreadPoolExecutor(2) as pool:
+            first = pool.submit(correlator.submit, "api", "High error rate 5%", timestamp=0)
+            assert opening.wait(5)
+            repeat = pool.submit(correlator.submit, "api", "High error rate 7%", "critical", timestamp=1)
+            time.sleep(0.05)
+            assert correlator._lock.acquire(timeout=1)
+            correlator._lock.release()
+            release.set()
+            assert first.result()["incident_id"] == repeat.result()["incident_id"] == "INC-SLOW"
+        assert repeat.result()["match"] == "fingerprint"
+        assert correlator.stats()["incidents"] == 1
+        assert updates[-1]["alert_count"] == 2 and correlator.get_alerts("INC-SLOW")[-1]["severity"] == "critical"
+
+    def test_failed_incident_releases_its_group(self):
+        def create(alert):
+            raise RuntimeError("store unavailable")
+
+        correlator = AlertCorrelator(create=create, update=lambda *a, **k: None, status=lambda i: "open")
+        with pytest.raises(RuntimeError):
+            correlator.submit("api", "High error rate", timestamp=0)
+        correlator._create = lambda alert: "INC-RETRY"
+        assert correlator.submit("api", "High error rate", timestamp=1)["match"] == "new"
+        assert correlator.stats()["open_groups"] == 1
+
+    def test_throughput(self):
+        correlator = AlertCorrelator(create=lambda alert: alert["alert_id"], update=lambda *a, **k: None,
+                                     status=lambda incident_id: "open")
+        services = ("api", "database", "cache", "queue")
+        started = time.perf_counter()
+        for i in range(5000):
+            correlator.submit(services[i % 4], f"{services[i % 4]} check {i % 50} failing", timestamp=i * 0.01)
+        assert time.perf_counter() - started < 5.0
+        assert correlator.stats()["incidents"] < 200
+
+
+class TestReportAlertTool:
+    """Tests for the report_alert dashboard tool."""
+
+    def setup_method(self):
+        _incident_store.clear()
+
+    def test_report_alert_links_repeats(self):
+        first = report_alert(service="queue", title="Consumer lag 5000 messages", severity="high")
+        second = report_alert(service="queue", title="Consumer lag 9000 messages", severity="high")
+        assert first["new_incident"] and not second["new_incident"]
+        assert second["incident_id"] == first["incident_id"]
+        assert len(_incident_store) == 1
+
+    def test_linked_alerts_refresh_the_dashboard(self):
+        first = report_alert(service="queue", title="Consumer lag 5000 messages", severity="medium")
+        assert get_dashboard_data()["active_incidents"][0]["severity"] == "medium"
+        report_alert(service="queue", title="Consumer lag 9000 messages", severity="critical")
+        (incident,) = get_dashboard_data()["active_incidents"]
+        assert incident["incident_id"] == first["incident_id"]
+        assert (incident["severity"], incident["alert_count"]) == ("critical", 2)
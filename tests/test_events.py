@@ -0,0 +1,170 @@
+"""Tests for the dashboard event bus."""
+
+import json
+import threading
+import time
+import urllib.request
+from types import SimpleNamespace
+
+from strands import Agent
+from novaops.agents.stub import StubModel
+from novaops.events import ActivityHooks, EventBus, format_sse, get_event_bus, serve_events
+from novaops.incidents import IncidentStore
+
+
+def _incident(i, status="open"):
+    return {"incident_id": f"INC-{i}", "title": f"incident {i}", "status": status, "severity": "high"}
+
+
+class TestEventBus:
+    """Tests for diff events, snapshots and resyncs."""
+
+    def test_subscribers_start_with_a_snapshot_then_get_diffs(self):
+        bus = EventBus(snapshot_interval=60)
+        store = IncidentStore()
+        store.add(_incident(1))
+        bus.watch_incidents(store)
+        subscription = bus.subscribe()
+        snapshot = subscription.get(timeout=1)
+        assert snapshot.type == "snapshot"
+        assert snapshot.data["incident"]["INC-1"]["status"] == "open"
+
+        store.add(_incident(2))
+        store.update("INC-1", status="resolved", assigned_to="alice")
+        created, updated = subscription.get(timeout=1), subscription.get(timeout=1)
+        assert (created.type, created.key) == ("created", "INC-2")
+        assert created.data["title"] == "incident 2"
+        assert (updated.type, updated.key) == ("updated", "INC-1")
+        assert updated.data == {"status": "resolved", "assigned_to": "alice"}
+        assert subscription.get(timeout=0.05) is None
+
+    def test_unchanged_writes_publish_nothing(self):
+        bus = EventBus()
+        store = IncidentStore()
+        bus.watch_incidents(store)
+        store.add(_incident(1))
+        store.update("INC-1", status="open")
+        assert bus.publish_health("api", "healthy") is not None
+        assert bus.publish_health("api", "healthy") is None
+        transition = bus.publish_health("api", "degraded")
+        assert transition.data == {"status": "degraded", "previous": "healthy"}
+        assert bus.stats()["published"] == 3
+
+    def test_topics_filter_events_and_snapshots(self):
+        bus = EventBus(snapshot_interval=60)
+        subscription = bus.subscribe(["health"])
+        assert set(subscription.get(timeout=1).data) == {"health"}
+        bus.publish_agent("monitor_agent", status="active")
+        bus.publish_health("cache", "unhealthy")
+        event = subscription.get(timeout=1)
+        assert (event.topic, event.key) == ("health", "cache")
+        assert subscription.get(timeout=0.05) is None
+
+    def test_snapshots_repeat_on_the_interval(self):
+        bus = EventBus(snapshot_interval=0.1)
+        subscription = bus.subscribe()
+        assert subscription.get(timeout=1).type == "snapshot"
+        bus.publish_health("api", "healthy")
+        assert subscription.get(timeout=1).type == "transition"
+        assert subscription.get(timeout=1).type == "snapshot"
+
+    def test_a_lagging_subscriber_is_resynced_with_a_snapshot(self):
+        bus = EventBus(snapshot_interval=60)
+        subscription = bus.subscribe(max_queue=10)
+        subscription.get(timeout=1)
+        for i in range(25):
+            bus.publish_health(f"svc-{i}", "degraded")
+        event = subscription.get(timeout=1)
+        assert event.type == "snapshot" and len(event.data["health"]) == 25
+        assert subscription.get(timeout=0.05) is None
+        assert subscription.resyncs >= 1
+
+    def test_close_wakes_a_blocked_reader(self):
+        bus = EventBus(snapshot_interval=60)
+        subscription = bus.subscribe()
+        subscription.get(timeout=1)
+        results = []
+        reader = threading.Thread(target=lambda: results.append(subscription.get()))
+        reader.start()
+        time.sleep(0.05)
+        subscription.close()
+        reader.join(timeout=1)
+        assert results == [None] and bus.stats()["subscribers"] == 0
+
+
+class TestActivityHooks:
+    """Tests for agent activity events."""
+
+    def test_invocations_publish_activity(self):
+        bus = EventBus()
+        agent = Agent(
+            name="monitor_agent", model=StubModel(), hooks=[ActivityHooks(bus)], callback_handler=None
+        )
+        subscription = bus.subscribe(["agent"], snapshot_interval=60)
+        subscription.get(timeout=1)
+        agent("hello")
+        events = []
+        while (event := subscription.get(timeout=0.05)) is not None:
+            events.append(event)
+        assert events[0].data == {"status": "active", "last_action": "thinking"}
+        assert events[-1].data == {"status": "idle"}
+        assert bus.snapshot().data["agent"]["monitor_agent"]["status"] == "idle"
+
+    def test_agent_stays_active_until_every_session_finishes(self):
+        bus = EventBus()
+        first, second = ActivityHooks(bus), ActivityHooks(bus)
+        event = SimpleNamespace(agent=SimpleNamespace(name="analyst_agent"))
+        first._started(event)
+        second._started(event)
+        first._finished(event)
+        assert bus.snapshot().data["agent"]["analyst_agent"]["status"] == "active"
+        second._finished(event)
+        assert bus.snapshot().data["agent"]["analyst_agent"]["status"] == "idle"
+
+
+class TestDashboardFeed:
+    """Tests for the tool wiring and the SSE endpoint."""
+
+    def test_tools_publish_incident_and_health_changes(self):
+        from novaops.tools.dashboard import create_incident
+        from novaops.tools.infra import check_health
+
+        subscription = get_event_bus().subscribe(["incident", "health"], snapshot_interval=60)
+        try:
+            subscription.get(timeout=1)
+            incident = create_incident(
+                title="Disk full", description="Root volume at 100%", severity="high"
+            )
+            event = subscription.get(timeout=1)
+            assert (event.type, event.key) == ("created", incident["incident_id"])
+            check_health(service="events-test")
+            event = subscription.get(timeout=1)
+            assert (event.topic, event.key) == ("health", "events-test")
+        finally:
+            subscription.close()
+
+    def test_sse_endpoint_streams_a_snapshot_then_changes(self):
+        bus = EventBus(snapshot_interval=60)
+        bus.publish_health("api", "healthy")
+        server = serve_events(port=0, bus=bus)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/events?topics=health"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                assert response.headers["Content-Type"] == "text/event-stream"
+
+                def message():
+                    lines = []
+                    while (line := response.readline().decode()) != "\n":
+                        lines.append(line)
+                    return json.loads(lines[-1].removeprefix("data: "))
+
+                assert message()["data"] == {"health": {"api": {"status": "healthy"}}}
+                bus.publish_health("api", "unhealthy")
+                assert message()["data"] == {"status": "unhealthy", "previous": "healthy"}
+        finally:
+            server.shutdown()
+
+    def test_format_sse(self):
+        bus = EventBus()
+        text = format_sse(bus.publish_health("api", "healthy"))
+        assert text.startswith("id: 1\nevent: transition\ndata: {") and text.endswith("}\n\n")
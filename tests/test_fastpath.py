@@ -0,0 +1,104 @@
+"""Tests for the deterministic fast-path command parser."""
+
+import pytest
+from strands import tool
+from novaops.fastpath import FastPathParser
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return FastPathParser(services=["api", "database", "cache", "queue"])
+
+
+class TestFastPathParser:
+    """Tests for mapping commands onto tools from the registry."""
+
+    @pytest.mark.parametrize(
+        "prompt, expected",
+        [
+            ("health api", ("check_health", {"service": "api"})),
+            ("show me the health of database?", ("check_health", {"service": "database"})),
+            ("cache health", ("check_health", {"service": "cache"})),
+            ("dashboard", ("get_dashboard_data", {})),
+            ("dashboard status=open limit=5", ("get_dashboard_data", {"status": "open", "limit": 5})),
+            ("metrics queue latency", ("get_metrics", {"service": "queue", "metric_type": "latency"})),
+            ("resolve INC-abc123", ("update_incident_status", {"status": "resolved", "incident_id": "INC-ABC123"})),
+            ("rca INC-001", ("root_cause_analysis", {"incident_id": "INC-001"})),
+        ],
+    )
+    def test_commands_map_onto_one_tool(self, parser, prompt, expected):
+        assert parser.parse(prompt) == expected
+
+    def test_typed_arguments_come_before_free_text(self, parser):
+        assert parser.parse("voice alert critical Database is down") == (
+            "voice_alert", {"severity": "critical", "message": "Database is down"},
+        )
+        assert parser.parse("report alert api high Disk full") == (
+            "report_alert", {"service": "api", "severity": "high", "title": "Disk full"},
+        )
+        # A value inside the free text is not taken as an argument.
+        assert parser.parse("voice alert Database is critical") is None
+
+    def test_list_arguments(self, parser):
+        assert parser.parse("metrics batch api,cache cpu memory") == (
+            "get_metrics_batch", {"services": ["api", "cache"], "metric_types": ["cpu", "memory"]},
+        )
+
+    @pytest.mark.parametrize(
+        "prompt",
+        [
+            "health",  # missing the service
+            "health billing",  # not in the inventory
+            "health api cache",  # one service too many
+            "resolve the incident",  # no incident ID
+            "create incident high API timeout",  # no description
+            "why is the api slow after the deploy",
+            "",
+        ],
+    )
+    def test_anything_else_falls_back(self, parser, prompt):
+        assert parser.parse(prompt) is None
+
+    @pytest.mark.parametrize(
+        "prompt",
+        [
+            "page the team about why the api is slow then analyze root cause",
+            "search why did the database fail last night and compare with today",
+            "voice alert critical api is down then open an incident",
+            "create incident high Disk full; page on-call",
+        ],
+    )
+    def test_free_text_asking_for_more_falls_back(self, parser, prompt):
+        assert parser.parse(prompt) is None
+
+    def test_side_effecting_tools_need_their_full_name(self, parser):
+        assert parser.parse("page the team the api is down") is None
+        assert parser.parse("say the api is back") is None
+        assert parser.parse("search database replication lag") == (
+            "search_incidents", {"query": "database replication lag"},
+        )
+
+    def test_ambiguous_commands_fall_back(self):
+        @tool
+        def check_ping(service: str) -> dict:
+            """Ping a service.
+
+            Args:
+                service: The service to ping.
+            """
+            return {}
+
+        @tool
+        def get_ping(host: str) -> dict:
+            """Ping a host.
+
+            Args:
+                host: The host to ping.
+            """
+            return {}
+
+        parser = FastPathParser({"check_ping": check_ping, "get_ping": get_ping}, services=["api"])
+        # "ping" names both tools, and "api" fits both.
+        assert parser.parse("ping api") is None
+        assert parser.parse("check ping api") == ("check_ping", {"service": "api"})
+        assert parser.parse("ping web-01.internal") == ("get_ping", {"host": "web-01.internal"})
@@ -0,0 +1,76 @@
+"""Tests for the concurrent health-check engine."""
+
+import time
+
+from novaops.health import DEFAULT_SERVICES, load_service_inventory, run_health_checks
+
+
+def _slow_probe(delays):
+    def probe(service):
+        time.sleep(delays.get(service, 0.0))
+        return {"service": service, "status": "healthy", "uptime_hours": 1.0}
+
+    return probe
+
+
+class TestServiceInventory:
+    """Tests for load_service_inventory."""
+
+    def test_default_inventory(self, monkeypatch):
+        monkeypatch.delenv("NOVAOPS_SERVICES", raising=False)
+        assert load_service_inventory() == list(DEFAULT_SERVICES)
+
+    def test_env_inventory(self, monkeypatch):
+        monkeypatch.setenv("NOVAOPS_SERVICES", "api, auth,,billing,api")
+        assert load_service_inventory() == ["api", "auth", "billing"]
+
+    def test_explicit_services_win(self, monkeypatch):
+        monkeypatch.setenv("NOVAOPS_SERVICES", "auth")
+        assert load_service_inventory(["cache"]) == ["cache"]
+
+
+class TestRunHealthChecks:
+    """Tests for run_health_checks."""
+
+    def test_checks_every_service(self):
+        results = run_health_checks(list(DEFAULT_SERVICES))
+        assert sorted(r["service"] for r in results) == sorted(DEFAULT_SERVICES)
+        assert all("latency_ms" in r for r in results)
+
+    def test_fleet_runs_concurrently(self):
+        services = [f"svc-{i}" for i in range(200)]
+        probe = _slow_probe({svc: 0.05 for svc in services})
+        started = time.perf_counter()
+        results = run_health_checks(services, probe=probe)
+        assert len(results) == 200
+        assert time.perf_counter() - started < 2.0
+
+    def test_results_stream_in_completion_order(self):
+        seen = []
+        probe = _slow_probe({"slow": 0.2, "fast": 0.0})
+        run_health_checks(["slow", "fast"], on_result=lambda r: seen.append(r["service"]), probe=probe)
+        assert seen == ["fast", "slow"]
+
+    def test_per_service_timeout(self):
+        probe = _slow_probe({"hung": 1.0})
+        results = {r["service"]: r for r in run_health_checks(["hung", "ok"], probe=probe, timeout=0.1)}
+        assert results["hung"]["status"] == "unknown"
+        assert "timed out" in results["hung"]["error"]
+        assert results["ok"]["status"] == "healthy"
+
+    def test_hung_probes_holding_every_slot_do_not_extend_the_sweep(self):
+        probe = _slow_probe({"hung-1": 2.0, "hung-2": 2.0})
+        started = time.perf_counter()
+        results = run_health_checks(["hung-1", "hung-2", "ok"], probe=probe, timeout=0.5, concurrency=2)
+        assert time.perf_counter() - started < 1.0
+        assert {r["service"]: r["status"] for r in results} == {
+            "hung-1": "unknown", "hung-2": "unknown", "ok": "unknown",
+        }
+
+    def test_probe_error_is_reported(self):
+        def probe(service):
+            raise RuntimeError("connection refused")
+
+        (result,) = run_health_checks(["api"], probe=probe)
+        assert result["status"] == "unknown"
+        assert "connection refused" in result["error"]
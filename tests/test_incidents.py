@@ -0,0 +1,213 @@
+"""Tests for the indexed incident store."""
+
+import os
+import threading
+
+import pytest
+from novaops.incidents import IncidentStore, PersistentIncidentStore
+from novaops.journal import SNAPSHOT_FILE
+from novaops.tools.dashboard import _incident_store, create_incident, get_dashboard_data
+
+
+def _incident(i, status="open", severity="medium"):
+    return {"incident_id": f"INC-{i:04d}", "title": f"Incident {i}", "status": status, "severity": severity}
+
+
+class TestIncidentStore:
+    """Tests for IncidentStore."""
+
+    def setup_method(self):
+        self.store = IncidentStore()
+        for i in range(10):
+            self.store.add(_incident(i, severity="critical" if i % 2 else "low"))
+
+    def test_get_returns_copy(self):
+        inc = self.store.get("INC-0003")
+        inc["title"] = "mutated"
+        assert self.store.get("INC-0003")["title"] == "Incident 3"
+
+    def test_get_missing(self):
+        assert self.store.get("INC-MISSING") is None
+
+    def test_duplicate_id_rejected(self):
+        with pytest.raises(KeyError):
+            self.store.add(_incident(3))
+
+    def test_update_reindexes_status(self):
+        self.store.update("INC-0004", status="resolved")
+        assert self.store.count(status="open") == 9
+        assert [i["incident_id"] for i in self.store.query(status="resolved")] == ["INC-0004"]
+
+    def test_filtered_pages_keep_creation_order_after_updates(self):
+        store = IncidentStore()
+        for i in range(3):
+            store.add(_incident(i))
+        store.update("INC-0001", status="investigating")
+        store.update("INC-0001", status="open")
+        store.update("INC-0000", severity="medium", title="renamed")
+        ids = [i["incident_id"] for i in store.query(status="open", newest_first=True)]
+        assert ids == ["INC-0002", "INC-0001", "INC-0000"]
+
+    def test_missing_id_is_assigned(self):
+        store = IncidentStore()
+        first = store.add({"incident_id": None, "title": "a", "status": "open", "severity": "low"})
+        second = store.add({"title": "b", "status": "open", "severity": "low"})
+        assert first["incident_id"].startswith("INC-") and len(first["incident_id"]) == 16
+        assert first["incident_id"] != second["incident_id"]
+        assert store.get(second["incident_id"])["title"] == "b"
+
+    def test_update_missing_returns_none(self):
+        assert self.store.update("INC-MISSING", status="closed") is None
+
+    def test_filter_by_severity(self):
+        assert self.store.count(severity="critical") == 5
+        assert all(i["severity"] == "critical" for i in self.store.query(severity="critical"))
+
+    def test_combined_filters(self):
+        self.store.update("INC-0001", status="investigating")
+        result = self.store.query(status="investigating", severity="critical")
+        assert [i["incident_id"] for i in result] == ["INC-0001"]
+        assert self.store.count(status="investigating", severity="low") == 0
+        assert self.store.count(status="investigating", severity="critical") == 1
+        self.store.update("INC-0001", severity="low")
+        assert self.store.count(status="investigating", severity="critical") == 0
+        assert self.store.count(status="open", severity="critical") == 4
+        assert self.store.count(status="investigating", severity="low") == 1
+
+    def test_pagination(self):
+        page = self.store.query(offset=2, limit=3)
+        assert [i["incident_id"] for i in page] == ["INC-0002", "INC-0003", "INC-0004"]
+
+    def test_newest_first(self):
+        assert self.store.query(limit=1, newest_first=True)[0]["incident_id"] == "INC-0009"
+
+    def test_counts_by(self):
+        assert self.store.counts_by("severity") == {"low": 5, "critical": 5}
+
+    def test_concurrent_updates(self):
+        def worker(n):
+            for i in range(10):
+                self.store.update(f"INC-{i:04d}", status="investigating" if n % 2 else "open")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sum(self.store.counts_by("status").values()) == 10
+
+
+    def test_a_failing_listener_does_not_fail_the_write(self):
+        store = IncidentStore()
+        seen = []
+
+        def broken(op, incident):
+            raise RuntimeError("subscriber crashed")
+
+        store.subscribe(broken)
+        store.subscribe(lambda op, incident: seen.append(op))
+        store.add(_incident(1))
+        assert store.update("INC-0001", status="resolved")["status"] == "resolved"
+        assert seen == ["add", "update"] and store.listener_errors == 2
+
+
+class TestPersistentIncidentStore:
+    """Tests for the journalled incident store."""
+
+    def test_recovers_after_reopen(self, tmp_path):
+        store = PersistentIncidentStore(str(tmp_path), sync=False)
+        for i in range(5):
+            store.add(_incident(i))
+        store.update("INC-0002", status="resolved")
+        store.close()
+
+        reopened = PersistentIncidentStore(str(tmp_path), sync=False)
+        assert len(reopened) == 5
+        assert reopened.get("INC-0002")["status"] == "resolved"
+        assert reopened.count(status="open") == 4
+        reopened.close()
+
+    def test_recovered_incidents_are_searchable(self, tmp_path):
+        from novaops.tools.analysis import get_incident_index
+        from novaops.tools.dashboard import _index_recovered
+
+        store = PersistentIncidentStore(str(tmp_path), sync=False)
+        store.add({**_incident(7001), "description": "Kafka consumer lag", "created_at": "2026-01-01"})
+        store.close()
+
+        reopened = PersistentIncidentStore(str(tmp_path), sync=False)
+        _index_recovered(reopened)
+        reopened.close()
+        assert get_incident_index().get("INC-7001")["title"] == "Incident 7001"
+
+    def test_listeners_run_after_the_change_is_journalled(self, tmp_path):
+        store = PersistentIncidentStore(str(tmp_path), sync=False)
+        logged = []
+        store.subscribe(lambda op, incident: logged.append(store._journal.seq))
+        store.add(_incident(1))
+        store.update("INC-0001", status="resolved")
+        store.close()
+        assert logged == [1, 2]
+
+    def test_compaction_bounds_log(self, tmp_path):
+        store = PersistentIncidentStore(str(tmp_path), sync=False, snapshot_every=10)
+        for i in range(35):
+            store.add(_incident(i))
+        store.close()
+        segments = [n for n in os.listdir(tmp_path) if n.endswith(".log")]
+        assert os.path.exists(tmp_path / SNAPSHOT_FILE)
+        assert len(segments) == 1
+
+        reopened = PersistentIncidentStore(str(tmp_path), sync=False, snapshot_every=10)
+        assert len(reopened) == 35
+        reopened.close()
+
+    def test_torn_tail_is_discarded(self, tmp_path):
+        store = PersistentIncidentStore(str(tmp_path), sync=False)
+        store.add(_incident(1))
+        store.close()
+        (segment,) = [n for n in os.listdir(tmp_path) if n.endswith(".log")]
+        with open(tmp_path / segment, "ab") as f:
+            f.write(b"deadbeef {\"seq\": 2, \"op\"")
+
+        reopened = PersistentIncidentStore(str(tmp_path), sync=False)
+        assert len(reopened) == 1
+        reopened.add(_incident(2))
+        reopened.close()
+        assert len(PersistentIncidentStore(str(tmp_path), sync=False)) == 2
+
+    def test_concurrent_writers_share_commits(self, tmp_path):
+        store = PersistentIncidentStore(str(tmp_path))
+
+        def worker(n):
+            for i in range(25):
+                store.add(_incident(n * 100 + i))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        store.close()
+        assert len(PersistentIncidentStore(str(tmp_path))) == 200
+
+
+class TestDashboardPaging:
+    """Tests for paginated get_dashboard_data reads."""
+
+    def setup_method(self):
+        _incident_store.clear()
+
+    def test_limit_and_total_count(self):
+        for i in range(5):
+            create_incident(title=f"Storm {i}", severity="high", description="storm")
+        data = get_dashboard_data(limit=2)
+        assert data["incident_count"] == 5
+        assert [i["title"] for i in data["active_incidents"]] == ["Storm 4", "Storm 3"]
+
+    def test_severity_filter(self):
+        create_incident(title="A", severity="low", description="a")
+        create_incident(title="B", severity="critical", description="b")
+        data = get_dashboard_data(severity="critical")
+        assert data["incident_count"] == 1
+        assert data["incidents_by_severity"] == {"low": 1, "critical": 1}
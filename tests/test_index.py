@@ -0,0 +1,140 @@
+"""Tests for the incident vector index and embeddings."""
+
+import random
+
+import numpy as np
+import pytest
+from novaops.embeddings import EMBEDDING_DIM, EmbeddingCache, embed_text, embed_texts, text_key
+from novaops.index import IncidentIndex
+from novaops.tools.analysis import _INCIDENT_DB, get_incident_index, search_incidents
+from novaops.tools.dashboard import create_incident
+
+
+class TestEmbedText:
+    """Tests for the mock embedding function."""
+
+    def test_shape_and_dtype(self):
+        vec = embed_text("api gateway timeout")
+        assert vec.shape == (EMBEDDING_DIM,)
+        assert vec.dtype == np.float32
+
+    def test_unit_norm(self):
+        assert np.linalg.norm(embed_text("cache eviction storm")) == pytest.approx(1.0, abs=1e-5)
+
+    def test_deterministic(self):
+        assert np.array_equal(embed_text("replication lag"), embed_text("replication lag"))
+
+    def test_shared_vocabulary_is_closer(self):
+        q = embed_text("database replication lag")
+        near = embed_text("Database replication lag on the primary")
+        far = embed_text("TLS certificate expired")
+        assert float(q @ near) > float(q @ far)
+
+
+class TestEmbedTexts:
+    """Tests for the batch embeddings API and its cache."""
+
+    def test_batch_matches_single(self):
+        texts = ["api timeout", "cache eviction", "api timeout", ""]
+        matrix = embed_texts(texts, cache=EmbeddingCache())
+        assert matrix.shape == (4, EMBEDDING_DIM)
+        for row, text in zip(matrix, texts):
+            assert np.allclose(row, embed_text(text), atol=1e-6)
+
+    def test_empty_batch(self):
+        assert embed_texts([], cache=EmbeddingCache()).shape == (0, EMBEDDING_DIM)
+
+    def test_cache_hits_on_repeat(self):
+        cache = EmbeddingCache()
+        embed_texts(["one", "two"], cache=cache)
+        embed_texts(["one", "two", "three"], cache=cache)
+        assert cache.stats() == {"size": 3, "hits": 2, "misses": 3}
+
+    def test_cache_is_bounded(self):
+        cache = EmbeddingCache(maxsize=2)
+        embed_texts(["a1", "b2", "c3"], cache=cache)
+        assert len(cache) == 2
+        assert cache.get(text_key("a1")) is None
+
+    def test_disk_cache_survives_new_instance(self, tmp_path):
+        embed_texts(["persisted text"], cache=EmbeddingCache(cache_dir=str(tmp_path)))
+        fresh = EmbeddingCache(cache_dir=str(tmp_path))
+        assert fresh.get(text_key("persisted text")) is not None
+
+    def test_does_not_touch_global_random_state(self):
+        random.seed(1234)
+        expected = random.random()
+        random.seed(1234)
+        embed_texts(["global state check"], cache=EmbeddingCache())
+        assert random.random() == expected
+
+
+class TestIncidentIndex:
+    """Tests for IncidentIndex."""
+
+    def setup_method(self):
+        self.index = IncidentIndex.from_records(_INCIDENT_DB)
+
+    def test_len(self):
+        assert len(self.index) == len(_INCIDENT_DB)
+
+    def test_matrix_is_contiguous_float32(self):
+        assert self.index._matrix.dtype == np.float32
+        assert self.index._matrix.flags["C_CONTIGUOUS"]
+
+    def test_best_match(self):
+        results = self.index.search("database replication lag", k=3)
+        assert results[0][1]["id"] == "INC-002"
+
+    def test_results_are_deterministic(self):
+        r1 = self.index.search("api timeout", k=5)
+        r2 = self.index.search("api timeout", k=5)
+        assert [(s, r["id"]) for s, r in r1] == [(s, r["id"]) for s, r in r2]
+
+    def test_scores_sorted_and_bounded(self):
+        scores = [s for s, _ in self.index.search("queue backlog", k=5)]
+        assert scores == sorted(scores, reverse=True)
+        assert all(0.0 <= s <= 1.0 for s in scores)
+
+    def test_k_larger_than_index(self):
+        assert len(self.index.search("anything", k=50)) == len(_INCIDENT_DB)
+
+    def test_empty_index(self):
+        assert IncidentIndex().search("anything") == []
+
+    def test_incremental_insert_grows_matrix(self):
+        for i in range(200):
+            self.index.add({"id": f"INC-X{i}", "title": f"synthetic incident {i}", "service": "api"})
+        assert len(self.index) == len(_INCIDENT_DB) + 200
+        assert self.index.get("INC-X199")["title"] == "synthetic incident 199"
+
+    def test_re_adding_id_replaces_record(self):
+        self.index.add({"id": "INC-001", "title": "Renamed", "service": "api"})
+        assert len(self.index) == len(_INCIDENT_DB)
+        assert self.index.get("INC-001")["title"] == "Renamed"
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        path = tmp_path / "index.npz"
+        self.index.save(str(path))
+        loaded = IncidentIndex.load(str(path))
+        assert len(loaded) == len(self.index)
+        assert loaded.search("cache eviction", k=1)[0][1]["id"] == "INC-003"
+
+
+class TestSearchIncidentsIndex:
+    """Tests for search_incidents backed by the shared index."""
+
+    def test_scores_are_reproducible(self):
+        r1 = search_incidents(query="api gateway timeout")
+        r2 = search_incidents(query="api gateway timeout")
+        assert r1["results"] == r2["results"]
+
+    def test_created_incident_is_searchable(self):
+        inc = create_incident(
+            title="Kafka broker partition leader election",
+            severity="high",
+            description="Broker partition leader election storm",
+        )
+        assert inc["incident_id"] in get_incident_index()
+        result = search_incidents(query="kafka partition leader election")
+        assert result["results"][0]["incident_id"] == inc["incident_id"]
@@ -0,0 +1,125 @@
+"""Tests for session-scoped conversation memory."""
+
+import asyncio
+
+from strands import Agent
+from novaops.agents.stub import StubModel
+from novaops.memory import (
+    SUMMARY_PREFIX,
+    SessionStore,
+    TokenBudgetConversationManager,
+    estimate_tokens,
+)
+
+
+def _agent(budget=400, keep_turns=2):
+    return Agent(
+        model=StubModel(respond=lambda prompt, results: f"Answer to {prompt} " + "detail " * 40),
+        callback_handler=None,
+        conversation_manager=TokenBudgetConversationManager(budget=budget, keep_turns=keep_turns),
+    )
+
+
+class TestTokenBudgetConversationManager:
+    """Tests for keeping history under the token budget."""
+
+    def test_history_stays_within_budget(self):
+        agent = _agent()
+        for i in range(20):
+            agent(f"question {i}")
+            assert estimate_tokens(agent.messages) <= 400
+        assert len(agent.messages) < 10
+
+    def test_evicted_turns_are_summarized(self):
+        agent = _agent()
+        for i in range(6):
+            agent(f"question {i}")
+        first = agent.messages[0]
+        assert first["role"] == "user"
+        summary = first["content"][0]["text"]
+        assert summary.startswith(SUMMARY_PREFIX)
+        # The newest evicted turn is summarized; the oldest lines give way to the summary cap.
+        assert "User: question 3" in summary
+        assert agent.conversation_manager.summarized_turns >= 3
+
+    def test_recent_turns_are_kept_verbatim(self):
+        agent = _agent(keep_turns=2)
+        for i in range(6):
+            agent(f"question {i}")
+        prompts = [b["text"] for m in agent.messages if m["role"] == "user" for b in m["content"]]
+        assert prompts[-1] == "question 5"
+        assert "question 4" in prompts
+
+    def test_tool_calls_are_not_split_from_results(self):
+        from novaops.tools import check_health
+
+        agent = Agent(
+            model=StubModel(plan=lambda prompt, tools: [("check_health", {"service": "api"})]),
+            callback_handler=None,
+            tools=[check_health],
+            conversation_manager=TokenBudgetConversationManager(budget=150, keep_turns=1),
+        )
+        for i in range(5):
+            agent(f"check api {i}")
+        messages = agent.messages
+        assert messages[0]["role"] == "user"
+        uses = [b["toolUse"]["toolUseId"] for m in messages for b in m["content"] if "toolUse" in b]
+        results = [b["toolResult"]["toolUseId"] for m in messages for b in m["content"] if "toolResult" in b]
+        assert uses == results
+
+
+class TestSessionStore:
+    """Tests for per-session agents with LRU and idle eviction."""
+
+    def test_sessions_have_separate_histories(self):
+        store = SessionStore(_agent, max_sessions=4)
+        store.get("alice")("hello from alice")
+        store.get("bob")("hello from bob")
+        assert store.get("alice") is not store.get("bob")
+        alice_text = str(store.get("alice").messages)
+        assert "alice" in alice_text and "bob" not in alice_text
+
+    def test_concurrent_sessions_do_not_share_sub_agents(self, install_stub):
+        from novaops.agents.commander import create_commander_agent
+
+        def plan(prompt, tool_names):
+            return [("monitor_agent", {"query": prompt})] if "monitor_agent" in tool_names else []
+
+        install_stub(StubModel(plan=plan, first_token_delay=0.05))
+        store = SessionStore(create_commander_agent)
+        alice, bob = store.get("alice"), store.get("bob")
+
+        async def both():
+            await asyncio.gather(alice.invoke_async("alice asks"), bob.invoke_async("bob asks"))
+
+        asyncio.run(both())
+        for agent, other in ((alice, "bob"), (bob, "alice")):
+            results = [
+                b["toolResult"] for m in agent.messages for b in m["content"] if "toolResult" in b
+            ]
+            assert [r["status"] for r in results] == ["success"]
+            assert other not in str(agent.messages)
+
+    def test_least_recently_used_session_is_evicted(self):
+        store = SessionStore(_agent, max_sessions=2)
+        a = store.get("a")
+        store.get("b")
+        assert store.get("a") is a  # touch a, so b is now the oldest
+        store.get("c")
+        assert "b" not in store and "a" in store and "c" in store
+        assert store.stats()["evictions"] == 1
+
+    def test_idle_sessions_expire(self):
+        now = [0.0]
+        store = SessionStore(_agent, max_sessions=10, idle_ttl=60, clock=lambda: now[0])
+        store.get("a")
+        now[0] = 30.0
+        store.get("b")
+        now[0] = 70.0
+        store.get("b")
+        assert "a" not in store and "b" in store
+
+    def test_get_without_id_creates_a_session(self):
+        store = SessionStore(_agent)
+        store.get()
+        assert len(store) == 1
@@ -3,7 +3,7 @@
 import pytest
 from novaops.tools.analysis import search_incidents, root_cause_analysis, get_embeddings
 from novaops.tools.voice import text_to_speech, speech_to_text, voice_alert
-from novaops.tools.dashboard import get_dashboard_data, create_incident, update_incident_status, _active_incidents
+from novaops.tools.dashboard import get_dashboard_data, create_incident, update_incident_status, _incident_store
 
 
 # ── Analyst Tools ────────────────────────────────────────────────────────────
@@ -187,9 +187,10 @@ class TestVoiceAlert:
         critical = voice_alert(message="Critical", severity="critical")
         assert len(critical["channels"]) >= len(info["channels"])
 
-    def test_broadcast_status_delivered(self):
+    def test_broadcast_is_queued(self):
         result = voice_alert(message="Test", severity="info")
-        assert result["broadcast_status"] == "delivered"
+        assert result["broadcast_status"] == "queued"
+        assert result["broadcast_id"].startswith("BC-")
 
     def test_invalid_severity_defaults_to_info(self):
         result = voice_alert(message="Test", severity="banana")
@@ -234,7 +235,7 @@ class TestCreateIncident:
 
     def setup_method(self):
         """Clear incident store before each test."""
-        _active_incidents.clear()
+        _incident_store.clear()
 
     def test_returns_dict(self):
         result = create_incident(title="Test", severity="low", description="A test incident")
@@ -259,7 +260,7 @@ class TestCreateIncident:
 
     def test_incident_added_to_store(self):
         create_incident(title="Stored", severity="low", description="Should be stored")
-        assert len(_active_incidents) == 1
+        assert len(_incident_store) == 1
 
     def test_invalid_severity_defaults_to_medium(self):
         result = create_incident(title="Test", severity="banana", description="Bad severity")
@@ -271,7 +272,7 @@ class TestUpdateIncidentStatus:
 
     def setup_method(self):
         """Clear and seed incident store."""
-        _active_incidents.clear()
+        _incident_store.clear()
 
     def test_update_existing_incident(self):
         inc = create_incident(title="Updatable", severity="high", description="Will update")
@@ -296,8 +297,9 @@ class TestCommanderIntegration:
 
     def test_commander_has_four_tools(self):
         from novaops.agents.commander import commander_agent
-        # Commander should have 4 sub-agents as tools
-        assert len(commander_agent.tools) == 4
+        # Commander should have 4 sub-agents as tools, plus the parallel dispatcher
+        assert len(commander_agent.tool_names) == 5
+        assert "dispatch_agents" in commander_agent.tool_names
 
     def test_commander_imports_all_agents(self):
         from novaops.agents.commander import commander_agent
@@ -305,9 +307,25 @@ class TestCommanderIntegration:
         from novaops.agents.analyst import analyst_agent
         from novaops.agents.voice import voice_agent
         from novaops.agents.dashboard import dashboard_agent
-        tools = commander_agent.tools
-        # Verify all agents are present (they may be wrapped, so check count)
-        assert len(tools) == 4
+        assert set(commander_agent.tool_names) >= {
+            a.name for a in (monitor_agent, analyst_agent, voice_agent, dashboard_agent)
+        }
+
+    def test_building_commander_does_not_build_sub_agents(self):
+        from novaops.agents.commander import get_commander_agent
+        from novaops.agents.voice import get_voice_agent
+        get_commander_agent.cache_clear()
+        get_voice_agent.cache_clear()
+        get_commander_agent()
+        assert get_voice_agent.cache_info().currsize == 0
+
+    def test_agents_are_memoized(self):
+        from novaops.agents import get_analyst_agent
+        assert get_analyst_agent() is get_analyst_agent()
+
+    def test_agents_share_one_model(self):
+        from novaops.agents import get_commander_agent, get_dashboard_agent
+        assert get_commander_agent().model is get_dashboard_agent().model
 
 
 # ── Package-level imports ────────────────────────────────────────────────────
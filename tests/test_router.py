@@ -0,0 +1,81 @@
+"""Tests for routing commands across the fast path, Nova Lite and Nova Pro."""
+
+from strands import Agent
+from novaops.agents.stub import StubModel
+from novaops.fastpath import match_fast_path
+from novaops.router import ModelRouter
+
+
+def _router(calls):
+    def check_health(service):
+        calls.append(("check_health", service))
+        return {"service": service, "status": "healthy"}
+
+    return ModelRouter(
+        lite_model=StubModel(respond=lambda prompt, results: "lite"),
+        pro_model=StubModel(respond=lambda prompt, results: "pro"),
+        tools={"check_health": check_health, "get_dashboard_data": lambda: {"services": {}}},
+    )
+
+
+def _invoke(agent, prompt):
+    return str(agent(prompt)).strip()
+
+
+class TestClassify:
+    """Tests for picking a tier without calling a model."""
+
+    def test_single_tool_commands_take_the_fast_path(self):
+        assert match_fast_path("health of api") == ("check_health", {"service": "api"})
+        assert match_fast_path("Cache health?") == ("check_health", {"service": "cache"})
+        assert match_fast_path("show the dashboard") == ("get_dashboard_data", {})
+        assert match_fast_path("is the api healthy after the deploy") is None
+
+    def test_routine_requests_go_to_lite(self):
+        route = ModelRouter().classify("list the open incidents")
+        assert route.tier == "lite"
+
+    def test_analysis_goes_to_pro(self):
+        router = ModelRouter()
+        assert router.classify("why is the api slow?").tier == "pro"
+        assert router.classify("find the root cause of INC-1").tier == "pro"
+
+    def test_multi_step_and_cross_domain_requests_go_to_pro(self):
+        router = ModelRouter()
+        assert router.classify("check metrics then page on-call").reason == "spans monitor, voice"
+        assert router.classify("open an incident; then resolve it").tier == "pro"
+        route = router.classify("page the team about why the api is slow then analyze root cause")
+        assert route.tier == "pro" and route.tool is None
+        assert router.classify("search why did the database fail and compare with today").tier == "pro"
+
+
+class TestHandle:
+    """Tests for running a request on its tier."""
+
+    def test_fast_path_calls_the_tool_without_a_model(self):
+        calls = []
+        agent = Agent(model=StubModel(), callback_handler=None)
+        routed = _router(calls).handle(agent, "health of database", _invoke)
+        assert routed.route.tier == "fast"
+        assert routed.output == {"service": "database", "status": "healthy"}
+        assert calls == [("check_health", "database")]
+        assert agent.messages == []
+
+    def test_tiers_swap_the_model_and_keep_the_conversation(self):
+        router = _router([])
+        agent = Agent(model=StubModel(), callback_handler=None)
+        assert router.handle(agent, "list open incidents", _invoke).output == "lite"
+        assert router.handle(agent, "why did the api fail?", _invoke).output == "pro"
+        prompts = [b["text"] for m in agent.messages if m["role"] == "user" for b in m["content"]]
+        assert prompts == ["list open incidents", "why did the api fail?"]
+
+    def test_latency_is_recorded_per_tier(self):
+        router = _router([])
+        agent = Agent(model=StubModel(), callback_handler=None)
+        router.handle(agent, "dashboard", _invoke)
+        router.handle(agent, "health of api", _invoke)
+        router.handle(agent, "list open incidents", _invoke)
+        stats = router.stats()
+        assert stats["fast"]["count"] == 2 and stats["lite"]["count"] == 1
+        assert stats["pro"] == {"count": 0, "p50_ms": None, "p95_ms": None}
+        assert stats["fast"]["p95_ms"] >= stats["fast"]["p50_ms"] >= 0
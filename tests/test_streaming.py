@@ -0,0 +1,191 @@
+"""Tests for streaming Commander responses."""
+
+import _thread
+import asyncio
+import io
+import json
+import threading
+import time
+
+import pytest
+from pydantic import BaseModel, ValidationError
+from strands import Agent
+from novaops.agents import bedrock, commander
+from novaops.agents.stub import StubModel, keyword_plan
+from novaops.streaming import stream_response
+
+class TestStreamResponse:
+    """Tests for stream_response."""
+
+    def test_streams_text_and_reports_ttft(self):
+        agent = Agent(model=StubModel(respond=lambda p, r: "one two three"), callback_handler=None)
+        out = io.StringIO()
+        stats = stream_response(agent, "hello", out=out)
+        assert "one two three" in out.getvalue()
+        assert stats["ttft_ms"] is not None
+        assert stats["total_ms"] >= stats["ttft_ms"]
+        assert not stats["cancelled"]
+
+    def test_shows_sub_agent_tool_calls(self, install_stub):
+        install_stub()
+        out = io.StringIO()
+        stats = stream_response(commander.get_commander_agent(), "health of api", out=out)
+        rendered = out.getvalue()
+        assert "↳ monitor_agent" in rendered
+        assert "monitor_agent → check_health" in rendered
+        assert stats["result"].stop_reason == "end_turn"
+
+    def test_ctrl_c_cancels_in_flight_request(self):
+        words = " ".join(f"w{i}" for i in range(200))
+        agent = Agent(
+            model=StubModel(respond=lambda p, r: words, token_delay=0.02), callback_handler=None
+        )
+        timer = threading.Timer(0.2, _thread.interrupt_main)
+        timer.start()
+        out = io.StringIO()
+        stats = stream_response(agent, "long answer", out=out)
+        timer.join()
+        assert stats["cancelled"]
+        assert stats["total_ms"] < 4000
+        # The agent is still usable for the next request.
+        agent.model.update_config(token_delay=0.0)
+        assert not stream_response(agent, "again", out=io.StringIO())["cancelled"]
+
+    def test_second_ctrl_c_returns_once_the_agent_has_stopped(self):
+        words = " ".join(f"w{i}" for i in range(50))
+        agent = Agent(
+            model=StubModel(respond=lambda p, r: words, token_delay=0.3), callback_handler=None
+        )
+        timers = [threading.Timer(delay, _thread.interrupt_main) for delay in (0.1, 0.15)]
+        for timer in timers:
+            timer.start()
+        stats = stream_response(agent, "long answer", out=io.StringIO())
+        for timer in timers:
+            timer.join()
+        assert stats["cancelled"]
+        # The cancelled invocation has finished, so the agent takes the next request.
+        agent.model.update_config(token_delay=0.0)
+        assert not stream_response(agent, "again", out=io.StringIO())["cancelled"]
+
+    def test_agent_errors_are_raised(self):
+        class Broken(StubModel):
+            async def stream(self, *args, **kwargs):
+                raise RuntimeError("model unavailable")
+                yield
+
+        agent = Agent(model=Broken(), callback_handler=None)
+        with pytest.raises(RuntimeError, match="model unavailable"):
+            stream_response(agent, "hello", out=io.StringIO())
+
+
+class TestParallelDispatch:
+    """Tests for concurrent sub-agent dispatch in the Commander."""
+
+    @staticmethod
+    def _run(tasks):
+        async def collect():
+            return [event async for event in commander._dispatch(tasks)]
+
+        return asyncio.run(collect())
+
+    def test_independent_agents_run_concurrently(self, install_stub):
+        install_stub(StubModel(first_token_delay=0.3))
+        started = time.perf_counter()
+        events = self._run([
+            {"agent": "monitor", "query": "check api health"},
+            {"agent": "analyst", "query": "similar incidents"},
+            {"agent": "voice", "query": "alert on-call"},
+        ])
+        elapsed = time.perf_counter() - started
+        results = events[-1]["results"]
+        assert [r["agent"] for r in results] == ["monitor", "analyst", "voice"]
+        assert all("Acknowledged" in r["answer"] for r in results)
+        assert elapsed < 0.8  # three sequential runs would take >= 0.9s
+
+    def test_same_agent_tasks_each_get_an_answer(self, install_stub):
+        install_stub(StubModel(first_token_delay=0.1))
+        results = self._run([
+            {"agent": "monitor", "query": "first"},
+            {"agent": "monitor", "query": "second"},
+        ])[-1]["results"]
+        assert [r["answer"].strip() for r in results] == ["Acknowledged: first", "Acknowledged: second"]
+
+    def test_same_agent_calls_in_one_turn_run_side_by_side(self, install_stub):
+        def plan(prompt, tool_names):
+            if "monitor_agent" in tool_names:
+                return [("monitor_agent", {"query": "api"}), ("monitor_agent", {"query": "cache"})]
+            return []
+
+        install_stub(StubModel(plan=plan, first_token_delay=0.1))
+        agent = commander.create_commander_agent()
+        asyncio.run(agent.invoke_async("check api and cache"))
+        results = [
+            block["toolResult"]
+            for message in agent.messages
+            for block in message["content"]
+            if "toolResult" in block
+        ]
+        assert len(results) == 2
+        assert all(r["status"] == "success" for r in results)
+        assert not any("ConcurrencyException" in json.dumps(r) for r in results)
+
+    def test_unknown_agent_reports_error(self, install_stub):
+        install_stub()
+        (result,) = self._run([{"agent": "janitor", "query": "mop"}])[-1]["results"]
+        assert "Unknown agent" in result["error"]
+
+    def test_sub_agent_tool_events_are_forwarded(self, install_stub):
+        install_stub()
+        events = self._run([{"agent": "monitor", "query": "health"}])
+        assert {"agent": "monitor_agent", "tool_call": "check_health"} in events
+
+
+class TestStubModelHook:
+    """Tests for NOVAOPS_MODEL=stub and keyword routing."""
+
+    def test_env_selects_the_stub(self, monkeypatch):
+        monkeypatch.setenv("NOVAOPS_MODEL", "stub")
+        monkeypatch.setenv("NOVAOPS_STUB_FIRST_TOKEN_DELAY", "0.25")
+        bedrock.clear_model_cache()
+        try:
+            model = bedrock.get_model()
+            assert isinstance(model, StubModel)
+            assert model is bedrock.get_model()
+            assert model.config["first_token_delay"] == 0.25
+        finally:
+            bedrock.clear_model_cache()
+
+    def test_commander_routes_to_one_sub_agent(self):
+        plan = keyword_plan("check health of the database", ["monitor_agent", "analyst_agent", "dispatch_agents"])
+        assert plan == [("monitor_agent", {"query": "check health of the database"})]
+
+    def test_commander_dispatches_independent_tasks(self):
+        tools = ["monitor_agent", "analyst_agent", "voice_agent", "dispatch_agents"]
+        ((name, args),) = keyword_plan("check api health and alert on-call", tools)
+        assert name == "dispatch_agents"
+        assert [t["agent"] for t in args["tasks"]] == ["monitor", "voice"]
+
+    def test_sub_agent_picks_a_matching_tool(self):
+        tools = ["search_incidents", "root_cause_analysis", "get_embeddings"]
+        assert keyword_plan("root cause of INC-003", tools) == [
+            ("root_cause_analysis", {"incident_id": "INC-003"})
+        ]
+        assert keyword_plan("api timeouts", tools) == [("search_incidents", {"query": "api timeouts"})]
+
+    def test_structured_output_is_built_from_the_answer(self):
+        class Summary(BaseModel):
+            text: str
+            severity: str = "low"
+
+        class Count(BaseModel):
+            total: int
+
+        async def collect(model, output_model):
+            return [e async for e in model.structured_output(output_model, messages)][-1]["output"]
+
+        messages = [{"role": "user", "content": [{"text": "summarise INC-003"}]}]
+        assert asyncio.run(collect(StubModel(), Summary)) == Summary(text="Acknowledged: summarise INC-003")
+        answer = StubModel(respond=lambda prompt, results: '{"total": 3}')
+        assert asyncio.run(collect(answer, Count)) == Count(total=3)
+        with pytest.raises(ValidationError):
+            asyncio.run(collect(StubModel(), Count))
@@ -0,0 +1,192 @@
+"""Tests for streaming text-to-speech."""
+
+import os
+import threading
+import time
+
+import pytest
+from novaops.synthesis import (
+    SAMPLE_WIDTH,
+    AudioCache,
+    StubSynthesizer,
+    audio_key,
+    get_audio_cache,
+    set_synthesizer,
+    split_sentences,
+    stream_speech,
+)
+
+LONG_TEXT = " ".join(
+    f"Service number {i} reports elevated latency and the on-call engineer has been notified." for i in range(30)
+)
+
+
+@pytest.fixture(autouse=True)
+def _empty_audio_cache():
+    get_audio_cache().clear()
+
+
+class TestSplitSentences:
+    """Tests for chunking text at sentence boundaries."""
+
+    def test_splits_at_sentence_ends(self):
+        assert split_sentences("API is down. Database is fine! Cache?") == [
+            "API is down.", "Database is fine!", "Cache?",
+        ]
+
+    def test_long_sentences_are_split_between_words(self):
+        text = "word " * 100
+        chunks = split_sentences(text, max_chars=50, first_chars=20)
+        assert len(chunks[0]) <= 20
+        assert all(len(c) <= 50 for c in chunks)
+        assert " ".join(chunks).split() == text.split()
+
+
+class TestSpeechStream:
+    """Tests for ordered, concurrent chunk synthesis."""
+
+    def test_frames_are_in_order_and_complete(self):
+        backend = StubSynthesizer()
+        frames = list(stream_speech(LONG_TEXT, backend=backend))
+        expected = b"".join(backend.synthesize(chunk) for chunk in split_sentences(LONG_TEXT))
+        assert b"".join(frames) == expected
+        assert all(len(f) == 640 for f in frames[:-1])  # 20 ms at 16 kHz
+
+    def test_first_audio_does_not_wait_for_the_whole_text(self):
+        stream = stream_speech(LONG_TEXT, backend=StubSynthesizer(latency=0.05), concurrency=4)
+        iterator = iter(stream)
+        started = time.perf_counter()
+        next(iterator)
+        first = time.perf_counter() - started
+        for _ in iterator:
+            pass
+        assert len(stream.chunks) > 30  # the first sentence is split to keep the first chunk short
+        assert first < 0.3
+        # Four chunks in flight at a time: well under what a serial run would take (1.5 s).
+        assert stream.total_ms < 1000
+        assert stream.duration_seconds == pytest.approx(stream.bytes / SAMPLE_WIDTH / 16000, abs=0.01)
+
+    def test_chunks_are_synthesized_concurrently_up_to_the_limit(self):
+        active, peak, lock = [0], [0], threading.Lock()
+
+        class Tracking(StubSynthesizer):
+            def synthesize(self, text, voice="tiffany"):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                try:
+                    return super().synthesize(text, voice)
+                finally:
+                    with lock:
+                        active[0] -= 1
+
+        list(stream_speech(LONG_TEXT, backend=Tracking(latency=0.02), concurrency=3))
+        assert 1 < peak[0] <= 3
+
+    def test_synthesis_errors_are_raised_to_the_reader(self):
+        class Failing(StubSynthesizer):
+            def synthesize(self, text, voice="tiffany"):
+                if "number 2 " in text:
+                    raise RuntimeError("backend unavailable")
+                return super().synthesize(text, voice)
+
+        frames = []
+        with pytest.raises(RuntimeError, match="backend unavailable"):
+            for frame in stream_speech(LONG_TEXT, backend=Failing()):
+                frames.append(frame)
+        assert frames  # audio for the chunks before the failure was played
+
+
+class TestAudioCache:
+    """Tests for the content-addressed audio cache."""
+
+    def test_repeated_text_is_not_synthesized_again(self):
+        backend, cache = StubSynthesizer(), AudioCache()
+        first = b"".join(stream_speech("Critical alert on API. Error rate above 5%.", backend=backend, cache=cache))
+        requests = backend.requests
+        stream = stream_speech("Critical alert on API. Error rate above 5%.", backend=backend, cache=cache)
+        assert b"".join(stream) == first
+        assert backend.requests == requests
+        assert stream.cached_chunks == len(stream.chunks) == 2
+        stats = cache.stats()
+        assert stats["hits"] == 2 and stats["misses"] == 2 and stats["hit_rate"] == 0.5
+        assert stats["bytes_saved"] == len(first)
+
+    def test_voice_and_format_are_part_of_the_key(self):
+        assert audio_key("hello", "tiffany", "stub/pcm_16000") != audio_key("hello", "matthew", "stub/pcm_16000")
+        assert audio_key("hello", "tiffany", "stub/pcm_16000") != audio_key("hello", "tiffany", "stub/pcm_8000")
+        backend, cache = StubSynthesizer(), AudioCache()
+        list(stream_speech("hello there", voice="tiffany", backend=backend, cache=cache))
+        list(stream_speech("hello there", voice="matthew", backend=backend, cache=cache))
+        assert backend.requests == 2
+
+    def test_entries_past_the_memory_cap_spill_to_disk(self, tmp_path):
+        cache = AudioCache(max_bytes=1000, spill_dir=str(tmp_path))
+        cache.put("a", b"a" * 600)
+        cache.put("b", b"b" * 600)
+        stats = cache.stats()
+        assert stats["memory_bytes"] == 600 and stats["disk_entries"] == 1
+        audio = cache.get("a")
+        assert isinstance(audio, memoryview) and bytes(audio) == b"a" * 600
+        assert cache.get("b") == b"b" * 600
+        assert cache.stats()["disk_hits"] == 1
+        # Spilled entries survive a restart.
+        assert bytes(AudioCache(max_bytes=1000, spill_dir=str(tmp_path)).get("a")) == b"a" * 600
+
+    def test_without_a_spill_dir_old_entries_are_dropped(self):
+        cache = AudioCache(max_bytes=1000, spill_dir="")
+        cache.put("a", b"a" * 600)
+        cache.put("b", b"b" * 600)
+        assert cache.get("a") is None and cache.get("b") is not None
+
+    def test_disk_usage_is_capped(self, tmp_path):
+        cache = AudioCache(max_bytes=0, spill_dir=str(tmp_path), max_disk_bytes=1500)
+        for key in "abc":
+            cache.put(key, key.encode() * 600)
+        assert cache.get("a") is None
+        assert cache.stats()["disk_bytes"] == 1200
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["b.pcm", "c.pcm"]
+
+    def test_a_failed_spill_drops_the_entry(self, tmp_path):
+        spill_dir = tmp_path / "spill"
+        cache = AudioCache(max_bytes=1000, spill_dir=str(spill_dir))
+        spill_dir.rmdir()
+        cache.put("a", b"a" * 600)
+        cache.put("b", b"b" * 600)
+        assert cache.get("a") is None and cache.get("b") is not None
+        assert cache.stats()["spill_errors"] == 1 and cache.stats()["disk_entries"] == 0
+
+    def test_spill_files_are_written_outside_the_lock(self, tmp_path, monkeypatch):
+        cache = AudioCache(max_bytes=1000, spill_dir=str(tmp_path))
+        held = []
+        replace = os.replace
+        monkeypatch.setattr(os, "replace", lambda *a: held.append(cache._lock.locked()) or replace(*a))
+        cache.put("a", b"a" * 600)
+        cache.put("b", b"b" * 600)
+        assert held == [False] and bytes(cache.get("a")) == b"a" * 600
+
+    def test_repeated_voice_alerts_reuse_the_clip(self):
+        from novaops.broadcast import BroadcastDispatcher
+
+        clips = []
+        dispatcher = BroadcastDispatcher(deliver=lambda c, m, s, audio: clips.append(audio), window=0)
+        try:
+            for _ in range(2):
+                dispatcher.submit("Critical alert on queue", "info")
+                assert dispatcher.flush(timeout=5)
+        finally:
+            dispatcher.close(timeout=5)
+        assert len(clips) == 2 and clips[0] == clips[1] and len(clips[0]) > 0
+        assert get_audio_cache().stats()["bytes_saved"] > 0
+
+    def test_voice_alerts_do_not_wait_for_synthesis(self):
+        from novaops.tools.voice import voice_alert
+
+        set_synthesizer(StubSynthesizer(latency=0.2))
+        try:
+            started = time.perf_counter()
+            for i in range(10):
+                voice_alert(message=f"Disk {i} is failing on db-1", severity="warning")
+            assert time.perf_counter() - started < 0.2
+        finally:
+            set_synthesizer(None)
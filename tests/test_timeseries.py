@@ -0,0 +1,102 @@
+"""Tests for the columnar metric time-series store."""
+
+import time
+
+import numpy as np
+import pytest
+from novaops.timeseries import MetricStore
+from novaops.tools import infra
+from novaops.tools.infra import get_metrics, get_metrics_batch
+
+
+def _ramp(store, start=0.0, n=600, step=10.0, slope=0.1, service="api", metric="cpu"):
+    timestamps = start + np.arange(n) * step
+    store.record_many(service, metric, timestamps, 10 + slope * np.arange(n))
+    return timestamps
+
+
+class TestMetricStore:
+    """Tests for MetricStore storage, rollups and queries."""
+
+    def test_raw_range_query(self):
+        store = MetricStore()
+        _ramp(store, n=10)
+        result = store.query("api", "cpu", start=20, end=50)
+        assert result["timestamp"] == [20.0, 30.0, 40.0, 50.0]
+        assert result["value"] == pytest.approx([10.2, 10.3, 10.4, 10.5])
+
+    def test_ring_buffer_keeps_newest_samples(self):
+        store = MetricStore(retention=100)
+        for chunk in range(5):
+            _ramp(store, start=chunk * 600, n=60)
+        timestamps = store.query("api", "cpu", end=1e9)["timestamp"]
+        assert len(timestamps) == 100
+        assert timestamps == sorted(timestamps)
+        assert timestamps[-1] == 4 * 600 + 590
+
+    def test_rollups(self):
+        store = MetricStore()
+        _ramp(store, n=30, step=10.0, slope=1.0)  # 300s: five 1m buckets
+        result = store.query("api", "cpu", end=1e9, resolution=60)
+        assert result["timestamp"] == [0.0, 60.0, 120.0, 180.0, 240.0]
+        assert result["count"] == [6.0] * 5
+        assert result["min"][0] == 10.0 and result["max"][0] == 15.0
+        assert result["avg"][0] == pytest.approx(12.5)
+        five = store.query("api", "cpu", end=1e9, resolution=300)
+        assert five["count"] == [30.0]
+
+    def test_unknown_resolution_rejected(self):
+        with pytest.raises(ValueError):
+            MetricStore().query("api", "cpu", resolution=7)
+
+    def test_out_of_order_samples_are_dropped(self):
+        store = MetricStore()
+        store.record("api", "cpu", 1.0, timestamp=100)
+        store.record("api", "cpu", 2.0, timestamp=50)
+        assert store.query("api", "cpu", end=1e9)["value"] == [1.0]
+
+    def test_summary_uses_rollups_beyond_raw_retention(self):
+        store = MetricStore(retention=60)
+        _ramp(store, n=600, slope=1.0)
+        stats = store.summary("api", "cpu", start=0, end=1e9)
+        assert stats["count"] == 600
+        assert stats["min"] == 10.0 and stats["max"] == 609.0
+        assert stats["last"] == 609.0
+
+    def test_trend(self):
+        store = MetricStore()
+        _ramp(store, service="up", slope=0.5)
+        _ramp(store, service="down", slope=-0.01)
+        _ramp(store, service="flat", slope=0.0)
+        end = 5990.0
+        assert store.trend("up", "cpu", end=end) == "increasing"
+        assert store.trend("down", "cpu", end=end) == "decreasing"
+        assert store.trend("flat", "cpu", end=end) == "stable"
+        assert store.trend("missing", "cpu") == "stable"
+
+    def test_range_query_is_fast(self):
+        store = MetricStore()
+        _ramp(store, n=8640)
+        started = time.perf_counter()
+        for _ in range(100):
+            store.query("api", "cpu", start=40_000, end=80_000)
+        assert (time.perf_counter() - started) / 100 < 0.005
+
+
+class TestMetricsTools:
+    """Tests that the metrics tools are served from the store."""
+
+    def test_get_metrics_reports_store_trend(self):
+        now = time.time()
+        timestamps = now - 900 + np.arange(91) * 10.0
+        infra.get_metric_store().record_many("trend-svc", "cpu", timestamps, 20 + np.arange(91) * 0.5)
+        result = get_metrics(service="trend-svc", metric_type="cpu")
+        assert result["trend"] == "increasing"
+        assert result["value"] == pytest.approx(65.0)
+
+    def test_batch_aggregates_come_from_history(self):
+        get_metrics(service="hist-svc", metric_type="latency")
+        result = get_metrics_batch(services=["hist-svc"], metric_types=["latency"], window_minutes=30)
+        stats = infra.get_metric_store().summary("hist-svc", "latency", time.time() - 1800)
+        assert result["columns"]["min"][0] == pytest.approx(stats["min"], abs=0.1)
+        assert result["columns"]["max"][0] == pytest.approx(stats["max"], abs=0.1)
@@ -0,0 +1,112 @@
+"""Tests for span tracing and its exporters."""
+
+import io
+import json
+import urllib.request
+
+import pytest
+from novaops import tracing
+from novaops.agents import commander
+from novaops.streaming import stream_response
+from novaops.tools.analysis import search_incidents
+from novaops.tools.infra import check_health
+
+
+@pytest.fixture
+def traces():
+    tracing.clear_traces()
+    tracing.enable()
+    yield tracing
+    tracing.enable(False)
+    tracing.clear_traces()
+
+
+class TestSpans:
+    """Tests for span recording and nesting."""
+
+    def test_disabled_by_default_records_nothing(self):
+        tracing.clear_traces()
+        check_health(service="api")
+        assert tracing.get_spans() == []
+
+    def test_tool_call_records_a_span(self, traces):
+        check_health(service="api")
+        (span,) = traces.get_spans()
+        assert span["kind"] == "tool"
+        assert span["name"] == "check_health"
+        assert span["duration_ms"] >= 0
+        assert span["parent_id"] is None
+        assert span["error"] is None
+
+    def test_nested_spans_share_a_trace(self, traces):
+        with traces.span("request", "agent") as outer:
+            search_incidents(query="database latency")
+        inner, root = traces.get_spans()
+        assert inner["parent_id"] == outer.span_id
+        assert inner["trace_id"] == root["trace_id"]
+
+    def test_errors_are_recorded_and_raised(self, traces):
+        @traces.traced
+        def broken():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            broken()
+        (span,) = traces.get_spans()
+        assert span["error"] == "ValueError: boom"
+        assert traces.trace_summary()["tool:broken"]["errors"] == 1
+
+
+class TestAgentTracing:
+    """Tests for agent and model spans through the Commander."""
+
+    def test_commander_request_nests_sub_agent_spans(self, traces, install_stub):
+        install_stub()
+        stream_response(commander.get_commander_agent(), "health of api", out=io.StringIO())
+        spans = {(s["kind"], s["name"]): s for s in traces.get_spans()}
+
+        root = spans[("agent", "commander_agent")]
+        sub_tool = spans[("tool", "monitor_agent")]
+        sub_agent = spans[("agent", "monitor_agent")]
+        health = spans[("tool", "check_health")]
+        assert root["parent_id"] is None
+        assert sub_tool["parent_id"] == root["span_id"]
+        assert sub_agent["parent_id"] == sub_tool["span_id"]
+        assert health["parent_id"] == sub_agent["span_id"]
+        assert len({s["trace_id"] for s in spans.values()}) == 1
+
+        model = spans[("model", "monitor_agent")]
+        assert model["parent_id"] == sub_agent["span_id"]
+        assert model["input_tokens"] > 0
+        assert sub_agent["input_tokens"] > 0 and sub_agent["output_tokens"] > 0
+
+
+class TestExport:
+    """Tests for the JSON lines and Prometheus exporters."""
+
+    def test_export_jsonl(self, traces, tmp_path):
+        check_health(service="api")
+        check_health(service="db")
+        path = tmp_path / "spans.jsonl"
+        assert traces.export_jsonl(str(path)) == 2
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [s["name"] for s in lines] == ["check_health", "check_health"]
+
+    def test_prometheus_text(self, traces):
+        check_health(service="api")
+        text = traces.prometheus_text()
+        assert 'novaops_span_duration_seconds_count{kind="tool",name="check_health"} 1' in text
+        assert 'le="+Inf"' in text
+        assert 'novaops_cache_misses_total{cache="check_health"}' in text
+
+    def test_metrics_endpoint(self, traces):
+        check_health(service="api")
+        server = traces.serve_metrics(port=0)
+        try:
+            base = f"http://127.0.0.1:{server.server_address[1]}"
+            metrics = urllib.request.urlopen(f"{base}/metrics").read().decode()
+            spans = urllib.request.urlopen(f"{base}/spans").read().decode()
+        finally:
+            server.shutdown()
+        assert "novaops_span_duration_seconds_bucket" in metrics
+        assert json.loads(spans.splitlines()[0])["name"] == "check_health"
@@ -0,0 +1,109 @@
+"""Tests for streaming speech-to-text with voice-activity detection."""
+
+import asyncio
+
+import numpy as np
+from strands import Agent
+from novaops.agents.stub import StubModel
+from novaops.router import ModelRouter
+from novaops.synthesis import StubSynthesizer
+from novaops.transcription import StreamingTranscriber, StubRecognizer, atranscribe_stream, transcribe_stream
+
+_rng = np.random.default_rng(7)
+
+
+def _silence(ms: int) -> bytes:
+    return _rng.normal(0, 30, 16 * ms).astype("<i2").tobytes()
+
+
+def _speech(words: int) -> bytes:
+    return StubSynthesizer().synthesize(" ".join(["word"] * words))
+
+
+def _chunks(pcm: bytes, size: int = 1000):
+    # Deliberately not a multiple of the detector's frame size.
+    for offset in range(0, len(pcm), size):
+        yield pcm[offset:offset + size]
+
+
+AUDIO = _silence(500) + _speech(5) + _silence(800) + _speech(3) + _silence(800)
+
+
+class TestStreamingTranscriber:
+    """Tests for cutting utterances and emitting hypotheses."""
+
+    def test_each_utterance_gets_partials_then_one_final(self):
+        recognizer = StubRecognizer(["check health of the api", "show dashboard"])
+        hypotheses = list(transcribe_stream(_chunks(AUDIO), recognizer))
+        finals = [h for h in hypotheses if h.final]
+        assert [h.text for h in finals] == ["check health of the api", "show dashboard"]
+        assert [h.utterance for h in finals] == [0, 1]
+        partials = [h for h in hypotheses if not h.final and h.utterance == 0]
+        assert partials and all("check health of the api".startswith(p.text) for p in partials)
+        # Utterance boundaries match the speech, give or take the pre-roll and end silence.
+        assert 250 <= finals[0].start_ms <= 500
+        assert 2500 <= finals[0].end_ms <= 3300
+
+    def test_final_is_emitted_as_soon_as_the_utterance_ends(self):
+        transcriber = StreamingTranscriber(StubRecognizer(["status"]), end_ms=400)
+        assert not any(h.final for h in transcriber.feed(_silence(300) + _speech(2)))
+        hypotheses = transcriber.feed(_silence(400))
+        assert [h.text for h in hypotheses if h.final] == ["status"]
+
+    def test_noise_alone_does_not_open_an_utterance(self):
+        noise = _rng.normal(0, 150, 16 * 3000).astype("<i2").tobytes()
+        assert list(transcribe_stream(_chunks(noise))) == []
+
+    def test_steady_noise_above_min_rms_is_learned_as_the_floor(self):
+        noise = _rng.normal(0, 600, 16 * 40_000).astype("<i2").tobytes()
+        transcriber = StreamingTranscriber()
+        hypotheses = [h for chunk in _chunks(noise) for h in transcriber.feed(chunk)]
+        hypotheses += transcriber.flush()
+        assert [h for h in hypotheses if h.final] == []
+        assert all(h.end_ms < 5000 for h in hypotheses)
+        # Speech over the same noise is still heard.
+        speech = np.frombuffer(_speech(4), dtype="<i2") * 2 + _rng.normal(0, 600, 16 * 1600)
+        hypotheses = transcriber.feed(np.clip(speech, -32768, 32767).astype("<i2").tobytes())
+        hypotheses += transcriber.flush()
+        assert [h.final for h in hypotheses][-1:] == [True]
+
+    def test_flush_finishes_an_open_utterance(self):
+        hypotheses = list(transcribe_stream([_silence(200) + _speech(4)], StubRecognizer(["cut off"])))
+        assert hypotheses[-1].final and hypotheses[-1].text == "cut off"
+
+    def test_async_frames(self):
+        async def frames():
+            for chunk in _chunks(AUDIO):
+                yield chunk
+
+        async def collect():
+            return [h async for h in atranscribe_stream(frames(), StubRecognizer(["one", "two"]))]
+
+        hypotheses = asyncio.run(collect())
+        assert [h.text for h in hypotheses if h.final] == ["one", "two"]
+
+
+class TestVoiceCommands:
+    """Tests for handing final transcripts to the router."""
+
+    def test_fast_path_commands_are_answered_without_the_agent(self):
+        from novaops.transcription import voice_commands
+
+        router = ModelRouter(
+            lite_model=StubModel(respond=lambda prompt, results: "lite answer"),
+            tools={"check_health": lambda service: {"service": service, "status": "healthy"}},
+        )
+        agent = Agent(model=StubModel(), callback_handler=None)
+        results = list(
+            voice_commands(
+                _chunks(AUDIO),
+                agent=agent,
+                invoke=lambda a, prompt: str(a(prompt)).strip(),
+                router=router,
+                recognizer=StubRecognizer(["health api", "list open incidents"]),
+            )
+        )
+        (first, fast), (second, lite) = results
+        assert fast.route.tier == "fast" and fast.output == {"service": "api", "status": "healthy"}
+        assert lite.route.tier == "lite" and lite.output == "lite answer"
+        assert first.end_ms < second.start_ms